@@ -41,6 +41,8 @@ class AppConfig:
     bot = None  # Replace Any with the actual type of your bot object
     is_shutdown_initiated: bool = False
     cover_kline_interval = "15m"
+    aggregated_kline_intervals: List[str] = ["5m", "15m", "1h", "4h"]  # Built from live prices, no REST
+    market_tensor_enabled: bool = True  # Screen the universe on shared symbols x candles arrays
     volatility_factor: float = 2.0
     stability_factor: float = 1.0
     KLINE_LIMIT: int = 200
@@ -61,9 +63,34 @@ class AppConfig:
     check_buy_order_wait: int = 30
     check_sell_order_wait: int = 30
     price_updater_interval: int = 1
+    price_ingestion_mode: str = "stream"  # "stream" (WebSocket push) or "rest" (polling)
+    price_stream_url: str = "wss://stream.binance.com:9443/stream"
+    price_stream_book_ticker: bool = False  # Also subscribe <symbol>@bookTicker (mid price)
+    price_stream_timeout: int = 10  # Seconds without a message before the stream is considered dead
+    price_stream_max_reconnect_delay: int = 60
+    http_pool_limit: int = 100  # Total pooled connections shared by all market-data fetches
+    http_pool_limit_per_host: int = 20
+    http_keepalive_timeout: int = 30
+    http_timeout: int = 10
+    binance_weight_limit: int = 6000  # Request weight per minute (X-MBX-USED-WEIGHT-1M)
+    binance_weight_headroom: float = 0.1  # Fraction of the weight limit never spent
+    # Share of the usable weight budget each request lane may spend (see request_scheduler.Lane)
+    request_lane_shares: Dict[str, float] = {"ORDER_ACTION": 1.0, "ORDER_STATUS": 0.9, "PRICES": 0.75, "KLINES": 0.6}
+    request_scheduler_poll: float = 0.05  # Seconds between checks while a higher lane is waiting
+    kline_fetch_concurrency: int = 10  # Kline requests in flight at once
+    kline_fetch_retries: int = 3
+    kline_fetch_backoff: float = 1.0  # Seconds before the first retry, doubled on each attempt
+    kline_store_enabled: bool = True  # Keep closed candles on disk for warm restarts
+    kline_store_dir: str = "kline_store"
+    kline_store_flush_interval: int = 60
+    kline_archive_dir: str = "kline_archive"  # Monthly compressed history written by kline_backfill.py
     check_and_create_orders_interval: int = 60
     monitor_orders_interval: int = 5
     updating_klines_interval: int = 30 * 60 if trading_strategy != TradingStrategy.FLASH else 60 * 60
+    kline_refresh_scheduler_enabled: bool = True  # Per-symbol refresh periods instead of the all/working cycle
+    kline_refresh_periods: Dict[str, int] = {"ACTIVE": 5, "WORKING": 10, "RANKED": 60, "DORMANT": 30 * 60}
+    kline_refresh_ranked_count: int = 50  # Symbols by last_volume refreshed on the RANKED period
+    kline_refresh_tier_interval: int = 30  # Seconds between tier recomputations
     stop_loss_pct: float = 1.0
     binance_cost_pct: float = 0.1
     blacklist: List[str] = ['OMUSDT']
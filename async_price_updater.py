@@ -1,155 +1,228 @@
 import asyncio
-from datetime import datetime, timedelta
+import json
+from datetime import datetime
 
+import aiohttp
 import numpy as np
-import requests
+import websockets
 from app_config import AppConfig
 from loguru import logger
 
-from utils import find_outliers_zscore
+from candle_aggregator import CandleAggregator
+from http_client import BASE_URL, HttpClient
+from price_table import PriceTable
+from request_scheduler import Lane
+from utils import outlier_mask_zscore
 
 
 class AsyncPriceUpdater:
-    def __init__(self, cryptos, interval=AppConfig.price_updater_interval):
+    def __init__(
+        self,
+        cryptos,
+        interval=AppConfig.price_updater_interval,
+        transport=None,
+        price_table=None,
+        candle_aggregator=None,
+    ):
         """
         :param cryptos: A dictionary of Crypto instances (keyed by symbol).
         :param interval: Update interval in seconds.
+        :param transport: Callable taking a URL and returning an async context manager
+                          that yields a connection with an awaitable ``recv()``.
+                          Defaults to ``websockets.connect``.
+        :param price_table: PriceTable the cryptos are bound to; built from `cryptos` if omitted.
+        :param candle_aggregator: CandleAggregator rolling the live klines of every timeframe.
         """
         self.cryptos = cryptos
+        self.price_table = price_table or PriceTable.for_cryptos(cryptos)
+        self.candle_aggregator = candle_aggregator or CandleAggregator()
+        self._last_roll_minute = -1
+        self._last_volatility_check = None  # Loop time of the last check_unusual_volatility
         self.interval = interval
-        self.api_url = "https://api.binance.com/api/v3/ticker/price"
+        self.api_url = f"{BASE_URL}/api/v3/ticker/price"
+        self.transport = transport or websockets.connect
+        self.stream_connected = False
+        self.reconnect_delay = 1
         self.stop_event = asyncio.Event()
 
     async def fetch_latest_prices(self):
-        """Fetch the latest prices from Binance API."""
+        """Fetch the latest prices from Binance API as the raw [{"symbol", "price"}] payload."""
         try:
-            response = requests.get(self.api_url)
-            response.raise_for_status()
-            data = response.json()
+            data = await HttpClient.get_json(self.api_url, weight=4, lane=Lane.PRICES, shed=True)
+            if data is None:
+                return []  # Shed under rate-limit pressure; the next poll catches up
             logger.debug(f"Fetched latest prices for {len(data)} symbols.")
-            return {item["symbol"]: float(item["price"]) for item in data}
-        except requests.RequestException as e:
+            return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching latest prices: {e}")
-            return {}
+            return []
 
     async def update_prices(self):
         """
-        Continuously fetch and update the prices of all cryptos.
+        Continuously update the prices of all cryptos, from the WebSocket stream
+        when enabled, falling back to REST polling while the stream is down.
         """
         logger.debug("Starting update_prices loop.")
+        while not AppConfig.is_shutdown_initiated:
+            if AppConfig.price_ingestion_mode == "stream":
+                await self.stream_prices()
+                if AppConfig.is_shutdown_initiated:
+                    break
+                logger.warning(
+                    f"Price stream down, polling REST for {self.reconnect_delay}s before reconnecting."
+                )
+                await self.poll_prices(duration=self.reconnect_delay)
+                self.reconnect_delay = min(
+                    self.reconnect_delay * 2, AppConfig.price_stream_max_reconnect_delay
+                )
+            else:
+                await self.poll_prices()
+        logger.info("Exiting update_prices loop.")
+
+    async def poll_prices(self, duration=None):
+        """
+        Poll the REST ticker every `interval` seconds, for `duration` seconds
+        or until shutdown (or a switch to stream mode) when no duration is given.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration if duration is not None else None
         while not AppConfig.is_shutdown_initiated:
             try:
                 latest_prices = await self.fetch_latest_prices()
-
-                for symbol, price in latest_prices.items():
-                    if symbol in AppConfig.bot.products.cryptos:
-                        crypto = AppConfig.bot.products.cryptos[symbol]
-
-                        # Update the klines with the current price
-                        self.update_klines_with_price_and_time(symbol, price)
-
-                        crypto.current_price = price
-                        logger.debug(f"Updated price for {symbol}: {price}")
-                        
-                await self.check_unusual_volatility()
-
+                if latest_prices:
+                    await self.apply_changed_slots(self.price_table.apply_ticker(latest_prices))
             except Exception as e:
                 logger.error(f"Error in update_prices: {e}")
             await asyncio.sleep(self.interval)
-        logger.info("Exiting update_prices loop.")
+            if deadline is not None and loop.time() >= deadline:
+                break
+            if deadline is None and AppConfig.price_ingestion_mode == "stream":
+                break
+
+    async def stream_prices(self):
+        """
+        Consume the combined mini-ticker (and optionally bookTicker) stream,
+        applying every message as it arrives. Returns when the stream drops.
+        """
+        url = self.build_stream_url()
+        try:
+            async with self.transport(url) as connection:
+                self.stream_connected = True
+                self.reconnect_delay = 1
+                logger.info("Connected to price stream.")
+                while not AppConfig.is_shutdown_initiated:
+                    message = await asyncio.wait_for(
+                        connection.recv(), timeout=AppConfig.price_stream_timeout
+                    )
+                    latest_prices = self.parse_stream_message(message)
+                    if latest_prices:
+                        await self.apply_changed_slots(
+                            self.price_table.apply_mapping(latest_prices)
+                        )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"No price stream message for {AppConfig.price_stream_timeout}s, reconnecting."
+            )
+        except Exception as e:
+            logger.error(f"Price stream dropped: {e}")
+        finally:
+            self.stream_connected = False
+
+    def build_stream_url(self):
+        """Build the combined stream URL for the tracked symbols."""
+        streams = ["!miniTicker@arr"]
+        if AppConfig.price_stream_book_ticker:
+            # Binance caps a single connection at 1024 streams.
+            streams += [f"{symbol.lower()}@bookTicker" for symbol in self.cryptos][:1023]
+        return f"{AppConfig.price_stream_url}?streams={'/'.join(streams)}"
+
+    @staticmethod
+    def parse_stream_message(message):
+        """
+        Extract {symbol: price} from a combined stream message. Mini-ticker
+        events carry the last price, bookTicker events the bid/ask mid price.
+        """
+        payload = json.loads(message)
+        data = payload.get("data", payload)
+        events = data if isinstance(data, list) else [data]
+        prices = {}
+        for event in events:
+            if "c" in event:
+                prices[event["s"]] = float(event["c"])
+            elif "b" in event and "a" in event:
+                prices[event["s"]] = (float(event["b"]) + float(event["a"])) / 2
+        return prices
+
+    async def apply_changed_slots(self, changed_slots):
+        """
+        Fan a price table update out to the klines. Only symbols whose price moved
+        are touched, except on the first tick of each minute when every tracked
+        symbol is visited so quiet markets still roll their candles.
+
+        The universe-wide volatility check runs on that minute roll-over and
+        otherwise at most once per `interval` seconds, not per stream message.
+        """
+        minute = int(datetime.now().timestamp() // 60)
+        rolled_over = minute != self._last_roll_minute
+        if rolled_over:
+            self._last_roll_minute = minute
+            changed_slots = range(len(self.price_table.symbols))
+        else:
+            changed_slots = changed_slots.tolist()
+
+        symbols = self.price_table.symbols
+        last_price = self.price_table.last_price
+        for slot in changed_slots:
+            symbol = symbols[slot]
+            crypto = self.cryptos.get(symbol)
+            if crypto is not None:
+                self.update_klines_with_current_price(crypto, float(last_price[slot]))
+
+        now = asyncio.get_running_loop().time()
+        if (
+            rolled_over
+            or self._last_volatility_check is None
+            or now - self._last_volatility_check >= self.interval
+        ):
+            self._last_volatility_check = now
+            await self.check_unusual_volatility()
 
     async def check_unusual_volatility(self):
         """
         Check for unusual volatility across all cryptos and update the
-        is_unusual_volatility flag.
+        is_unusual_volatility flag, from the volatility factors the metrics
+        pipeline stored on each tick.
         """
         try:
-            volatility_1m_array = np.array(
-                [
-                    crypto.volatility_factor_1m
-                    for crypto in AppConfig.bot.products.cryptos.values()
-                ]
+            cryptos = list(AppConfig.bot.products.cryptos.values())
+            metrics = [crypto.metrics for crypto in cryptos]
+            volatility_1m_array = np.fromiter(
+                (m.volatility_factor_1m for m in metrics), dtype=np.float64, count=len(cryptos)
             )
-            volatility_cover_array = np.array(
-                [
-                    crypto.volatility_factor_cover
-                    for crypto in AppConfig.bot.products.cryptos.values()
-                ]
+            volatility_cover_array = np.fromiter(
+                (m.volatility_factor_cover for m in metrics), dtype=np.float64, count=len(cryptos)
             )
 
-            unusual_volatility_1m = find_outliers_zscore(
-                volatility_1m_array
-            )  # Or find_outliers_iqr
-            unusual_volatility_cover = find_outliers_zscore(
+            unusual_volatility = outlier_mask_zscore(volatility_1m_array) | outlier_mask_zscore(
                 volatility_cover_array
-            )  # Or find_outliers_iqr
+            )
 
-            for crypto in AppConfig.bot.products.cryptos.values():
-                if (
-                    np.any(unusual_volatility_1m == crypto.volatility_factor_1m)  # Use np.any()
-                    or np.any(unusual_volatility_cover == crypto.volatility_factor_cover) # Use np.any()
-                ):
-                    crypto.is_unusual_volatility = True
-                else:
-                    crypto.is_unusual_volatility = False
+            for crypto, is_unusual in zip(cryptos, unusual_volatility.tolist()):
+                crypto.is_unusual_volatility = is_unusual
 
         except Exception as e:
             logger.error(f"Error checking unusual volatility: {e}")
 
     def update_klines_with_current_price(self, crypto, current_price):
         """
-        Update the latest kline for the given crypto with the current price.
-        Create a new kline if the current time is more than the kline interval.
-        Use the last kline's time plus the interval for the new kline's open time.
+        Update the open candle of every live timeframe with the current price,
+        rolling each series over on its own interval boundary, then the
+        crypto's stored metrics.
         """
         try:
-            now = datetime.now()
-            current_time = int(now.timestamp() * 1000)
-
-            # Update cover kline
-            if crypto.klines_cover:
-                latest_kline_cover = crypto.klines_cover[-1]
-                if now - datetime.fromtimestamp(latest_kline_cover[0] / 1000) >= timedelta(
-                    hours=1
-                ):
-                    # Create a new cover kline with open time = last kline's open time + 1 hour
-                    new_kline_time = (
-                        latest_kline_cover[0] + timedelta(hours=1).total_seconds() * 1000
-                    )
-                    new_kline = self.create_new_kline(latest_kline_cover, current_price)
-                    new_kline[0] = int(new_kline_time)  # Set the open time
-                    crypto.klines_cover.append(new_kline)
-                    crypto.klines_cover = crypto.klines_cover[
-                        -AppConfig.KLINE_LIMIT :
-                    ]  # Trim the list
-                    latest_kline_cover = crypto.klines_cover[-1]  # Update the reference
-                latest_kline_cover[2] = max(latest_kline_cover[2], current_price)
-                latest_kline_cover[3] = min(latest_kline_cover[3], current_price)
-                latest_kline_cover[4] = current_price
-                latest_kline_cover[6] = current_time
-
-            # Update 1m kline
-            if crypto.klines_1m:
-                latest_kline_1m = crypto.klines_1m[-1]
-                if now - datetime.fromtimestamp(latest_kline_1m[0] / 1000) >= timedelta(
-                    minutes=1
-                ):
-                    # Create a new 1m kline with open time = last kline's open time + 1 minute
-                    new_kline_time = (
-                        latest_kline_1m[0] + timedelta(minutes=1).total_seconds() * 1000
-                    )
-                    new_kline = self.create_new_kline(latest_kline_1m, current_price)
-                    new_kline[0] = int(new_kline_time)  # Set the open time
-                    crypto.klines_1m.append(new_kline)
-                    crypto.klines_1m = crypto.klines_1m[
-                        -AppConfig.KLINE_LIMIT :
-                    ]  # Trim the list
-                    latest_kline_1m = crypto.klines_1m[-1]  # Update the reference
-                latest_kline_1m[2] = max(latest_kline_1m[2], current_price)
-                latest_kline_1m[3] = min(latest_kline_1m[3], current_price)
-                latest_kline_1m[4] = current_price
-                latest_kline_1m[6] = current_time
-
+            current_time = int(datetime.now().timestamp() * 1000)
+            self.candle_aggregator.update(crypto, current_price, current_time)
+            crypto.refresh_metrics()
         except Exception as e:
             logger.error(f"Error updating klines for {crypto.symbol}: {e}")
 
@@ -164,26 +237,6 @@ class AsyncPriceUpdater:
         except Exception as e:
             logger.error(f"Error updating klines for {symbol}: {e}")
 
-    def create_new_kline(self, last_kline, current_price):
-        """Create a new kline based on the last kline and current price."""
-        new_kline = list(last_kline)
-        new_kline[0] = int(
-            datetime.now().timestamp() * 1000
-        )  # Set the open time to the current time
-        new_kline[1] = new_kline[4]
-        new_kline[2] = current_price
-        new_kline[3] = current_price
-        new_kline[4] = current_price
-        new_kline[5] = 0
-        new_kline[6] = int(
-            datetime.now().timestamp() * 1000
-        )  # Set the close time to the current time
-        new_kline[7] = 0
-        new_kline[8] = 0
-        new_kline[9] = 0
-        new_kline[10] = 0
-        return new_kline
-
     async def start(self):
         """Start the price updater asynchronously."""
         logger.info("AsyncPriceUpdater started.")
@@ -42,6 +42,8 @@ class Bot:
 
         self.products = Products()
         asyncio.create_task(self.products.update_cryptos_klines())
+        if self.products.kline_store:
+            asyncio.create_task(self.products.kline_store.run())
 
         self.order_authorization = OrderAuthorization(
             crypto_data=self.products.cryptos, volatility_threshold=0.5
@@ -54,7 +56,11 @@ class Bot:
             products=self.products
         )
 
-        self.price_updater = AsyncPriceUpdater(self.products.cryptos)
+        self.price_updater = AsyncPriceUpdater(
+            self.products.cryptos,
+            price_table=self.products.price_table,
+            candle_aggregator=self.products.candle_aggregator,
+        )
 
         logger.info("Bot initialization complete.")
 
@@ -0,0 +1,159 @@
+import re
+
+import numpy as np
+from app_config import AppConfig
+from loguru import logger
+
+from kline_buffer import KLINE_DTYPE, KlineBuffer
+
+INTERVAL_UNITS_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+WEEK_ORIGIN_MS = 4 * 86_400_000  # Weekly candles open on Monday; the epoch was a Thursday
+
+
+def interval_to_ms(interval):
+    """Convert a Binance interval string such as '15m' or '4h' to milliseconds."""
+    match = re.fullmatch(r"(\d+)([mhdw])", interval)
+    if not match:
+        raise ValueError(f"Unsupported kline interval: {interval}")
+    return int(match.group(1)) * INTERVAL_UNITS_MS[match.group(2)]
+
+
+def bucket_start(timestamp, interval_ms):
+    """
+    Open time of the `interval_ms` candle containing `timestamp` (ms, a scalar
+    or an array). Candles are aligned on the epoch, except weekly ones, which
+    Binance opens on Monday 00:00 UTC.
+    """
+    origin = WEEK_ORIGIN_MS if interval_ms % INTERVAL_UNITS_MS["w"] == 0 else 0
+    return timestamp - (timestamp - origin) % interval_ms
+
+
+def aggregate_klines(klines, interval):
+    """
+    Combine lower-timeframe klines (a KlineBuffer or structured array) into
+    `interval` candles aligned on the interval boundary: open = first open,
+    high/low = extremes, close = last close, volumes and trade counts summed.
+
+    Returns:
+        np.ndarray: Structured array with the KLINE_DTYPE layout.
+    """
+    rows = klines.view() if isinstance(klines, KlineBuffer) else klines
+    if len(rows) == 0:
+        return np.zeros(0, dtype=KLINE_DTYPE)
+
+    interval_ms = interval_to_ms(interval)
+    buckets = bucket_start(rows["open_time"], interval_ms)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(rows)] - 1
+
+    candles = np.zeros(len(starts), dtype=KLINE_DTYPE)
+    candles["open_time"] = buckets[starts]
+    candles["open"] = rows["open"][starts]
+    candles["high"] = np.maximum.reduceat(rows["high"], starts)
+    candles["low"] = np.minimum.reduceat(rows["low"], starts)
+    candles["close"] = rows["close"][ends]
+    candles["close_time"] = candles["open_time"] + interval_ms - 1
+    for name in ("volume", "quote_volume", "trades", "taker_base_volume", "taker_quote_volume"):
+        candles[name] = np.add.reduceat(rows[name], starts)
+    return candles
+
+
+class CandleAggregator:
+    """
+    Maintains every tracked timeframe of a crypto from the live price stream.
+
+    Each series rolls over on its own interval boundary, so higher timeframes
+    (5m, 15m, 1h, 4h, ...) are built in memory without extra REST requests.
+    Listeners registered with `on_close` receive (crypto, interval, kline)
+    for every candle that closes, where kline is a copied KLINE_DTYPE record.
+    """
+
+    def __init__(self, intervals=None, limit=None):
+        self.intervals = intervals or AppConfig.aggregated_kline_intervals
+        self.limit = limit or AppConfig.KLINE_LIMIT  # Capacity of derived series
+        self.listeners = []
+
+    def on_close(self, callback):
+        """Register `callback(crypto, interval, kline)` for closed-candle events."""
+        self.listeners.append(callback)
+
+    def tracked_intervals(self):
+        """All live intervals: 1m, the cover interval and the derived timeframes."""
+        intervals = ["1m", AppConfig.cover_kline_interval]
+        return intervals + [i for i in self.intervals if i not in intervals]
+
+    def seed(self, crypto):
+        """
+        (Re)build the derived timeframes of `crypto` from its 1m history. The
+        first bucket is dropped when the 1m history only covers part of it,
+        since its open, high and low are unknown. Existing candles older than
+        the rebuilt ones are kept, including a full one for that bucket.
+        """
+        for interval in self.intervals:
+            if interval in ("1m", AppConfig.cover_kline_interval):
+                continue
+            candles = aggregate_klines(crypto.klines_1m, interval)
+            first_bucket = int(candles[0]["open_time"]) if len(candles) else None
+            if first_bucket is not None and int(crypto.klines_1m[0][0]) != first_bucket:
+                candles = candles[1:]  # Partial first bucket
+            existing = crypto.klines_for(interval)
+            if existing is None:
+                existing = KlineBuffer(self.limit)
+                crypto.set_derived_klines(interval, existing)
+            elif first_bucket is not None and len(existing) and first_bucket <= existing[-1][0]:
+                if not len(candles):
+                    continue
+                older = existing.view()
+                older = older[older["open_time"] < candles[0]["open_time"]]
+                candles = np.concatenate([older, candles])
+            existing.replace(candles)
+
+    def update(self, crypto, price, timestamp):
+        """Apply a price observed at `timestamp` (ms) to every live series of `crypto`."""
+        for interval in self.tracked_intervals():
+            klines = crypto.klines_for(interval)
+            if klines is None:
+                continue
+            try:
+                self._update_series(crypto, interval, klines, price, timestamp)
+            except Exception as e:
+                logger.error(f"Error updating {interval} klines for {crypto.symbol}: {e}")
+
+    def _update_series(self, crypto, interval, klines, price, timestamp):
+        interval_ms = interval_to_ms(interval)
+        timestamp = int(timestamp)
+        bucket = bucket_start(timestamp, interval_ms)
+
+        if not len(klines):
+            if interval in ("1m", AppConfig.cover_kline_interval):
+                return  # REST-backed series wait for their history
+            klines.append(self._new_kline(bucket, interval_ms, price))
+            return
+
+        last_open_time = int(klines[-1][0])
+        if bucket < last_open_time:
+            return  # Stale tick
+
+        if bucket > last_open_time:
+            last_close = float(klines[-1][4])
+            self._emit(crypto, interval, klines.record(-1))
+            # Fill buckets without ticks with flat candles so series stay aligned.
+            gap_start = max(last_open_time + interval_ms, bucket - interval_ms * (klines.capacity - 1))
+            for gap_time in range(gap_start, bucket, interval_ms):
+                klines.append(self._new_kline(gap_time, interval_ms, last_close))
+                self._emit(crypto, interval, klines.record(-1))
+            klines.append(self._new_kline(bucket, interval_ms, price))
+            return
+
+        klines.update_last(price)
+
+    @staticmethod
+    def _new_kline(open_time, interval_ms, price):
+        return (open_time, price, price, price, price, 0, open_time + interval_ms - 1, 0, 0, 0, 0)
+
+    def _emit(self, crypto, interval, kline):
+        for callback in self.listeners:
+            try:
+                callback(crypto, interval, kline)
+            except Exception as e:
+                logger.error(f"Error in closed-candle listener for {crypto.symbol} {interval}: {e}")
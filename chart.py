@@ -1,16 +1,18 @@
-import requests
+import asyncio
+
+import aiohttp
 import pandas as pd
 import plotly.graph_objects as go
 
-def fetch_kline_data(symbol, interval, limit=500):
+from http_client import BASE_URL, HttpClient
+
+async def fetch_kline_data(symbol, interval, limit=500):
     """Fetches kline data from the Binance API."""
-    url = "https://api.binance.com/api/v3/klines"
+    url = f"{BASE_URL}/api/v3/klines"
     params = {"symbol": symbol, "interval": interval, "limit": limit}
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()  # Raise an exception for bad status codes
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return await HttpClient.get_json(url, params=params)  # Raises on bad status codes
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"Error fetching kline data: {e}")
         return None
 
@@ -43,7 +45,7 @@ def create_candlestick_chart(df):
 if __name__ == "__main__":
     symbol = "BTCUSDT"
     interval = AppConfig.cover_kline
-    kline_data = fetch_kline_data(symbol, interval)
+    kline_data = asyncio.run(fetch_kline_data(symbol, interval))
 
     if kline_data is not None:
         df = pd.DataFrame(kline_data, columns=[
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from app_config import AppConfig
+from candle_aggregator import interval_to_ms
+from kline_buffer import KlineBuffer
+from models.crypto import Crypto
+
+
+class KlineSeries:
+    """
+    Random kline series for the tests: a random walk of small candles with
+    bursts of green solid ones, so zones and swings actually occur.
+    """
+
+    def __init__(self, seed=0, interval_ms=60_000):
+        self.rng = np.random.default_rng(seed)
+        self.interval_ms = interval_ms
+
+    def candle(self, open_time, open_price):
+        rng = self.rng
+        close = round(open_price * (1 + rng.choice([rng.normal(0, 0.005), rng.uniform(0.01, 0.03)])), 4)
+        body_high, body_low = max(open_price, close), min(open_price, close)
+        high = body_high + abs(close - open_price) * rng.uniform(0, 0.3)
+        low = body_low - abs(close - open_price) * rng.uniform(0, 0.3)
+        return [open_time, open_price, high, low, close, 1.0, open_time + self.interval_ms - 1, 1.0, 1, 1.0, 1.0]
+
+    def rows(self, candles, price=100.0):
+        rows = []
+        for i in range(candles):
+            rows.append(self.candle(i * self.interval_ms, price))
+            price = rows[-1][4]
+        return rows
+
+    def buffer(self, candles, capacity=None):
+        return KlineBuffer.from_rows(self.rows(candles), capacity)
+
+    def tick(self, klines, sigma=0.002):
+        """Apply a random trade price to the open candle."""
+        klines.update_last(round(float(klines[-1][4]) * (1 + self.rng.normal(0, sigma)), 4))
+
+    def close(self, klines):
+        """Close the open candle by appending the next one."""
+        last = klines.record(-1)
+        klines.append(self.candle(int(last["open_time"]) + self.interval_ms, float(last["close"])))
+
+
+@pytest.fixture
+def kline_series():
+    """Factory of KlineSeries: kline_series(seed, interval_ms)."""
+    return KlineSeries
+
+
+@pytest.fixture
+def make_crypto(kline_series):
+    """Factory of Crypto(symbol) with random 1m and cover klines of a full window."""
+
+    def make(symbol, seed=0, current_price=0.0):
+        series_1m = kline_series(seed)
+        series_cover = kline_series(seed + 1, interval_ms=interval_to_ms(AppConfig.cover_kline_interval))
+        return Crypto(
+            current_price=current_price,
+            symbol=symbol,
+            base_asset=symbol.removesuffix("USDT"),
+            quote_asset="USDT",
+            price_precision=4,
+            klines_1m=series_1m.buffer(AppConfig.KLINE_LIMIT),
+            klines_cover=series_cover.buffer(AppConfig.KLINE_LIMIT),
+        )
+
+    return make
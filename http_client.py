@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import aiohttp
+from app_config import AppConfig
+from loguru import logger
+
+from request_scheduler import Lane, RequestScheduler
+
+BASE_URL = "https://api.binance.com"
+
+
+class HttpClient:
+    """
+    Shared non-blocking HTTP layer for market-data requests.
+
+    One aiohttp session (and connection pool) is kept per event loop, so
+    every fetch reuses keep-alive connections instead of opening a new one.
+    """
+
+    _session = None
+    _loop = None
+
+    @classmethod
+    async def get_session(cls):
+        """Return the shared session, creating it on first use in the running loop."""
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=AppConfig.http_pool_limit,
+                limit_per_host=AppConfig.http_pool_limit_per_host,
+                keepalive_timeout=AppConfig.http_keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            cls._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=AppConfig.http_timeout),
+                headers={"Accept-Encoding": "gzip, deflate"},
+                auto_decompress=True,
+            )
+            cls._loop = loop
+        return cls._session
+
+    @classmethod
+    async def get_json(cls, url, params=None, weight=1, lane=Lane.KLINES, shed=False):
+        """
+        GET a URL and decode the JSON body. `weight` is the endpoint's Binance
+        request weight, spent from the RequestScheduler budget of `lane`.
+        Returns None when `shed` is set and the lane has no budget left.
+
+        Raises:
+            aiohttp.ClientError: On connection errors or non-2xx responses.
+            asyncio.TimeoutError: When the request exceeds AppConfig.http_timeout.
+        """
+        return await cls._get(url, params, weight, lane, shed, lambda response: response.json())
+
+    @classmethod
+    async def get_bytes(cls, url, params=None, weight=1, lane=Lane.KLINES, shed=False):
+        """Like get_json, but returns the undecoded (decompressed) response body."""
+        return await cls._get(url, params, weight, lane, shed, lambda response: response.read())
+
+    @classmethod
+    async def _get(cls, url, params, weight, lane, shed, read):
+        if not await RequestScheduler.acquire(lane, weight, shed=shed):
+            return None
+        session = await cls.get_session()
+        async with session.get(url, params=params) as response:
+            RequestScheduler.weight.record(response.headers, response.status)
+            response.raise_for_status()
+            return await read(response)
+
+    @classmethod
+    async def close(cls):
+        """Close the shared session and its pooled connections."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+            logger.debug("HTTP client session closed.")
+        cls._session = None
+        cls._loop = None
+
+
+async def measure_loop_stall(coroutine, tick=0.005):
+    """
+    Run `coroutine` while a heartbeat task measures how long the event loop
+    is blocked. Returns (total_stall_seconds, max_stall_seconds).
+    """
+    stalls = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            stalls.append(max(0.0, time.perf_counter() - start - tick))
+
+    monitor = asyncio.create_task(heartbeat())
+    try:
+        await coroutine
+    finally:
+        done.set()
+        await monitor
+    return sum(stalls), max(stalls, default=0.0)
+
+
+if __name__ == "__main__":
+    import requests
+
+    url = f"{BASE_URL}/api/v3/ticker/price"
+    rounds = 10
+
+    async def blocking_fetches():
+        for _ in range(rounds):
+            requests.get(url).json()
+            await asyncio.sleep(0)
+
+    async def pooled_fetches():
+        for _ in range(rounds):
+            await HttpClient.get_json(url)
+
+    async def benchmark():
+        for name, run in (("requests.get", blocking_fetches), ("HttpClient", pooled_fetches)):
+            start = time.perf_counter()
+            total, worst = await measure_loop_stall(run())
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:>12}: {rounds} fetches in {elapsed:.2f}s, "
+                f"loop stalled {total * 1000:.0f} ms total, worst {worst * 1000:.0f} ms"
+            )
+        await HttpClient.close()
+
+    asyncio.run(benchmark())
@@ -0,0 +1,172 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit  # Optional JIT for the EMA recursion
+except ImportError:
+    njit = None
+
+
+def _ema_rows(values, alpha, min_periods, out):
+    """Row-by-row EMA recursion; compiled with numba when it is installed."""
+    for row in range(values.shape[0]):
+        state = np.nan
+        count = 0
+        for column in range(values.shape[1]):
+            value = values[row, column]
+            if value == value:  # Not NaN
+                state = value if count == 0 else state + alpha * (value - state)
+                count += 1
+            out[row, column] = state if count >= min_periods else np.nan
+
+
+_ema_rows_jit = njit(cache=True)(_ema_rows) if njit is not None else None
+
+
+class IndicatorKernels:
+    """
+    Indicators over a 2-D (symbols, candles) array in one call, without pandas.
+
+    Results have the input's shape and follow the `ta` conventions used by
+    TechnicalAnalysis: NaN until a window is complete, EMAs with the
+    ewm(adjust=False) recursion. Leading NaN (candles a symbol does not have
+    yet) are skipped, so every row matches `ta` run on its own candles.
+    NaN inside a row hold the previous EMA value.
+    """
+
+    @staticmethod
+    def sma(values, period):
+        """Simple moving average along the candle axis."""
+        values = np.asarray(values, dtype=np.float64)
+        out = np.full(values.shape, np.nan)
+        if values.shape[1] >= period:
+            out[:, period - 1 :] = sliding_window_view(values, period, axis=1).mean(axis=-1)
+        return out
+
+    @staticmethod
+    def ema(values, period=None, alpha=None, min_periods=None):
+        """
+        Exponential moving average along the candle axis, with
+        alpha = 2 / (period + 1) unless `alpha` is given.
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        alpha = alpha if alpha is not None else 2 / (period + 1)
+        min_periods = min_periods if min_periods is not None else period
+        out = np.empty(values.shape)
+        if _ema_rows_jit is not None:
+            _ema_rows_jit(values, alpha, min_periods, out)
+            return out
+
+        # Same recursion, vectorized across symbols one candle at a time.
+        state = np.full(values.shape[0], np.nan)
+        count = np.zeros(values.shape[0], dtype=np.int64)
+        for column in range(values.shape[1]):
+            value = values[:, column]
+            valid = ~np.isnan(value)
+            state = np.where(
+                valid, np.where(count == 0, value, state + alpha * (value - state)), state
+            )
+            count += valid
+            out[:, column] = np.where(count >= min_periods, state, np.nan)
+        return out
+
+    @staticmethod
+    def rsi(closes, period=14):
+        """Wilder RSI; the first close of each row counts as a zero change, as in ta."""
+        closes = np.asarray(closes, dtype=np.float64)
+        change = np.diff(closes, axis=1, prepend=np.nan)
+        missing = np.isnan(closes)
+        gains = np.where(missing, np.nan, np.where(change > 0, change, 0.0))
+        losses = np.where(missing, np.nan, np.where(change < 0, -change, 0.0))
+        average_gain = IndicatorKernels.ema(gains, alpha=1 / period, min_periods=period)
+        average_loss = IndicatorKernels.ema(losses, alpha=1 / period, min_periods=period)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                average_loss == 0, 100.0, 100 - 100 / (1 + average_gain / average_loss)
+            )
+
+    @staticmethod
+    def macd(closes, short_window=12, long_window=26, signal_window=9):
+        """
+        Returns:
+            dict: "macd", "signal" and "histogram" arrays.
+        """
+        macd = IndicatorKernels.ema(closes, short_window) - IndicatorKernels.ema(
+            closes, long_window
+        )
+        signal = IndicatorKernels.ema(macd, signal_window)
+        return {"macd": macd, "signal": signal, "histogram": macd - signal}
+
+    @staticmethod
+    def swing_points(highs, lows, shift=1):
+        """
+        Boolean masks of swing highs and swing lows: candles whose high (low)
+        is above (below) both neighbours `shift` candles away. Edges without
+        neighbours are never swings.
+        """
+        swing_highs = np.zeros(highs.shape, dtype=bool)
+        swing_lows = np.zeros(lows.shape, dtype=bool)
+        center = slice(shift, -shift)
+        swing_highs[:, center] = (highs[:, center] > highs[:, : -2 * shift]) & (
+            highs[:, center] > highs[:, 2 * shift :]
+        )
+        swing_lows[:, center] = (lows[:, center] < lows[:, : -2 * shift]) & (
+            lows[:, center] < lows[:, 2 * shift :]
+        )
+        return swing_highs, swing_lows
+
+    @staticmethod
+    def range_volatility(highs, lows):
+        """
+        (max high - min low) / min low in percent per row (the
+        volatility_factor_* formula), 0 for rows without candles.
+        """
+        # fmax/fmin skip NaN without the all-NaN warnings of nanmax/nanmin.
+        high = np.fmax.reduce(highs, axis=1)
+        low = np.fmin.reduce(lows, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(low > 0, (high - low) / low * 100, 0.0)
+
+
+if __name__ == "__main__":
+    import time
+
+    import pandas as pd
+    import ta
+
+    symbols, candles = 400, 200
+    rng = np.random.default_rng(0)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (symbols, candles)), axis=1))
+    closes[:5, :50] = np.nan  # Recently listed symbols
+
+    def with_ta():
+        results = []
+        for row in closes:
+            series = pd.Series(row[~np.isnan(row)])
+            macd = ta.trend.MACD(series)
+            results.append((
+                ta.trend.SMAIndicator(series, window=5).sma_indicator().iloc[-1],
+                ta.trend.SMAIndicator(series, window=20).sma_indicator().iloc[-1],
+                ta.momentum.RSIIndicator(series, window=14).rsi().iloc[-1],
+                macd.macd().iloc[-1],
+                macd.macd_signal().iloc[-1],
+            ))
+        return np.array(results)
+
+    def with_kernels():
+        macd = IndicatorKernels.macd(closes)
+        return np.column_stack([
+            IndicatorKernels.sma(closes, 5)[:, -1],
+            IndicatorKernels.sma(closes, 20)[:, -1],
+            IndicatorKernels.rsi(closes)[:, -1],
+            macd["macd"][:, -1],
+            macd["signal"][:, -1],
+        ])
+
+    with_kernels()  # Compile the JIT path before timing
+    for name, compute in (("ta per symbol", with_ta), ("kernels", with_kernels)):
+        start = time.perf_counter()
+        result = compute()
+        print(f"{name:>14}: {(time.perf_counter() - start) * 1000:.1f} ms for {symbols}x{candles}")
+    assert np.allclose(with_ta(), with_kernels(), rtol=1e-9, atol=1e-9)
+    print(f"results match (numba JIT: {'on' if njit else 'off'})")
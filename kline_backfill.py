@@ -0,0 +1,231 @@
+import asyncio
+import json
+import os
+import time
+
+import numpy as np
+from app_config import AppConfig
+from loguru import logger
+
+from candle_aggregator import bucket_start, interval_to_ms
+from kline_buffer import KLINE_DTYPE, KLINE_FIELDS
+from kline_fetcher import KlineFetcher
+
+PAGE_LIMIT = 1000  # Largest /api/v3/klines page
+FLUSH_PAGES = 10  # Pages buffered in memory before they are written out
+
+
+class KlineArchive:
+    """
+    Long-lookback kline history on disk: one compressed columnar segment
+    (np.savez_compressed, one array per KLINE_DTYPE field) per symbol,
+    interval and calendar month, under AppConfig.kline_archive_dir:
+
+        <dir>/<symbol>/<interval>/<YYYY-MM>.npz
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or AppConfig.kline_archive_dir
+
+    def path(self, symbol, interval, month):
+        return os.path.join(self.directory, symbol, interval, f"{month}.npz")
+
+    @staticmethod
+    def month_of(open_times):
+        """Calendar month ('YYYY-MM') of each open time (ms)."""
+        return np.asarray(open_times).astype("datetime64[ms]").astype("datetime64[M]").astype(str)
+
+    def months(self, symbol, interval):
+        """Stored months of `symbol`/`interval`, oldest first."""
+        directory = os.path.join(self.directory, symbol, interval)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(directory) if name.endswith(".npz"))
+
+    def read_month(self, symbol, interval, month):
+        path = self.path(symbol, interval, month)
+        if not os.path.exists(path):
+            return np.zeros(0, dtype=KLINE_DTYPE)
+        with np.load(path) as columns:
+            rows = np.empty(len(columns["open_time"]), dtype=KLINE_DTYPE)
+            for name in KLINE_FIELDS:
+                rows[name] = columns[name]
+        return rows
+
+    def write(self, symbol, interval, rows):
+        """Merge `rows` into their monthly segments; newer rows win on equal open times."""
+        if not len(rows):
+            return
+        months = self.month_of(rows["open_time"])
+        for month in np.unique(months):
+            merged = np.concatenate([self.read_month(symbol, interval, month), rows[months == month]])
+            # Keep the last occurrence of every open time, sorted by open time.
+            _, last = np.unique(merged["open_time"][::-1], return_index=True)
+            merged = merged[len(merged) - 1 - last]
+            self._save(self.path(symbol, interval, month), merged)
+
+    def load(self, symbol, interval, start_time=None, end_time=None):
+        """
+        Candles of `symbol`/`interval` opening in [start_time, end_time] (ms),
+        read only from the monthly segments overlapping the range.
+
+        Returns:
+            np.ndarray: KLINE_DTYPE records sorted by open time.
+        """
+        first = self.month_of(start_time) if start_time is not None else None
+        last = self.month_of(end_time) if end_time is not None else None
+        segments = [
+            self.read_month(symbol, interval, month)
+            for month in self.months(symbol, interval)
+            if (first is None or month >= first) and (last is None or month <= last)
+        ]
+        if not segments:
+            return np.zeros(0, dtype=KLINE_DTYPE)
+        rows = np.concatenate(segments)
+        open_times = rows["open_time"]
+        mask = np.ones(len(rows), dtype=bool)
+        if start_time is not None:
+            mask &= open_times >= start_time
+        if end_time is not None:
+            mask &= open_times <= end_time
+        return rows[mask]
+
+    @staticmethod
+    def _save(path, rows):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez_compressed(file, **{name: rows[name] for name in KLINE_FIELDS})
+        os.replace(temp_path, path)
+
+
+class KlineBackfill:
+    """
+    Paginates months of kline history into a KlineArchive.
+
+    (symbol, interval) jobs run concurrently under AppConfig.kline_fetch_concurrency
+    and every page goes through the KLINES lane of the request scheduler, so a
+    backfill never starves live trading of request weight. The next open time
+    to fetch is checkpointed per (symbol, interval) in a JSON file, together
+    with the start of the covered range, once the pages before it are written.
+    An interrupted run resumes where it stopped and a later run with a longer
+    or equal lookback only fetches what is newer than the cursor.
+    """
+
+    def __init__(self, archive=None, checkpoint_path=None):
+        self.archive = archive or KlineArchive()
+        self.checkpoint_path = checkpoint_path or os.path.join(
+            self.archive.directory, "checkpoint.json"
+        )
+        self.checkpoint = self.load_checkpoint()
+
+    def load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring unreadable backfill checkpoint {self.checkpoint_path}: {e}")
+            return {}
+
+    def save_checkpoint(self):
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self.checkpoint, file, indent=2, sort_keys=True)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def resume_from(self, key, start_time):
+        """
+        Where a job for `key` starting at `start_time` continues: the stored
+        cursor when an earlier run already covered `start_time` onwards,
+        otherwise `start_time` itself.
+        """
+        progress = self.checkpoint.get(key)
+        if progress and progress["start"] <= start_time < progress["cursor"]:
+            return progress["cursor"]
+        return start_time
+
+    async def run(self, symbols, intervals, start_time, end_time=None):
+        """
+        Backfill every symbol and interval from `start_time` to `end_time`
+        (ms, default now); each interval stops at its last closed candle.
+        """
+        end_time = end_time or int(time.time() * 1000)
+        semaphore = asyncio.Semaphore(AppConfig.kline_fetch_concurrency)
+
+        async def run_job(symbol, interval):
+            async with semaphore:
+                try:
+                    await self.backfill(symbol, interval, start_time, end_time)
+                except Exception as e:
+                    logger.error(f"Backfill of {symbol} {interval} failed: {e}")
+
+        await asyncio.gather(
+            *(run_job(symbol, interval) for symbol in symbols for interval in intervals)
+        )
+
+    async def backfill(self, symbol, interval, start_time, end_time):
+        """
+        Fetch and archive one (symbol, interval) range, resuming from its
+        checkpoint. The range ends at the last closed candle: the open one has
+        partial OHLCV, and a later run would not overwrite it once the cursor
+        moved past it.
+        """
+        key = f"{symbol}:{interval}"
+        interval_ms = interval_to_ms(interval)
+        now = int(time.time() * 1000)
+        end_time = min(end_time, bucket_start(now, interval_ms) - interval_ms)
+        cursor = self.resume_from(key, start_time)
+        covered_from = self.checkpoint[key]["start"] if cursor != start_time else start_time
+        pending = []
+
+        while cursor <= end_time:
+            rows = await KlineFetcher.fetch_symbol_historical_data(
+                symbol, interval, start_time=cursor, limit=PAGE_LIMIT, end_time=end_time
+            )
+            if rows is None:
+                break  # Failed after retries; the checkpoint keeps the position
+            if len(rows):
+                pending.append(rows)
+                cursor = int(rows["open_time"][-1]) + interval_ms
+            if len(rows) < PAGE_LIMIT:
+                cursor = end_time + 1  # Range exhausted
+            if len(pending) >= FLUSH_PAGES or cursor > end_time:
+                self.flush(symbol, interval, key, pending, covered_from, cursor)
+                pending = []
+
+        if pending:
+            self.flush(symbol, interval, key, pending, covered_from, cursor)
+        logger.info(f"Backfilled {symbol} {interval} up to {cursor}")
+
+    def flush(self, symbol, interval, key, pages, covered_from, cursor):
+        if pages:
+            self.archive.write(symbol, interval, np.concatenate(pages))
+        self.checkpoint[key] = {"start": covered_from, "cursor": cursor}
+        self.save_checkpoint()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from http_client import HttpClient
+
+    parser = argparse.ArgumentParser(description="Backfill kline history into the local archive.")
+    parser.add_argument("--symbols", nargs="+", required=True, help="e.g. BTCUSDT ETHUSDT")
+    parser.add_argument("--intervals", nargs="+", default=["1m", AppConfig.cover_kline_interval])
+    parser.add_argument("--days", type=int, default=30, help="Lookback from now, in days")
+    parser.add_argument("--directory", default=AppConfig.kline_archive_dir)
+    args = parser.parse_args()
+
+    async def main():
+        now = int(time.time() * 1000)
+        start_time = now - args.days * 86_400_000
+        backfill = KlineBackfill(KlineArchive(args.directory))
+        try:
+            await backfill.run(args.symbols, args.intervals, start_time, now)
+        finally:
+            await HttpClient.close()
+
+    asyncio.run(main())
@@ -0,0 +1,222 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from app_config import AppConfig
+
+# Column layout of a Binance kline (the trailing "ignore" field is dropped).
+KLINE_DTYPE = np.dtype(
+    [
+        ("open_time", "i8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+        ("close_time", "i8"),
+        ("quote_volume", "f8"),
+        ("trades", "i8"),
+        ("taker_base_volume", "f8"),
+        ("taker_quote_volume", "f8"),
+    ]
+)
+KLINE_FIELDS = KLINE_DTYPE.names
+
+
+class KlineBuffer:
+    """
+    Fixed-capacity kline series backed by a NumPy structured array.
+
+    Appends and open-candle updates are O(1) and happen in place. Rows are
+    written behind a slack region; when it runs out the live window is moved
+    back to the front in one block copy, so the ordered window is always
+    contiguous and `view()`/`column()` are zero-copy.
+
+    Indexing follows the list-of-lists layout it replaces: `buffer[-1][4]` is
+    the close of the latest candle and `len(buffer)` the number of candles.
+
+    Counters for change tracking:
+        version:    bumped on every mutation.
+        appended:   total candles ever appended (a monotonic sequence number).
+        generation: bumped whenever the series is replaced wholesale.
+    """
+
+    def __init__(self, capacity=None, slack=None):
+        self.capacity = capacity or AppConfig.KLINE_LIMIT
+        self.slack = slack or max(16, self.capacity // 4)
+        self._data = np.zeros(self.capacity + self.slack, dtype=KLINE_DTYPE)
+        self._start = 0
+        self._end = 0
+        self.version = 0
+        self.appended = 0
+        self.generation = 0
+
+    @classmethod
+    def from_rows(cls, rows, capacity=None):
+        buffer = cls(capacity)
+        buffer.replace(rows)
+        return buffer
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def __getitem__(self, item):
+        return self.view()[item]
+
+    def __repr__(self):
+        return f"KlineBuffer(len={len(self)}, capacity={self.capacity})"
+
+    def view(self):
+        """Zero-copy, time-ordered structured view of the live window."""
+        return self._data[self._start : self._end]
+
+    def column(self, name):
+        """Zero-copy (strided) view of one column, e.g. column('close')."""
+        return self._data[name][self._start : self._end]
+
+    def record(self, index):
+        """Copy of one candle that stays valid after the buffer moves on."""
+        return self.view()[index].copy()
+
+    def index(self, kline):
+        """Position of the candle with the same open time as `kline`."""
+        open_times = self.column("open_time")
+        position = int(np.searchsorted(open_times, kline[0]))
+        if position >= len(open_times) or open_times[position] != kline[0]:
+            raise ValueError(f"Kline with open time {kline[0]} is not in the buffer")
+        return position
+
+    def tolist(self):
+        """The window as a list of lists (the JSON shape used by routes and templates)."""
+        return [list(row) for row in self.view().tolist()]
+
+    def append(self, kline):
+        """Append a candle (a record or an 11-value sequence), dropping the oldest at capacity."""
+        if self._end == len(self._data):
+            self._compact()
+        self._data[self._end] = kline if isinstance(kline, np.void) else tuple(kline[:11])
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+        self.appended += 1
+        self.version += 1
+
+    def update_last(self, price):
+        """
+        Apply a trade price to the open (latest) candle in place. A price equal
+        to the close changes nothing and leaves the version as it is.
+        """
+        last = self._end - 1
+        data = self._data
+        if price == data["close"][last]:
+            return
+        if price > data["high"][last]:
+            data["high"][last] = price
+        if price < data["low"][last]:
+            data["low"][last] = price
+        data["close"][last] = price
+        self.version += 1
+
+    def replace(self, rows):
+        """Replace the whole series with `rows` (structured array or list of klines)."""
+        rows = self._records(rows)[-self.capacity :]
+        self._data[: len(rows)] = rows
+        self._start = 0
+        self._end = len(rows)
+        self.appended += len(rows)
+        self.generation += 1
+        self.version += 1
+
+    def merge(self, rows):
+        """
+        Merge a delta of candles: rows with the open time of a stored candle
+        overwrite it in place (the still-open candle, or tick-built candles
+        confirmed by the exchange), later rows are appended. Rewriting a
+        candle other than the latest one bumps the generation, since it
+        changes history that incremental consumers already committed.
+        """
+        rows = self._records(rows)
+        if not len(self):
+            self.replace(rows)
+            return
+        open_times = self.column("open_time")
+        overlap = rows[rows["open_time"] <= open_times[-1]]
+        if len(overlap):
+            positions = np.searchsorted(open_times, overlap["open_time"])
+            if positions.max() >= len(open_times) or not np.array_equal(
+                open_times[positions], overlap["open_time"]
+            ):
+                raise ValueError("Kline delta does not line up with the stored candles")
+            self._data[self._start + positions] = overlap
+            if positions.min() < len(open_times) - 1:
+                self.generation += 1
+            self.version += 1
+        for row in rows[len(overlap) :]:
+            self.append(row)
+
+    @staticmethod
+    def _records(rows):
+        if isinstance(rows, np.ndarray) and rows.dtype == KLINE_DTYPE:
+            return rows
+        return np.array([tuple(row[:11]) for row in rows], dtype=KLINE_DTYPE)
+
+    def _compact(self):
+        size = self._end - self._start
+        self._data[:size] = self._data[self._start : self._end]
+        self._start = 0
+        self._end = size
+
+
+class KlineFollower(ABC):
+    """
+    Base for state derived from a KlineBuffer and kept up to date lazily
+    through `sync`: each sync passes only what changed since the previous
+    one, using the buffer's version/appended/generation counters.
+
+    Closed candles are committed once, in order. A buffer replaced wholesale
+    (a new generation), or one that appended more candles than it holds,
+    is replayed from scratch. Subclasses implement the three hooks below.
+    """
+
+    def __init__(self):
+        self._version = -1
+        self._appended = 0
+        self._generation = -1
+
+    def sync(self, klines):
+        """Bring the state in line with `klines` (a KlineBuffer)."""
+        if klines.version == self._version:
+            return self
+
+        candles = klines.view()
+        new_candles = klines.appended - self._appended
+        if klines.generation != self._generation or new_candles >= len(candles):
+            self._reset()
+            self._commit(candles[:-1])
+        else:
+            # The candle open at the last sync and any closed since.
+            self._commit(candles[len(candles) - new_candles - 1 : -1] if new_candles else candles[:0])
+        self._update(klines)
+
+        self._version = klines.version
+        self._appended = klines.appended
+        self._generation = klines.generation
+        return self
+
+    @abstractmethod
+    def _reset(self):
+        """Drop all state before a replay."""
+
+    @abstractmethod
+    def _commit(self, candles):
+        """Add closed candles, a structured view (may be empty)."""
+
+    @abstractmethod
+    def _update(self, klines):
+        """
+        Called after the commits with the whole buffer: take the open candle
+        and expire candles trimmed off the front.
+        """
@@ -0,0 +1,105 @@
+import numpy as np
+
+from kline_buffer import KLINE_DTYPE, KLINE_FIELDS
+
+try:
+    import orjson as json_parser  # Faster fallback parser when installed
+except ImportError:
+    import json as json_parser
+
+# A Binance kline is 12 values: the 11 KLINE_DTYPE columns plus "ignore".
+KLINE_WIDTH = 12
+_STRIP = b'[]"'
+
+
+def decode_klines(payload):
+    """
+    Decode a raw /api/v3/klines response body straight into a KLINE_DTYPE array.
+
+    The body is a flat grid of numbers (prices are quoted strings), so the
+    brackets and quotes are stripped in one bytes.translate pass and NumPy's
+    C parser reads every value into one float64 buffer, which is reshaped to
+    (candles, 12) and copied column-wise into the typed array. No per-candle
+    Python objects are created. Bodies that do not have the expected shape
+    are decoded with the JSON parser instead.
+
+    Returns:
+        np.ndarray: Structured array with the KLINE_DTYPE layout.
+    """
+    body = payload.strip()
+    if body == b"[]":
+        return np.zeros(0, dtype=KLINE_DTYPE)
+    if body.startswith(b"[["):
+        values = np.fromstring(body.translate(None, _STRIP), dtype=np.float64, sep=",")
+        if values.size and values.size % KLINE_WIDTH == 0:
+            return _to_records(values.reshape(-1, KLINE_WIDTH))
+    return decode_klines_json(body)
+
+
+def decode_klines_json(payload):
+    """Reference decode path through the JSON parser (orjson when available)."""
+    data = json_parser.loads(payload)
+    if not isinstance(data, list):
+        raise ValueError(f"Unexpected klines payload: {data}")
+    if not data:
+        return np.zeros(0, dtype=KLINE_DTYPE)
+    return _to_records(np.array([row[: len(KLINE_FIELDS)] for row in data], dtype=np.float64))
+
+
+def _to_records(table):
+    rows = np.empty(len(table), dtype=KLINE_DTYPE)
+    for column, name in enumerate(KLINE_FIELDS):
+        rows[name] = table[:, column]
+    return rows
+
+
+if __name__ == "__main__":
+    import json
+    import random
+    import time
+    import tracemalloc
+
+    symbols, candles = 500, 1000
+    random.seed(0)
+
+    def fixture_body(start):
+        rows = []
+        for i in range(candles):
+            open_time = start + i * 60_000
+            price = random.uniform(0.001, 50_000)
+            rows.append(
+                [open_time, f"{price:.8f}", f"{price * 1.01:.8f}", f"{price * 0.99:.8f}",
+                 f"{price:.8f}", f"{random.uniform(0, 1e6):.8f}", open_time + 59_999,
+                 f"{random.uniform(0, 1e7):.8f}", random.randint(0, 10_000),
+                 f"{random.uniform(0, 1e5):.8f}", f"{random.uniform(0, 1e6):.8f}", "0"]
+            )
+        return json.dumps(rows, separators=(",", ":")).encode()
+
+    bodies = [fixture_body(1_700_000_000_000 + s) for s in range(symbols)]
+
+    def stdlib_lists(body):
+        # The previous path: json.loads plus an 11-element list per candle.
+        return [
+            [int(k[0]), float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]),
+             int(k[6]), float(k[7]), int(k[8]), float(k[9]), float(k[10])]
+            for k in json.loads(body)
+        ]
+
+    def measure(name, decode):
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = [decode(body) for body in bodies]
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:>18}: {elapsed:.2f}s for {symbols}x{candles} candles, "
+            f"retained {current / 2**20:.0f} MiB, peak {peak / 2**20:.0f} MiB"
+        )
+        return results
+
+    reference = measure("json + lists", stdlib_lists)
+    fallback = measure(f"{json_parser.__name__} + array", decode_klines_json)
+    fast = measure("translate + array", decode_klines)
+    assert all(np.array_equal(a, b) for a, b in zip(fast, fallback))
+    assert np.allclose(fast[0]["close"], [row[4] for row in reference[0]])
@@ -1,93 +1,197 @@
 # kline_fetcher.py
+import asyncio
 import threading
 import time
 from datetime import datetime, timedelta
 
-import requests
+import aiohttp
+import numpy as np
 from app_config import AppConfig
 from loguru import logger
 
+from candle_aggregator import interval_to_ms
+from http_client import BASE_URL, HttpClient
+from kline_codec import decode_klines
+from request_scheduler import Lane
+
 KLINE_LIMIT = 500
+KLINE_DELTA_LIMIT = 100  # Candles per incremental refresh (lowest request weight)
+# Only 1m and the cover history come from REST; other timeframes are built by
+# the CandleAggregator from the live 1m/tick stream.
 INTERVALS = ["1m", AppConfig.cover_kline_interval]
 
 
 class KlineFetcher:
-    def __init__(self, cryptos, intervals=INTERVALS):
+    def __init__(self, cryptos, intervals=INTERVALS, candle_aggregator=None, store=None):
         self.price_lock = threading.Lock()
         self.cryptos = cryptos
         self.intervals = intervals
+        self.candle_aggregator = candle_aggregator
+        self.store = store
+        # (symbol, interval) -> open time of the newest candle of the last REST
+        # fetch. Later candles were built from ticks by the CandleAggregator.
+        self.confirmed_open_times = {}
         logger.info(f"Initialized with intervals: {self.intervals}")
 
     @staticmethod
-    def fetch_symbol_historical_data(symbol, interval):
-        """Fetch historical kline data for a given symbol and interval."""
-        url = f"https://api.binance.com/api/v3/klines"
+    def request_weight(limit):
+        """Binance request weight of a /api/v3/klines call for `limit` candles."""
+        if limit <= 100:
+            return 1
+        if limit <= 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+
+    @staticmethod
+    async def fetch_symbol_historical_data(
+        symbol, interval, start_time=None, limit=KLINE_LIMIT, end_time=None
+    ):
+        """
+        Fetch historical kline data for a given symbol and interval, retrying
+        connection errors, timeouts, 5xx and rate-limit responses with
+        exponential backoff. With `start_time` / `end_time` (ms) only candles
+        opening in that range are returned.
+
+        Returns:
+            np.ndarray: KLINE_DTYPE records decoded from the raw body, or None on failure.
+        """
+        url = f"{BASE_URL}/api/v3/klines"
         params = {
             "symbol": symbol,
             "interval": interval,
-            "limit": KLINE_LIMIT,
+            "limit": limit,
         }
+        if start_time is not None:
+            params["startTime"] = start_time
+        if end_time is not None:
+            params["endTime"] = end_time
+        weight = KlineFetcher.request_weight(limit)
+        backoff = AppConfig.kline_fetch_backoff
+
+        for attempt in range(AppConfig.kline_fetch_retries + 1):
+            try:
+                payload = await HttpClient.get_bytes(url, params=params, weight=weight, lane=Lane.KLINES)
+                return decode_klines(payload)
+            except aiohttp.ClientResponseError as e:
+                retryable = e.status in (418, 429) or e.status >= 500
+                if not retryable or attempt == AppConfig.kline_fetch_retries:
+                    logger.error(f"Failed to fetch klines for {symbol}: {e}")
+                    return None
+            except ValueError as e:
+                logger.error(f"Failed to decode klines for {symbol}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == AppConfig.kline_fetch_retries:
+                    logger.error(f"Failed to fetch klines for {symbol}: {e}")
+                    return None
+            logger.debug(f"Retrying klines for {symbol} {interval} in {backoff:.1f}s")
+            await asyncio.sleep(backoff)
+            backoff *= 2
 
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return [
-                [
-                    int(k[0]),  # Open time
-                    float(k[1]),  # Open price
-                    float(k[2]),  # High price
-                    float(k[3]),  # Low price
-                    float(k[4]),  # Close price
-                    float(k[5]),  # Volume
-                    int(k[6]),  # Close time
-                    float(k[7]),  # Quote asset volume
-                    int(k[8]),  # Number of trades
-                    float(k[9]),  # Taker buy base asset volume
-                    float(k[10]),  # Taker buy quote asset volume
-                ]
-                for k in response.json()
-            ]
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch klines for {symbol}: {e}")
-            return None
-
-    def save_historical_data_concurrently(self, cryptos = None):
+    async def save_historical_data_concurrently(self, cryptos = None, show_progress=True):
         """
-        Fetch historical data for all symbols and intervals concurrently.
+        Fetch historical data for all symbols and intervals over the shared
+        connection pool, with at most AppConfig.kline_fetch_concurrency
+        requests in flight. Progress is reported as fetches complete.
         """
         if not cryptos:
             cryptos = self.cryptos.values()
-        threads = []
-        total_tasks = len(self.cryptos.values()) * len(self.intervals)
+        semaphore = asyncio.Semaphore(AppConfig.kline_fetch_concurrency)
+        jobs = [(crypto.symbol, interval) for crypto in cryptos for interval in self.intervals]
+        total_tasks = len(jobs)
         completed_tasks = 0
 
-        for crypto in cryptos:
-            symbol = crypto.symbol
-            for interval in self.intervals:
-                thread = threading.Thread(
-                    target=self._fetch_and_store_klines, args=(symbol, interval)
-                )
-                threads.append(thread)
-                thread.start()
-
-                # Update and display progress
-                completed_tasks += 1
+        async def run(symbol, interval):
+            nonlocal completed_tasks
+            try:
+                async with semaphore:
+                    await self._fetch_and_store_klines(symbol, interval)
+                self.cryptos[symbol].refresh_metrics()
+            except Exception as e:
+                # One bad series must not abort the batch or skip the store flush.
+                logger.error(f"Error refreshing {symbol} {interval} klines: {e}")
+            completed_tasks += 1
+            if show_progress:
                 AppConfig.show_progress(completed_tasks, total_tasks, symbol, interval)
 
-        for thread in threads:
-            thread.join()
+        await asyncio.gather(*(run(symbol, interval) for symbol, interval in jobs))
+        if self.store:
+            await self.store.flush()
 
-
-    def _fetch_and_store_klines(self, symbol, interval):
+    async def _fetch_and_store_klines(self, symbol, interval):
         """
         Helper function to fetch and store klines for a single symbol and interval.
+
+        A series that already has history is refreshed incrementally: candles
+        from the last REST-confirmed open time on are fetched and merged, so
+        the tick-built candles since then (no volume, high/low from sampled
+        ticks) are overwritten with exchange data. The full history is
+        refetched when the delta does not connect to the stored series or its
+        open times do not line up with the stored candles. An
+        empty series is first loaded from the on-disk store, so a restart only
+        fetches what it missed.
         """
-        klines = self.fetch_symbol_historical_data(symbol, interval)
-        if klines:
-            if not interval == "1m":
-                interval = "cover"
+        crypto = self.cryptos[symbol]
+        series = "1m" if interval == "1m" else "cover"
+        stored = getattr(crypto, f"klines_{series}")
+
+        if self.store and not len(stored):
+            cached = self.store.load(symbol, interval)
+            if cached is not None and len(cached):
+                stored.replace(cached)
+                if series == "1m" and self.candle_aggregator:
+                    self.candle_aggregator.seed(crypto)
+
+        if len(stored):
+            start_time = self.delta_start_time(symbol, interval, stored)
+            # After a restart the gap can span more than one delta page.
+            missing = (time.time() * 1000 - start_time) // interval_to_ms(interval) + 2
+            limit = int(min(KLINE_LIMIT, max(KLINE_DELTA_LIMIT, missing)))
+            delta = await self.fetch_symbol_historical_data(
+                symbol, interval, start_time=start_time, limit=limit
+            )
+            if delta is None:
+                return
+            if not len(delta) or (delta[0]["open_time"] == start_time and len(delta) < limit):
+                generation = stored.generation
+                try:
+                    stored.merge(delta)
+                except ValueError as e:
+                    logger.warning(f"{symbol} {interval} delta not merged ({e}), refetching full history")
+                else:
+                    if len(delta):
+                        self.confirmed_open_times[(symbol, interval)] = int(delta[-1]["open_time"])
+                    if self.store:
+                        self.store.mark(symbol, interval, stored)
+                    if series == "1m" and self.candle_aggregator and stored.generation != generation:
+                        self.candle_aggregator.seed(crypto)  # Rebuild derived candles from the corrected 1m
+                    return
+            else:
+                logger.debug(f"Gap in {symbol} {interval} klines, refetching full history")
 
-            self.cryptos[symbol].__setattr__(f"klines_{interval}", klines)
+        klines = await self.fetch_symbol_historical_data(symbol, interval)
+        if klines is not None and len(klines):
+            stored.replace(klines)
+            self.confirmed_open_times[(symbol, interval)] = int(klines[-1]["open_time"])
+            if self.store:
+                self.store.mark(symbol, interval, stored)
+            if series == "1m" and self.candle_aggregator:
+                # Higher timeframes are derived from 1m rather than fetched.
+                self.candle_aggregator.seed(crypto)
+
+    def delta_start_time(self, symbol, interval, stored):
+        """
+        Open time the next delta fetch starts at: the newest REST-confirmed
+        candle, or, for a series loaded from the store, its first candle
+        without volume (the first one built from ticks), else its latest one.
+        """
+        confirmed = self.confirmed_open_times.get((symbol, interval))
+        if confirmed is not None and confirmed >= int(stored[0][0]):
+            return min(confirmed, int(stored[-1][0]))
+        tick_built = np.flatnonzero(stored.column("volume") == 0)
+        return int(stored[tick_built[0]][0]) if len(tick_built) else int(stored[-1][0])
 
     def create_new_kline(self, last_kline, current_price):
         """Create a new kline based on the last kline and current price."""
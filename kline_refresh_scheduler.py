@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import time
+from enum import IntEnum
+
+from app_config import AppConfig
+from loguru import logger
+
+
+class RefreshTier(IntEnum):
+    """Kline refresh priority of a symbol, highest first."""
+
+    ACTIVE = 0  # Has open orders (OrderManager.active_symbols)
+    WORKING = 1  # In Products.working_cryptos
+    RANKED = 2  # Among the top AppConfig.kline_refresh_ranked_count by last_volume
+    DORMANT = 3  # Everything else
+
+
+class KlineRefreshScheduler:
+    """
+    Refreshes each symbol's klines on its own period, set by its tier
+    (AppConfig.kline_refresh_periods), instead of refreshing whole sets on
+    one cadence.
+
+    Due times live in a heap of (due, symbol) entries. When a symbol is
+    promoted its earlier due time is pushed as a new entry and the stale one
+    is skipped when popped (`self.due` holds the live due time per symbol).
+    """
+
+    def __init__(self, products, kline_fetcher):
+        self.products = products
+        self.kline_fetcher = kline_fetcher
+        self.heap = []
+        self.due = {}  # symbol -> live due time
+        self.tiers = {}  # symbol -> RefreshTier
+        self.last_refresh = {}  # symbol -> time of the last completed refresh
+        self.last_lag = {}  # symbol -> how late the last refresh started
+        self._tiers_updated = 0.0
+
+    @staticmethod
+    def period(tier):
+        return AppConfig.kline_refresh_periods[tier.name]
+
+    def compute_tiers(self):
+        """Assign every crypto its tier from open orders, working set and volume rank."""
+        cryptos = self.products.cryptos
+        order_manager = getattr(AppConfig.bot, "order_manager", None)
+        active = set(order_manager.active_symbols) if order_manager else set()
+        working = set(self.products.working_cryptos or {})
+        ranked = sorted(cryptos.values(), key=lambda crypto: crypto.last_volume or 0, reverse=True)
+        top_volume = {crypto.symbol for crypto in ranked[: AppConfig.kline_refresh_ranked_count]}
+
+        tiers = {}
+        for symbol in cryptos:
+            if symbol in active:
+                tiers[symbol] = RefreshTier.ACTIVE
+            elif symbol in working:
+                tiers[symbol] = RefreshTier.WORKING
+            elif symbol in top_volume:
+                tiers[symbol] = RefreshTier.RANKED
+            else:
+                tiers[symbol] = RefreshTier.DORMANT
+        return tiers
+
+    def update_tiers(self, now=None):
+        """
+        Recompute tiers and move symbols whose period shrank forward in the
+        queue. A new symbol whose klines are already loaded (the startup
+        load) counts as refreshed now; the others are spread across their
+        tier period, so a new universe is not refetched in one burst.
+        """
+        now = time.time() if now is None else now
+        self.tiers = self.compute_tiers()
+        new_symbols = [symbol for symbol in self.tiers if symbol not in self.due]
+        for symbol in new_symbols:
+            if symbol not in self.last_refresh and len(self.products.cryptos[symbol].klines_1m):
+                self.last_refresh[symbol] = now
+        unloaded = [symbol for symbol in new_symbols if symbol not in self.last_refresh]
+        spread = {symbol: position / len(unloaded) for position, symbol in enumerate(unloaded)}
+        for symbol, tier in self.tiers.items():
+            if symbol in self.last_refresh:
+                due = self.last_refresh[symbol] + self.period(tier)
+            else:
+                due = now + self.period(tier) * spread[symbol]
+            if symbol in self.due and due >= self.due[symbol]:
+                continue
+            self.due[symbol] = due
+            heapq.heappush(self.heap, (due, symbol))
+        for symbol in [symbol for symbol in self.due if symbol not in self.tiers]:
+            del self.due[symbol]
+        self._tiers_updated = now
+
+    def pop_due(self, now=None):
+        """Remove and return the symbols that are due, most overdue first."""
+        now = time.time() if now is None else now
+        due_symbols = []
+        while self.heap and self.heap[0][0] <= now:
+            due, symbol = heapq.heappop(self.heap)
+            if self.due.get(symbol) != due:
+                continue  # Superseded or removed entry
+            self.last_lag[symbol] = now - due
+            due_symbols.append(symbol)
+        return due_symbols
+
+    def reschedule(self, symbols, now=None):
+        now = time.time() if now is None else now
+        for symbol in symbols:
+            self.last_refresh[symbol] = now
+            tier = self.tiers.get(symbol, RefreshTier.DORMANT)
+            due = now + self.period(tier)
+            self.due[symbol] = due
+            heapq.heappush(self.heap, (due, symbol))
+
+    async def refresh(self, symbols):
+        """Refresh the klines of `symbols` through the KlineFetcher."""
+        cryptos = [self.products.cryptos[symbol] for symbol in symbols if symbol in self.products.cryptos]
+        await self.kline_fetcher.save_historical_data_concurrently(cryptos, show_progress=False)
+        self.products.update_last_volumes(cryptos)
+
+    async def run(self):
+        """Refresh due symbols until shutdown, re-tiering every kline_refresh_tier_interval."""
+        logger.info("Starting per-symbol kline refresh scheduler.")
+        while not AppConfig.is_shutdown_initiated:
+            try:
+                now = time.time()
+                if now - self._tiers_updated >= AppConfig.kline_refresh_tier_interval:
+                    self.update_tiers(now)
+                    logger.debug(f"Kline refresh metrics: {self.metrics(now)}")
+
+                symbols = self.pop_due(now)
+                if symbols:
+                    await self.refresh(symbols)
+                    self.reschedule(symbols)
+                    continue
+            except Exception as e:
+                logger.error(f"Error in kline refresh scheduler: {e}")
+            await asyncio.sleep(self.sleep_time())
+
+    def sleep_time(self):
+        """Seconds until the next due entry, capped at one second."""
+        if not self.heap:
+            return 1.0
+        return min(1.0, max(0.0, self.heap[0][0] - time.time()))
+
+    def metrics(self, now=None):
+        """
+        Freshness of the schedule.
+
+        Returns:
+            dict: queue_depth (symbols overdue now), max_lag / mean_lag (seconds
+            the overdue symbols are late), last_refresh_lag (worst start delay
+            of the last refreshes) and the symbol count per tier.
+        """
+        now = time.time() if now is None else now
+        lags = [now - due for due in self.due.values() if due <= now]
+        tier_counts = {tier.name: 0 for tier in RefreshTier}
+        for tier in self.tiers.values():
+            tier_counts[tier.name] += 1
+        return {
+            "queue_depth": len(lags),
+            "max_lag": max(lags, default=0.0),
+            "mean_lag": sum(lags) / len(lags) if lags else 0.0,
+            "last_refresh_lag": max(self.last_lag.values(), default=0.0),
+            "tracked": len(self.due),
+            "tiers": tier_counts,
+        }
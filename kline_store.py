@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+import numpy as np
+from app_config import AppConfig
+from loguru import logger
+
+from kline_buffer import KLINE_DTYPE
+
+
+class KlineStore:
+    """
+    Local kline cache for warm restarts: one `.npy` segment (KLINE_DTYPE
+    records) per symbol and interval under AppConfig.kline_store_dir.
+
+    Only closed candles are stored. Series are marked dirty when candles close
+    or a refresh lands, and dirty series are written by `flush`, which
+    snapshots them on the event loop and writes the files in a worker thread.
+    Each write goes to a temporary file that atomically replaces the segment,
+    so a crash never leaves a torn file behind.
+    """
+
+    def __init__(self, directory=None, intervals=None):
+        self.directory = directory or AppConfig.kline_store_dir
+        self.intervals = intervals or ["1m", AppConfig.cover_kline_interval]
+        self.dirty = {}  # (symbol, interval) -> KlineBuffer
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, symbol, interval):
+        return os.path.join(self.directory, f"{symbol}_{interval}.npy")
+
+    def load(self, symbol, interval):
+        """Stored candles of `symbol`/`interval`, or None when there is no usable segment."""
+        path = self.path(symbol, interval)
+        if not os.path.exists(path):
+            return None
+        try:
+            rows = np.load(path, mmap_mode="r")
+            if rows.dtype != KLINE_DTYPE:
+                logger.warning(f"Ignoring kline segment with unexpected layout: {path}")
+                return None
+            return np.array(rows)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading kline segment {path}: {e}")
+            return None
+
+    def save(self, symbol, interval, rows):
+        """Atomically write `rows` as the segment of `symbol`/`interval`."""
+        path = self.path(symbol, interval)
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                np.save(file, rows)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing kline segment {path}: {e}")
+
+    def mark(self, symbol, interval, klines):
+        """Schedule the closed candles of `klines` (a KlineBuffer) for the next flush."""
+        if interval in self.intervals:
+            self.dirty[(symbol, interval)] = klines
+
+    def on_candle_close(self, crypto, interval, kline):
+        """CandleAggregator listener: persist series whose candle just closed."""
+        klines = crypto.klines_for(interval)
+        if klines is not None:
+            self.mark(crypto.symbol, interval, klines)
+
+    async def flush(self):
+        """Write every dirty series, leaving the still-open candle out."""
+        if not self.dirty:
+            return
+        snapshots = {key: klines.view()[:-1].copy() for key, klines in self.dirty.items()}
+        self.dirty.clear()
+        await asyncio.to_thread(self._write_all, snapshots)
+        logger.debug(f"Flushed {len(snapshots)} kline segments to {self.directory}")
+
+    def _write_all(self, snapshots):
+        for (symbol, interval), rows in snapshots.items():
+            self.save(symbol, interval, rows)
+
+    async def run(self):
+        """Flush dirty series every AppConfig.kline_store_flush_interval seconds."""
+        while not AppConfig.is_shutdown_initiated:
+            await asyncio.sleep(AppConfig.kline_store_flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing kline store: {e}")
+        await self.flush()
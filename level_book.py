@@ -0,0 +1,184 @@
+import bisect
+from collections import deque
+
+import numpy as np
+from app_config import AppConfig
+
+from kline_buffer import KlineFollower
+from level_clustering import ISCLOSE_ATOL, LevelClustering
+
+
+class LevelBook(KlineFollower):
+    """
+    Swing points and support/resistance levels of one kline series, kept up
+    to date incrementally instead of rediscovered from scratch.
+
+    When candles close, only the swing candidate `shift` candles before each
+    new candle is checked, the new closes are inserted into a sorted list for
+    the touch counts, and swings and closes trimmed off the front of the
+    series are dropped. The open candle takes part provisionally: it is the
+    right neighbour of the last candidate and its close counts as a touch.
+    Swings need a neighbour on both sides inside the series, so nothing wraps
+    around from the last candle to the first.
+
+    `levels()` returns the find_support_resistance result. The closed-candle
+    part is rated once per candle close; between closes only the open
+    candle's touches and the provisional tail swing are re-evaluated.
+    """
+
+    def __init__(self, shift=1):
+        super().__init__()
+        self.shift = shift
+        self._candles = deque()  # (open_time, high, low, close) of closed candles
+        self._sorted_closes = []  # Closes of self._candles, ascending
+        self._swing_highs = deque()  # (open_time, high)
+        self._swing_lows = deque()  # (open_time, low)
+        self._open = None  # (open_time, high, low, close) of the open candle
+        self._levels = ([], [])
+        self._levels_version = -1
+        self._closed = None  # Cached closed-candle part of the levels, see _rate_closed
+        self._merged = {}  # {level_type: (key, levels)}, see _rate
+
+    def _reset(self):
+        self._candles.clear()
+        self._sorted_closes.clear()
+        self._swing_highs.clear()
+        self._swing_lows.clear()
+        self._closed = None
+        self._merged.clear()
+
+    def _commit(self, candles):
+        if not len(candles):
+            return
+        for kline in candles:
+            self._add_closed(kline)
+        self._closed = None
+        self._merged.clear()
+
+    def _update(self, klines):
+        self._track_open(klines)
+        self._expire(klines)
+
+    def levels(self):
+        """
+        Returns:
+            tuple: (support_levels, resistance_levels), lists of
+                   (level, strength) tuples as find_support_resistance.
+        """
+        if self._levels_version == self._version:
+            return self._levels
+        self._levels_version = self._version
+        if self._open is None:
+            self._levels = ([], [])
+            return self._levels
+
+        if self._closed is None:
+            self._closed = self._rate_closed()
+        tail_high, tail_low = self._tail_candidate()
+        self._levels = (
+            self._rate("support", tail_low, AppConfig.support_closeness_threshold_pct),
+            self._rate("resistance", tail_high, AppConfig.resistance_closeness_threshold_pct),
+        )
+        return self._levels
+
+    def _rate_closed(self):
+        """
+        Swing levels of the closed candles with their tolerances and touch
+        counts among the closed candles; changes only when candles close.
+        """
+        sorted_closes = np.array(self._sorted_closes)
+        closed = {"sorted_closes": sorted_closes}
+        for level_type, swings, threshold_pct in (
+            ("support", self._swing_lows, AppConfig.support_closeness_threshold_pct),
+            ("resistance", self._swing_highs, AppConfig.resistance_closeness_threshold_pct),
+        ):
+            levels = np.array([level for _, level in swings], dtype=np.float64)
+            closed[level_type] = (
+                levels,
+                ISCLOSE_ATOL + threshold_pct / 100 * np.abs(levels),
+                LevelClustering.touch_counts(sorted_closes, levels, threshold_pct),
+            )
+        return closed
+
+    def _rate(self, level_type, tail_level, threshold_pct):
+        """
+        Clustered levels of one side: the closed swings plus the provisional
+        tail swing, with the open candle's close counted as a touch. The
+        merge is reused while neither the tail swing nor the set of levels
+        the open close touches changed.
+        """
+        levels, tolerance, counts = self._closed[level_type]
+        if tail_level is not None:
+            tail_tolerance = ISCLOSE_ATOL + threshold_pct / 100 * abs(tail_level)
+            levels = np.append(levels, tail_level)
+            tolerance = np.append(tolerance, tail_tolerance)
+            counts = np.append(
+                counts,
+                LevelClustering.touch_counts(self._closed["sorted_closes"], [tail_level], threshold_pct),
+            )
+        touched = np.abs(self._open[3] - levels) <= tolerance
+        key = (tail_level, touched.tobytes())
+        merged = self._merged.get(level_type)
+        if merged is not None and merged[0] == key:
+            return merged[1]
+        result = [
+            (level, int(strength))
+            for level, strength in LevelClustering.merge(levels, counts + touched, threshold_pct, level_type)
+        ]
+        self._merged[level_type] = (key, result)
+        return result
+
+    def _tail_candidate(self):
+        """
+        (high, low) of the candle `shift` before the open one where it is a
+        swing high (low), else None: it can only be judged against the open candle.
+        """
+        shift = self.shift
+        if len(self._candles) < 2 * shift:
+            return None, None
+        _, high, low, _ = self._candles[-shift]
+        left = self._candles[-2 * shift]
+        _, open_high, open_low, _ = self._open
+        return (
+            high if high > left[1] and high > open_high else None,
+            low if low < left[2] and low < open_low else None,
+        )
+
+    def _add_closed(self, kline):
+        """Add a closed candle and judge the candidate `shift` candles before it."""
+        candle = (int(kline[0]), float(kline[2]), float(kline[3]), float(kline[4]))
+        self._candles.append(candle)
+        bisect.insort(self._sorted_closes, candle[3])
+
+        shift = self.shift
+        if len(self._candles) > 2 * shift:
+            open_time, high, low, _ = self._candles[-1 - shift]
+            left = self._candles[-1 - 2 * shift]
+            if high > left[1] and high > candle[1]:
+                self._swing_highs.append((open_time, high))
+            if low < left[2] and low < candle[2]:
+                self._swing_lows.append((open_time, low))
+
+    def _track_open(self, klines):
+        kline = klines[-1] if len(klines) else None
+        self._open = (
+            None if kline is None else (int(kline[0]), float(kline[2]), float(kline[3]), float(kline[4]))
+        )
+
+    def _expire(self, klines):
+        """Drop candles trimmed off the front and swings lacking a left neighbour."""
+        if not len(klines):
+            return
+        first_open_time = klines[0][0]
+        while self._candles and self._candles[0][0] < first_open_time:
+            _, _, _, close = self._candles.popleft()
+            del self._sorted_closes[bisect.bisect_left(self._sorted_closes, close)]
+        if len(klines) <= self.shift:
+            self._swing_highs.clear()
+            self._swing_lows.clear()
+            return
+        first_swing_time = klines[self.shift][0]
+        while self._swing_highs and self._swing_highs[0][0] < first_swing_time:
+            self._swing_highs.popleft()
+        while self._swing_lows and self._swing_lows[0][0] < first_swing_time:
+            self._swing_lows.popleft()
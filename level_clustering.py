@@ -0,0 +1,111 @@
+import numpy as np
+
+# np.isclose's default absolute tolerance, kept so touch counts are unchanged.
+ISCLOSE_ATOL = 1e-8
+
+
+class LevelClustering:
+    """
+    Support/resistance level clustering in O((levels + candles) log candles).
+
+    Closes are sorted once; the touches of every swing level (closes within
+    `threshold_pct` of it, the np.isclose test) are then counted for all
+    levels at once with two binary searches, and the swing levels are merged
+    in one pass over those counts.
+    """
+
+    @staticmethod
+    def touch_counts(sorted_closes, levels, threshold_pct):
+        """Number of closes within `threshold_pct` percent of each level."""
+        levels = np.asarray(levels, dtype=np.float64)
+        tolerance = ISCLOSE_ATOL + threshold_pct / 100 * np.abs(levels)
+        lower = np.searchsorted(sorted_closes, levels - tolerance, side="left")
+        upper = np.searchsorted(sorted_closes, levels + tolerance, side="right")
+        return upper - lower
+
+    @staticmethod
+    def merge(levels, strengths, threshold_pct, level_type):
+        """
+        Single pass over swing levels in time order: a level more extreme
+        than the current one replaces it, a level beyond `threshold_pct` of
+        it closes the current cluster and starts the next.
+
+        Returns:
+            list: (level, strength) tuples.
+        """
+        resistance = level_type == "resistance"
+        threshold_multiplier = 1 - threshold_pct / 100 if resistance else 1 + threshold_pct / 100
+        merged = []
+        current_level = None
+        current_strength = 0
+        for level, strength in zip(levels.tolist(), strengths.tolist()):
+            if current_level is None or (
+                level > current_level if resistance else level < current_level
+            ):
+                current_level, current_strength = level, strength
+            elif (
+                level < current_level * threshold_multiplier
+                if resistance
+                else level > current_level * threshold_multiplier
+            ):
+                merged.append((current_level, current_strength))
+                current_level, current_strength = level, strength
+        if current_level is not None:
+            merged.append((current_level, current_strength))
+        return merged
+
+    @staticmethod
+    def cluster(levels, closes, threshold_pct, level_type, sorted_closes=None):
+        """
+        Cluster swing `levels` and rate each by its touches in `closes`.
+        Pass `sorted_closes` to reuse one sort for supports and resistances.
+        """
+        if sorted_closes is None:
+            sorted_closes = np.sort(closes)
+        strengths = LevelClustering.touch_counts(sorted_closes, levels, threshold_pct)
+        return LevelClustering.merge(np.asarray(levels), strengths, threshold_pct, level_type)
+
+
+if __name__ == "__main__":
+    import time
+
+    def reference(levels, closes, threshold_pct, level_type):
+        # The previous TechnicalAnalysis._filter_close_levels: one np.isclose scan per level.
+        filtered_levels = []
+        temp_level = None
+        temp_strength = 0
+        threshold_multiplier = 1 - threshold_pct / 100 if level_type == "resistance" else 1 + threshold_pct / 100
+        for level in levels:
+            strength = np.sum(np.isclose(closes, level, rtol=threshold_pct / 100))
+            if temp_level is None or (level_type == "resistance" and level > temp_level) or \
+                    (level_type == "support" and level < temp_level):
+                temp_level, temp_strength = level, strength
+            elif (level_type == "resistance" and level < temp_level * threshold_multiplier) or \
+                    (level_type == "support" and level > temp_level * threshold_multiplier):
+                filtered_levels.append((temp_level, temp_strength))
+                temp_level, temp_strength = level, strength
+        if temp_level is not None:
+            filtered_levels.append((temp_level, temp_strength))
+        return filtered_levels
+
+    rng = np.random.default_rng(0)
+    for candles in (200, 2_000, 20_000):
+        closes = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.002, candles))), 4)
+        highs = closes * 1.001
+        swings = np.where((highs[1:-1] > highs[:-2]) & (highs[1:-1] > highs[2:]))[0] + 1
+        levels = highs[swings]
+
+        start = time.perf_counter()
+        expected = reference(levels, closes, 0.5, "resistance")
+        reference_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = LevelClustering.cluster(levels, closes, 0.5, "resistance")
+        clustering_time = time.perf_counter() - start
+
+        assert [(level, int(strength)) for level, strength in expected] == [
+            (level, int(strength)) for level, strength in result
+        ]
+        print(
+            f"{candles:>6} candles, {len(levels):>5} swings: isclose scan "
+            f"{reference_time * 1000:8.1f} ms, searchsorted {clustering_time * 1000:6.2f} ms"
+        )
@@ -6,6 +6,7 @@ from loguru import logger
 from hypercorn.asyncio import serve
 from hypercorn.config import Config
 from app_config import AppConfig
+from http_client import HttpClient
 
 # from routes.crypto_routes import crypto_blueprint
 from bot import UpdateBot
@@ -92,6 +93,7 @@ async def main(run_flask_app = True):
         logger.exception(f"Unexpected error in main: {e}")
     finally:
         await AppConfig.cancel_tasks()
+        await HttpClient.close()
 
 
 if __name__ == "__main__":
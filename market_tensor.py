@@ -0,0 +1,122 @@
+import numpy as np
+from app_config import AppConfig
+
+from candle_aggregator import interval_to_ms
+from indicator_kernels import IndicatorKernels
+
+OHLCV = ("open", "high", "low", "close", "volume")
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(OHLCV))
+
+
+class MarketTensor:
+    """
+    Shared symbols x candles x OHLCV array for one interval, aligned on candle
+    open time: column -1 is the latest open candle of the universe and column
+    j is `(candles - 1 - j)` intervals before it. Missing candles are NaN.
+
+    Universe-wide screens (volatility, MA crossover, swing points) are single
+    NumPy expressions over this array instead of per-Crypto loops.
+    """
+
+    def __init__(self, interval, candles=None):
+        self.interval = interval
+        self.interval_ms = interval_to_ms(interval)
+        self.candles = candles or AppConfig.KLINE_LIMIT
+        self.symbols = []
+        self.index = {}
+        self.data = np.full((0, self.candles, len(OHLCV)), np.nan)
+        self.end_time = None  # Open time of the last column
+        self._synced_versions = {}
+
+    def refresh(self, cryptos):
+        """
+        Copy the kline buffers of `cryptos` ({symbol: Crypto}) into the tensor.
+        Rows whose buffer did not change since the last refresh are kept as is;
+        when the time axis moves forward, the kept rows are shifted with it.
+        """
+        symbols = list(cryptos)
+        if symbols != self.symbols:
+            self.symbols = symbols
+            self.index = {symbol: row for row, symbol in enumerate(symbols)}
+            self.data = np.full((len(symbols), self.candles, len(OHLCV)), np.nan)
+            self._synced_versions = {}
+
+        buffers = [cryptos[symbol].klines_for(self.interval) for symbol in symbols]
+        last_open_times = [int(buffer[-1][0]) for buffer in buffers if buffer is not None and len(buffer)]
+        if not last_open_times:
+            return self
+        end_time = max(last_open_times)
+        if end_time != self.end_time:
+            self._shift(end_time)
+
+        first_time = end_time - (self.candles - 1) * self.interval_ms
+        for row, (symbol, buffer) in enumerate(zip(symbols, buffers)):
+            if buffer is None:
+                continue
+            if self._synced_versions.get(symbol) == (buffer.generation, buffer.version):
+                continue
+            self._synced_versions[symbol] = (buffer.generation, buffer.version)
+
+            klines = buffer.view()
+            columns = (klines["open_time"] - first_time) // self.interval_ms
+            valid = (columns >= 0) & (columns < self.candles)
+            self.data[row].fill(np.nan)
+            for field, name in enumerate(OHLCV):
+                self.data[row, columns[valid], field] = klines[name][valid]
+        return self
+
+    def _shift(self, end_time):
+        """Move the time axis to `end_time`, keeping the columns still inside the window."""
+        shift = None
+        if self.end_time is not None and (end_time - self.end_time) % self.interval_ms == 0:
+            shift = (end_time - self.end_time) // self.interval_ms
+        if shift is not None and 0 < shift < self.candles:
+            self.data[:, :-shift] = self.data[:, shift:]
+            self.data[:, -shift:] = np.nan
+        else:
+            self.data.fill(np.nan)
+            self._synced_versions = {}
+        self.end_time = end_time
+
+    def field(self, field):
+        """(symbols, candles) view of one OHLCV field."""
+        return self.data[:, :, field]
+
+    def volatility(self):
+        """
+        (max high - min low) / min low in percent per symbol (the
+        volatility_factor_* formula), 0 for rows without candles.
+        """
+        return IndicatorKernels.range_volatility(self.field(HIGH), self.field(LOW))
+
+    def moving_average(self, period):
+        """Simple moving average of the close over the last `period` candles per symbol."""
+        return IndicatorKernels.sma(self.field(CLOSE)[:, -period:], period)[:, -1]
+
+    def ma_crossover(self, fast=5, slow=20):
+        """
+        True where the fast MA is above the slow MA (the is_uptrend_* test).
+        Rows lagging behind the universe end have NaN tails and yield False.
+        """
+        return self.moving_average(fast) > self.moving_average(slow)
+
+    def swing_points(self, shift=1):
+        """
+        Boolean (symbols, candles) masks of swing highs and swing lows: candles
+        whose high (low) is above (below) both neighbours `shift` candles away.
+        Edges without neighbours are never swings.
+        """
+        return IndicatorKernels.swing_points(self.field(HIGH), self.field(LOW), shift)
+
+    def rsi(self, period=14):
+        """Latest RSI of the close per symbol."""
+        return IndicatorKernels.rsi(self.field(CLOSE), period)[:, -1]
+
+    def macd(self, short_window=12, long_window=26, signal_window=9):
+        """Latest (macd, signal) arrays per symbol."""
+        macd = IndicatorKernels.macd(self.field(CLOSE), short_window, long_window, signal_window)
+        return macd["macd"][:, -1], macd["signal"][:, -1]
+
+    def by_symbol(self, values):
+        """Map a per-row result array back to {symbol: value}."""
+        return dict(zip(self.symbols, values.tolist()))
@@ -1,12 +1,54 @@
+from collections import defaultdict
 from dataclasses import field
 from datetime import datetime
-from pydantic import BaseModel, Field, computed_field
-from typing import Optional, List, Dict, Tuple
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
+from loguru import logger
+from typing import Any, ClassVar, Optional, List, Dict, Tuple
+from app_config import AppConfig
+from kline_buffer import KlineBuffer
+from level_book import LevelBook
+from models.crypto_metrics import CryptoMetrics
+from rolling_range import RollingRange
+from streaming_indicators import StreamingIndicators
 from technical_analysis import TechnicalAnalysis
-from zone_manager import ZoneManager
+from zone_state import ZoneState
 
 
 class Crypto(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Hit/miss counters of the serialize cache, across all cryptos.
+    cache_stats: ClassVar[Dict[str, Dict[str, int]]] = defaultdict(
+        lambda: {"hits": 0, "misses": 0}
+    )
+
+    # Field sets of serialize; "full" is every field, klines included.
+    SUMMARY_FIELDS: ClassVar[frozenset] = frozenset(
+        (
+            "symbol", "status", "base_asset", "quote_asset", "price_precision", "tick_size",
+            "minimum_quantity", "tags", "last_volume", "is_price_stable",
+            "is_unusual_volatility", "current_price", "current_time",
+        )
+    )
+    SERIALIZATION_PROFILES: ClassVar[Dict[str, frozenset]] = {
+        "summary": SUMMARY_FIELDS,
+        "analytics": SUMMARY_FIELDS
+        | frozenset(name for name in CryptoMetrics.model_fields if name != "price")
+        | {"test_results"},
+        "chart": SUMMARY_FIELDS | {"klines_1m", "klines_cover", "zones"},  # crypto_chart.html
+    }
+    KLINE_FIELDS: ClassVar[frozenset] = frozenset(("klines_1m", "klines_cover"))
+    VOLATILE_FIELDS: ClassVar[frozenset] = frozenset(("current_price", "current_time"))
+    SERIALIZED_CACHE_SIZE: ClassVar[int] = 8  # Field sets cached per crypto
+
     symbol: str
     status: Optional[str] = ""
     base_asset: str
@@ -20,7 +62,6 @@ class Crypto(BaseModel):
     opening_price: float = 0.0
     high_price: float = 0.0
     low_price: float = 0.0
-    current_price: float = 0.0
     base_asset_volume: float = 0.0
     quote_asset_volume: float = 0.0
     adjusted_volume: float = 0.0
@@ -34,86 +75,345 @@ class Crypto(BaseModel):
     tags: Optional[List[str]] = Field(default_factory=list)
     is_price_stable: bool = False
     last_volume: float = 0.0
-    _old_price_movement: Optional[Tuple[float, int]] = (0.0, -1)  # Initialize as None
     _old_price: float = 0.0
+    _current_price: float = 0.0  # Used until the crypto is bound to a PriceTable slot
+    _price_table: Optional[Any] = None
+    _price_slot: int = -1
+    _range_1m: RollingRange = PrivateAttr(default_factory=RollingRange)
+    _range_cover: RollingRange = PrivateAttr(default_factory=RollingRange)
+    _indicators_1m: StreamingIndicators = PrivateAttr(default_factory=StreamingIndicators)
+    _indicators_cover: StreamingIndicators = PrivateAttr(default_factory=StreamingIndicators)
+    _levels_1m: LevelBook = PrivateAttr(default_factory=LevelBook)
+    _zone_state: ZoneState = PrivateAttr(default_factory=ZoneState)
+    _derived_klines: Dict[str, KlineBuffer] = PrivateAttr(default_factory=dict)
+    _metrics: CryptoMetrics = PrivateAttr(default_factory=CryptoMetrics)
+    _stage_keys: Dict[str, tuple] = PrivateAttr(default_factory=dict)
+    _metrics_version: int = PrivateAttr(default=0)  # Bumped whenever a stage updates the metrics
+    _serialized: Dict[frozenset, Tuple[tuple, dict]] = PrivateAttr(default_factory=dict)
     # I want klines to be printed last after @computed fields
-    klines_1m: List[List[float]] = Field(
-        default_factory=list
+    klines_1m: KlineBuffer = Field(
+        default_factory=KlineBuffer
     )  # Add klines_1m attribute
-    klines_cover: List[List[float]] = Field(
-        default_factory=list
+    klines_cover: KlineBuffer = Field(
+        default_factory=KlineBuffer
     )  # Add klines_cover attribute
     test_results: dict = {}  # Initialize test_results as an empty dictionary
     is_unusual_volatility: Optional[bool] = False
 
-    @computed_field
-    @property
-    def current_time(self) -> int:
-        return int(datetime.now().timestamp() * 1000)
+    def __init__(self, current_price: float = 0.0, **data):
+        super().__init__(**data)
+        self._current_price = float(current_price)
+
+    @field_validator("klines_1m", "klines_cover", mode="before")
+    @classmethod
+    def _klines_to_buffer(cls, klines):
+        if isinstance(klines, KlineBuffer):
+            return klines
+        return KlineBuffer.from_rows(klines)
+
+    @field_serializer("klines_1m", "klines_cover")
+    def _serialize_klines(self, klines: KlineBuffer):
+        return klines.tolist()
+
+    @field_serializer("zones")
+    def _serialize_zones(self, zones: dict):
+        # Compact form; ZoneRange.to_dict(full=True) gives the Zone shape with candles.
+        return {name: zone.to_dict() if zone else None for name, zone in zones.items()}
+
+    def bind_price_table(self, price_table, slot):
+        """Move current_price storage into `slot` of a shared PriceTable."""
+        price_table.last_price[slot] = self._current_price
+        self._price_table = price_table
+        self._price_slot = slot
+
+    def klines_for(self, interval):
+        """
+        Return the live KlineBuffer for `interval`: klines_1m, klines_cover or a
+        timeframe derived by the CandleAggregator (None if not tracked).
+        """
+        if interval == "1m":
+            return self.klines_1m
+        if interval == AppConfig.cover_kline_interval:
+            return self.klines_cover
+        return self._derived_klines.get(interval)
+
+    def set_derived_klines(self, interval, klines):
+        self._derived_klines[interval] = klines
+
+    @staticmethod
+    def series_version(*series) -> tuple:
+        """Cache key for values derived from `series`: changes whenever any buffer does."""
+        return tuple((id(klines), klines.version) for klines in series)
+
+    @classmethod
+    def cache_report(cls) -> Dict[str, Dict[str, float]]:
+        """Hits, misses and hit rate of the serialize cache."""
+        return {
+            name: {**stats, "hit_rate": stats["hits"] / max(1, stats["hits"] + stats["misses"])}
+            for name, stats in cls.cache_stats.items()
+        }
 
-    @computed_field
     @property
-    def zones(self) -> dict:
+    def metrics(self) -> CryptoMetrics:
+        """The stored derived metrics, as of the last refresh_metrics."""
+        return self._metrics
+
+    def refresh_metrics(self) -> CryptoMetrics:
         """
-        Computes the immediate demand zone for the cryptocurrency based on its Klines.
+        Update the stored metrics after a price tick or kline change.
 
-        Returns:
-            dict: Information about the immediate demand zone or None if not found.
+        The price stage runs when the price moved since the last refresh; the
+        "1m" and "cover" stages run when their kline series changed (the open
+        candle ticked, a candle closed or a refresh landed). Both stages read
+        the open candle, so they run on every tick that moves it. Each metric
+        is thus computed once per event, and reading it afterwards is free.
         """
-        zones = {"immediate_demand_zone" : None ,"supply_zone_before_immediate_demand_zone" : None }
-        if not self.klines_cover:
-            return zones  # No Klines to process
-
-        # Initialize ZoneManager
-        zone_manager = ZoneManager(self.klines_cover)
-
-        # Get the immediate demand zone
-        if zone_manager.immediate_demand_zone:
-            zones['immediate_demand_zone'] = zone_manager.immediate_demand_zone
-        if zone_manager.supply_zone_before_immediate_demand_zone:
-            zones['supply_zone_before_immediate_demand_zone'] = zone_manager.supply_zone_before_immediate_demand_zone
-        return zones
-    
-    @computed_field
-    @property
-    def macd_crossover_1m(self) -> Optional[str]:
+        metrics = self._metrics
+        current_price = self.current_price
+        if current_price != metrics.price:
+            metrics.price_movement = self._price_movement(
+                metrics.price, metrics.price_movement[1], current_price
+            )
+            metrics.price = current_price
+            self._metrics_version += 1
+
+        for stage, klines, update in (
+            ("1m", self.klines_1m, self._update_metrics_1m),
+            ("cover", self.klines_cover, self._update_metrics_cover),
+        ):
+            key = self.series_version(klines)
+            if self._stage_keys.get(stage) == key:
+                continue
+            self._metrics_version += 1
+            try:
+                update(metrics)
+                self._stage_keys[stage] = key
+            except Exception as e:
+                logger.error(f"Error updating {stage} metrics for {self.symbol}: {e}")
+        return metrics
+
+    @classmethod
+    def serialization_fields(cls, fields=None, profile: str = "full") -> frozenset:
+        """
+        Resolve an explicit field list (an iterable or a comma-separated
+        string) or, when `fields` is empty, a named profile: "summary",
+        "analytics", "chart" or "full".
+
+        Raises:
+            ValueError: For unknown fields or profiles.
+        """
+        known = frozenset(cls.model_fields) | frozenset(cls.__pydantic_decorators__.computed_fields)
+        if isinstance(fields, str):
+            fields = [name.strip() for name in fields.split(",") if name.strip()]
+        if fields:
+            fields = frozenset(fields)
+            unknown = fields - known
+            if unknown:
+                raise ValueError(f"Unknown Crypto fields: {', '.join(sorted(unknown))}")
+            return fields
+        if profile == "full":
+            return known
+        if profile not in cls.SERIALIZATION_PROFILES:
+            raise ValueError(f"Unknown serialization profile: {profile}")
+        return cls.SERIALIZATION_PROFILES[profile]
+
+    def serialize(self, fields=None, profile: str = "full") -> dict:
+        """
+        JSON-ready dict of the requested fields (see serialization_fields).
+        Fields that are not requested are never evaluated.
+
+        Metrics and klines are cached per field set and served from the cache
+        until refresh_metrics or the kline buffers change them. Plain fields
+        and current_price/current_time are dumped on every call, since they can
+        be changed in place. The returned dict is new, but the nested values
+        of cached fields are shared and must not be mutated.
+        """
+        include = self.serialization_fields(fields, profile)
+        versioned = include - frozenset(Crypto.model_fields) - self.VOLATILE_FIELDS
+        versioned |= include & self.KLINE_FIELDS
+        data = self.model_dump(include=set(include - versioned), mode="json")
+        if not versioned:
+            return data
+
+        klines = [self.klines_1m, self.klines_cover] if versioned & self.KLINE_FIELDS else []
+        key = (self._metrics_version, self.series_version(*klines))
+        stats = Crypto.cache_stats["serialize"]
+        entry = self._serialized.get(versioned)
+        if entry is not None and entry[0] == key:
+            stats["hits"] += 1
+        else:
+            stats["misses"] += 1
+            if len(self._serialized) >= self.SERIALIZED_CACHE_SIZE:
+                self._serialized.clear()
+            entry = (key, self.model_dump(include=set(versioned), mode="json"))
+            self._serialized[versioned] = entry
+        data.update(entry[1])
+        return data
+
+    @staticmethod
+    def _price_movement(old_price: float, old_strength: int, current_price: float) -> Tuple[float, int]:
+        """
+        Calculates the price movement and its strength.
+
+        Returns a tuple:
+            - float: The price percentage difference
+            - int: The strength of the movement (incremental, resets on turn)
+        """
+        if old_price == 0:
+            price_difference_pct = 0.0
+        else:
+            price_difference_pct = ((current_price - old_price) / old_price) * 100
+
+        if price_difference_pct > 0 and old_strength < 0:  # Turn from down to up
+            strength = 1  # Reset strength to 1
+        elif price_difference_pct < 0 and old_strength > 0:  # Turn from up to down
+            strength = -1  # Reset strength to -1
+        elif price_difference_pct > 0:  # Continued upward movement
+            strength = old_strength + 1
+        elif price_difference_pct < 0:  # Continued downward movement
+            strength = old_strength - 1
+        else:
+            strength = 0  # No price change
+        return price_difference_pct, strength
+
+    def _update_metrics_1m(self, metrics: CryptoMetrics):
+        """Stage "1m": levels, volatility and indicators of klines_1m."""
+        klines = self.klines_1m
+        support_levels, resistance_levels = self._levels_1m.sync(klines).levels()
+        metrics.support_resistance_1m = (support_levels, resistance_levels)
+
+        strongest = self._strongest_support_resistance(support_levels, resistance_levels)
+        metrics.strongest_support_resistance = strongest
+        next_support, next_resistance = self._next_support_resistance(
+            support_levels, resistance_levels, strongest
+        )
+        metrics.next_support_resistance = (next_support, next_resistance)
+        gap_pct = (
+            ((next_resistance - next_support) / next_support) * 100
+            if next_support and next_resistance
+            else 0
+        )
+        metrics.support_resistance_range_pct = gap_pct
+        metrics.support_resistance_1m_range_pct = gap_pct
+
+        lowest_support = min(support_levels, key=lambda item: item[0])[0] if support_levels else 0
+        metrics.lowest_support_1m = lowest_support
+        metrics.next_to_lowest_support_pct = (
+            (next_support - lowest_support) / lowest_support if lowest_support else 0.0
+        )
+
+        metrics.volatility_factor_1m = self._range_1m.sync(klines).range_pct()
+        indicators = self._indicators_1m.sync(klines)
+        metrics.is_uptrend_1m = bool(indicators.ma(5) > indicators.ma(20))
+        metrics.macd_crossover_1m = self._macd_crossover(indicators) if len(klines) >= 26 else None
+        metrics.calculate_ma_rsi = {
+            **metrics.calculate_ma_rsi,
+            "ma_1m": indicators.ma(20),
+            "rsi_1m": indicators.rsi(),
+        }
+
+    def _update_metrics_cover(self, metrics: CryptoMetrics):
+        """Stage "cover": volatility, indicators and zones of klines_cover."""
+        klines = self.klines_cover
+        metrics.volatility_factor_cover = self._range_cover.sync(klines).range_pct()
+        indicators = self._indicators_cover.sync(klines)
+        metrics.is_uptrend_cover = bool(indicators.ma(5) > indicators.ma(20))
+        metrics.zones = self._zone_state.sync(klines).zones()
+        metrics.calculate_ma_rsi = {
+            **metrics.calculate_ma_rsi,
+            "ma_cover": indicators.ma(20),
+            "rsi_cover": indicators.rsi(),
+        }
+
+    @staticmethod
+    def _strongest_support_resistance(support_levels, resistance_levels) -> tuple[float, float]:
+        if len(support_levels) < 1 or len(resistance_levels) < 1:
+            return (0, 0)
+
+        # Extract price level (first element) from strongest levels
+        strongest_support = max(support_levels, key=lambda item: item[1])[0]
+        strongest_resistance = max(resistance_levels, key=lambda item: item[1])[0]
+
+        return float(strongest_support), float(strongest_resistance)
+
+    @staticmethod
+    def _next_support_resistance(supports, resistances, strongest) -> tuple[float, float]:
+        support, resistance = strongest
+        if support == 0 or resistance == 0 or len(supports) < 2 or len(resistances) < 2:
+            return (0, 0)
+        # Sorted copy: the levels are shared with the stored support_resistance_1m.
+        resistances = sorted(resistances, key=lambda item: item[0], reverse=True)
+        resistance_level = resistances[1][0]
+        return (support, resistance_level)
+
+    @staticmethod
+    def _macd_crossover(indicators) -> Optional[str]:
         """
-        Detects MACD crossover for 1-minute kline data.
+        Detects MACD crossover between the previous and the latest candle.
 
         Returns:
             - "bullish" if MACD line crosses above Signal line.
             - "bearish" if MACD line crosses below Signal line.
             - None if no crossover is detected.
         """
-        # Ensure there is enough data to compute MACD
-        if len(self.klines_1m) < 26:  # Minimum data for MACD (26 EMA)
-            return None
-
-        # Calculate MACD and Signal line
-        macd_data = TechnicalAnalysis.calculate_macd(self.klines_1m)
-        macd_line = macd_data["macd"]
-        signal_line = macd_data["signal"]
-
-        # Check if there is enough data for comparison
-        if len(macd_line) < 2 or len(signal_line) < 2:
-            return None
+        previous_macd, previous_signal = indicators.previous_macd()
+        macd, signal = indicators.macd()
 
         # Compare current and previous values for crossover
-        if macd_line[-2] < signal_line[-2] and macd_line[-1] > signal_line[-1]:
+        if previous_macd < previous_signal and macd > signal:
             return "bullish"  # Bullish crossover
-        elif macd_line[-2] > signal_line[-2] and macd_line[-1] < signal_line[-1]:
+        elif previous_macd > previous_signal and macd < signal:
             return "bearish"  # Bearish crossover
 
         return None  # No crossover
 
+    @computed_field
+    @property
+    def current_price(self) -> float:
+        if self._price_table is None:
+            return self._current_price
+        return float(self._price_table.last_price[self._price_slot])
+
+    @current_price.setter
+    def current_price(self, price: float):
+        if self._price_table is None:
+            self._current_price = float(price)
+        else:
+            self._price_table.last_price[self._price_slot] = price
+
+    @computed_field
+    @property
+    def current_time(self) -> int:
+        return int(datetime.now().timestamp() * 1000)
+
+    @computed_field
+    @property
+    def zones(self) -> dict:
+        """
+        The immediate demand zone for the cryptocurrency based on its Klines.
+
+        Returns:
+            dict: ZoneRange of the immediate demand zone and of the supply zone
+                  before it, or None if not found.
+        """
+        return self._metrics.zones
+
+    @computed_field
+    @property
+    def macd_crossover_1m(self) -> Optional[str]:
+        """
+        MACD crossover on the 1-minute klines: "bullish", "bearish" or None.
+        """
+        return self._metrics.macd_crossover_1m
+
     @computed_field
     @property
     def support_resistance_1m(
         self,
     ) -> tuple[list[tuple[float, int]], list[tuple[float, int]]]:
         """
-        Calculates support and resistance levels for 1-minute kline data
-        using the `find_support_resistance` method.
+        Support and resistance levels of the 1-minute kline data, as
+        `find_support_resistance`.
 
         Returns:
             A tuple containing two lists:
@@ -122,87 +422,39 @@ class Crypto(BaseModel):
                  - resistance_levels: A list of tuples, where each tuple is
                                       (resistance_level, strength).
         """
-        return TechnicalAnalysis.find_support_resistance(self.klines_1m, timeframe="1m")
+        return self._metrics.support_resistance_1m
 
     @computed_field
     @property
     def volatility_factor_1m(self) -> float:
-        klines_1m = self.klines_1m
-        high = max(kline[2] for kline in klines_1m)
-        low = min(kline[3] for kline in klines_1m)
-        return ((high - low) / low) * 100 if low != 0 else 0
+        return self._metrics.volatility_factor_1m
 
     @computed_field
     @property
     def volatility_factor_cover(self) -> float:
-        klines_cover = self.klines_cover
-        high = max(kline[2] for kline in klines_cover)
-        low = min(kline[3] for kline in klines_cover)
-        return ((high - low) / low) * 100 if low != 0 else 0
+        return self._metrics.volatility_factor_cover
 
     @computed_field
     @property
     def next_support_resistance(self) -> tuple[float, float]:
-
-        supports, resistances = self.support_resistance_1m
-        support, resistance = self.strongest_support_resistance
-
-        if support == 0 or resistance == 0 or len(supports) < 2 or len(resistances) < 2:
-            return (0, 0)
-        resistances.sort(key=lambda item: item[0], reverse=True)
-        resistance_level = resistances[1][0]
-        return (support, resistance_level)
+        return self._metrics.next_support_resistance
 
     @computed_field
     @property
     def strongest_support_resistance(self) -> tuple[float, float]:
-        support_levels, resistance_levels = self.support_resistance_1m
-        if len(support_levels) < 1 or len(resistance_levels) < 1:
-            return (0, 0)
-
-        # Extract price level (first element) from strongest levels
-        strongest_support = max(support_levels, key=lambda item: item[1])[0]
-        strongest_resistance = max(resistance_levels, key=lambda item: item[1])[0]
-
-        return float(strongest_support), float(strongest_resistance)
+        return self._metrics.strongest_support_resistance
 
     @computed_field
     @property
     def price_movement(self) -> Tuple[float, int]:
         """
-        Calculates the price movement and its strength.
+        The last price movement and its strength.
 
         Returns a tuple:
             - float: The price percentage difference
             - int: The strength of the movement (incremental, resets on turn)
         """
-        current_price = self.current_price
-
-        if self._old_price_movement is not None:
-            old_price, old_strength = self._old_price_movement
-            if old_price == 0:
-                price_difference_pct = (
-                    0.0  # Or handle it differently based on your logic
-                )
-            else:
-                price_difference_pct = ((current_price - old_price) / old_price) * 100
-        else:
-            price_difference_pct = 0.0  # Initial value
-            old_strength = 0
-
-        if price_difference_pct > 0 and old_strength < 0:  # Turn from down to up
-            strength = 1  # Reset strength to 1
-        elif price_difference_pct < 0 and old_strength > 0:  # Turn from up to down
-            strength = -1  # Reset strength to -1
-        elif price_difference_pct > 0:  # Continued upward movement
-            strength = old_strength + 1
-        elif price_difference_pct < 0:  # Continued downward movement
-            strength = old_strength - 1
-        else:
-            strength = 0  # No price change
-
-        self._old_price_movement = (current_price, strength)  # Store current values
-        return price_difference_pct, strength  # Return percentage difference
+        return self._metrics.price_movement
 
     # @computed_field
     # @property
@@ -226,81 +478,41 @@ class Crypto(BaseModel):
     @property
     def support_resistance_range_pct(self) -> float:
         """
-        Calculates the percentage difference between the next resistance
+        The percentage difference between the next resistance
         and next support levels.
         """
-        next_support, next_resistance = (
-            self.next_support_resistance
-        )  # Directly unpack the tuple
-        if next_support == 0 or next_resistance == 0:
-            return 0
-
-        gap_pct = ((next_resistance - next_support) / next_support) * 100
-        return gap_pct
+        return self._metrics.support_resistance_range_pct
 
     @computed_field
     @property
     def is_uptrend_cover(self) -> bool:
-        return TechnicalAnalysis.is_uptrend_cover(
-            self.klines_cover
-        )  # Use the TechnicalAnalysis method
+        return self._metrics.is_uptrend_cover
 
     @computed_field
     @property
     def is_uptrend_1m(self) -> bool:
-        return TechnicalAnalysis.is_uptrend_1m(
-            self.klines_1m
-        )  # Use the TechnicalAnalysis method
+        return self._metrics.is_uptrend_1m
 
     @computed_field
     @property
     def support_resistance_1m_range_pct(self) -> float:
         """
-        Calculates the pct range between the next support and resistance
-        levels relative to the current price, based on 1-minute kline data.
-
-        Returns:
-            The pct range between support and resistance levels.
+        The pct range between the next support and resistance levels,
+        based on 1-minute kline data.
         """
-        next_support, next_resistance = self.next_support_resistance  # Directly unpack
-
-        if next_support and next_resistance:
-            range_pct = ((next_resistance - next_support) / next_support) * 100
-            return range_pct
-        else:
-            return 0
+        return self._metrics.support_resistance_1m_range_pct
 
     @computed_field
     @property
     def lowest_support_1m(self) -> float:
-        support_levels, _ = self.support_resistance_1m
-        if len(support_levels) < 1:
-            return 0
-        return min(support_levels, key=lambda item: item[0])[0]
+        return self._metrics.lowest_support_1m
 
     @computed_field
     @property
     def next_to_lowest_support_pct(self) -> float:
-        support = self.next_support_resistance[0]
-        return (support - self.lowest_support_1m) / self.lowest_support_1m
+        return self._metrics.next_to_lowest_support_pct
 
     @computed_field
     @property
     def calculate_ma_rsi(self) -> Dict[str, float]:
-        ma_period = 20
-        rsi_period = 14
-
-        return {
-            "ma_1m": float(
-                TechnicalAnalysis.calculate_ma(self.klines_1m, ma_period).iloc[-1]
-            ),
-            "ma_cover": float(
-                TechnicalAnalysis.calculate_ma(self.klines_cover, ma_period).iloc[-1]
-            ),
-            "rsi_1m": float(
-                TechnicalAnalysis.calculate_rsi(self.klines_1m, rsi_period).iloc[-1]
-            ),
-            "rsi_cover": float(
-                TechnicalAnalysis.calculate_rsi(self.klines_cover, rsi_period).iloc[-1]
-            ),
-        }
+        return self._metrics.calculate_ma_rsi
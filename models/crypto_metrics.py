@@ -0,0 +1,42 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional, Tuple
+
+
+class CryptoMetrics(BaseModel):
+    """
+    Derived metrics of a Crypto, stored as plain values. They are written by
+    Crypto.refresh_metrics when a price tick or candle close changes their
+    inputs; reading them never computes anything.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    price: float = 0.0  # Price the price stage last saw
+    price_movement: Tuple[float, int] = (0.0, 0)
+
+    # Stage "1m": klines_1m
+    volatility_factor_1m: float = 0.0
+    support_resistance_1m: Tuple[List[Tuple[float, int]], List[Tuple[float, int]]] = ([], [])
+    strongest_support_resistance: Tuple[float, float] = (0, 0)
+    next_support_resistance: Tuple[float, float] = (0, 0)
+    support_resistance_range_pct: float = 0.0
+    support_resistance_1m_range_pct: float = 0.0
+    lowest_support_1m: float = 0.0
+    next_to_lowest_support_pct: float = 0.0
+    is_uptrend_1m: bool = False
+    macd_crossover_1m: Optional[str] = None
+
+    # Stage "cover": klines_cover
+    volatility_factor_cover: float = 0.0
+    is_uptrend_cover: bool = False
+    zones: dict = Field(
+        default_factory=lambda: {
+            "immediate_demand_zone": None,
+            "supply_zone_before_immediate_demand_zone": None,
+        }
+    )
+
+    # Both stages
+    calculate_ma_rsi: Dict[str, float] = Field(
+        default_factory=lambda: {"ma_1m": 0.0, "ma_cover": 0.0, "rsi_1m": 0.0, "rsi_cover": 0.0}
+    )
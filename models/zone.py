@@ -52,3 +52,67 @@ class Zone(BaseModel):
             f"Zone(type={self.zone_type}, low={self.low}, high={self.high}, "
             f"creation_time={self.creation_time}, is_fresh={self.is_fresh})"
         )
+
+
+class ZoneRange:
+    """
+    Compact zone: type, bounds, creation time and the (start, end) index
+    range of its candles in the owning KlineBuffer, with freshness computed
+    once by whoever creates it. Nothing is copied from the series; the Zone
+    JSON shape with candle copies is only built by `to_dict(full=True)`.
+    """
+
+    __slots__ = ("zone_type", "low", "high", "creation_time", "start", "end", "start_time", "is_fresh", "_klines")
+
+    def __init__(self, zone_type, low, high, creation_time, start, end, klines, is_fresh):
+        self.zone_type = zone_type
+        self.low = low
+        self.high = high
+        self.creation_time = creation_time
+        self.start = start
+        self.end = end
+        # The range is located by open time, so it survives the buffer rolling.
+        self.start_time = int(klines[start][0]) if end > start else None
+        self.is_fresh = is_fresh
+        self._klines = klines
+
+    @property
+    def mid_point(self) -> float:
+        return (self.low + self.high) / 2
+
+    def candles(self):
+        """KLINE_DTYPE records of the zone's candles still in the series."""
+        view = self._klines.view()
+        if self.start_time is None:
+            return view[:0]
+        first = int(view["open_time"].searchsorted(self.start_time))
+        return view[first : first + self.end - self.start]
+
+    def to_dict(self, full=False) -> dict:
+        """
+        The zone as a dict; with `full`, in the Zone JSON shape including
+        copies of its candles and of the whole series. The compact form
+        locates the candles by the open time of the first one and their
+        count, since buffer indices shift as the series rolls.
+        """
+        data = {
+            "zone_type": self.zone_type,
+            "low": self.low,
+            "high": self.high,
+            "creation_time": self.creation_time,
+        }
+        if full:
+            data["candles"] = [list(row) for row in self.candles().tolist()]
+            data["klines"] = self._klines.tolist()
+        else:
+            data["start_time"] = self.start_time
+            data["candle_count"] = self.end - self.start
+        data["is_fresh"] = self.is_fresh
+        data["mid_point"] = self.mid_point
+        return data
+
+    def __str__(self) -> str:
+        return (
+            f"Zone(type={self.zone_type}, low={self.low}, high={self.high}, "
+            f"creation_time={self.creation_time}, is_fresh={self.is_fresh})"
+        )
@@ -11,6 +11,12 @@ class OrderAuthorization:
         self.crypto_data = crypto_data
         self.volatility_threshold = volatility_threshold
         self.nominees = []
+        self.screen = {}  # {symbol: universe screen values}, see Products.screen_universe
+
+    def screened(self, crypto, name):
+        """Value of `name` from the universe screen, or the crypto's stored metric."""
+        values = self.screen.get(crypto.symbol)
+        return values[name] if values is not None else getattr(crypto.metrics, name)
 
     def test_black_list(self, crypto):
         """Tests if the crypto is in the blacklist."""
@@ -21,17 +27,17 @@ class OrderAuthorization:
 
     def test_trend(self, crypto):
         """Tests if the crypto is in an uptrend on both cover and 1m timeframes."""
-        if crypto.is_uptrend_cover and crypto.is_uptrend_1m:
+        if self.screened(crypto, "is_uptrend_cover") and self.screened(crypto, "is_uptrend_1m"):
             return "passed"
         else:
             return "failed"
 
     def test_support_resistance(self, crypto):
         """Tests if the crypto has valid support and resistance levels."""
-        next_support, next_resistance = crypto.next_support_resistance
+        next_support, next_resistance = crypto.metrics.next_support_resistance
         if next_resistance == 0 or next_support == 0:
             return "failed"
-        if not (crypto.lowest_support_1m < next_support and next_support < crypto.current_price and crypto.current_price < next_resistance):
+        if not (crypto.metrics.lowest_support_1m < next_support and next_support < crypto.current_price and crypto.current_price < next_resistance):
             return "failed"
         else:
             return "passed"
@@ -47,7 +53,7 @@ class OrderAuthorization:
     def test_sr_gap_pct(self, crypto):
         """Tests if the crypto's support_resistance_1m_range_pct is reasonable."""
         # Directly access the crypto's range pct and check if it's unusual
-        if crypto.support_resistance_range_pct < AppConfig.min_sr_gap_pct:
+        if crypto.metrics.support_resistance_range_pct < AppConfig.min_sr_gap_pct:
             return "failed"
         else:
             return "passed"
@@ -59,10 +65,10 @@ class OrderAuthorization:
         """
         if (
             AppConfig.volatility["one_m_low"]
-            <= crypto.volatility_factor_1m
+            <= self.screened(crypto, "volatility_factor_1m")
             <= AppConfig.volatility["one_m_high"]
             and AppConfig.volatility["one_h_low"]
-            <= crypto.volatility_factor_cover
+            <= self.screened(crypto, "volatility_factor_cover")
             <= AppConfig.volatility["one_h_high"]
         ):
             return "passed"
@@ -89,6 +95,9 @@ class OrderAuthorization:
         """
 
         nominees = []
+        self.screen = (
+            AppConfig.bot.products.screen_universe() if AppConfig.market_tensor_enabled else {}
+        )
         if AppConfig.trading_strategy == TradingStrategy.LRP:
             sorted(
                 self.crypto_data.values(),
@@ -137,13 +146,13 @@ class OrderAuthorization:
             ):
                 crypto_is_passed = True
             if crypto_is_passed:
-                next_support, next_resistance = crypto.next_support_resistance
+                next_support, next_resistance = crypto.metrics.next_support_resistance
                 nominees.append(
                     {
                         "symbol": crypto.symbol,
                         "support_level": next_support,
                         "resistance_level": next_resistance,
-                        "support_resistance_1m_range_pct": crypto.support_resistance_1m_range_pct,
+                        "support_resistance_1m_range_pct": crypto.metrics.support_resistance_1m_range_pct,
                         "test_results": test_results,
                     }
                 )
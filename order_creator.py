@@ -7,6 +7,7 @@ from app_config import AppConfig, TradingStrategy
 from loguru import logger
 
 from order_handler import OrderHandler
+from request_scheduler import Lane, RequestScheduler
 from utils import format_float, round_up_to_nearest
 
 
@@ -39,7 +40,9 @@ class OrderCreator:
             amount: The order amount.
         """
         try:
-            order = self.order_manager.exchange.create_order(
+            order = await RequestScheduler.call_async(
+                Lane.ORDER_ACTION,
+                self.order_manager.exchange.create_order,
                 symbol=symbol,
                 type=order_type,
                 side=side,
@@ -83,7 +86,7 @@ class OrderCreator:
         logger.info("Checking for orders...")
         while not AppConfig.is_shutdown_initiated:
             try:
-                self.current_usdt_balance = self.get_usdt_balance()
+                self.current_usdt_balance = await self.get_usdt_balance()
                 number_of_posiible_orders = int(
                     self.current_usdt_balance / AppConfig.ORDER_USDT_AMOUNT
                 )
@@ -183,7 +186,9 @@ class OrderCreator:
                     f"Sell order details: symbol={symbol}, amount={amount}, stop_loss_price={stop_loss_price}, sell_price={sell_price}"
                 )
 
-                order = AppConfig.binance_client.order_oco_sell(
+                order = await RequestScheduler.call_async(
+                    Lane.ORDER_ACTION,
+                    AppConfig.binance_client.order_oco_sell,
                     symbol=symbol,
                     abovePrice=sell_price,
                     quantity=amount,
@@ -237,7 +242,9 @@ class OrderCreator:
                         )
                         try:
                             # Sell at market price
-                            AppConfig.binance_client.create_order(
+                            await RequestScheduler.call_async(
+                                Lane.ORDER_ACTION,
+                                AppConfig.binance_client.create_order,
                                 symbol=symbol,
                                 type="MARKET",
                                 side="SELL",
@@ -356,12 +363,14 @@ class OrderCreator:
                 logger.exception(f"Error calculating limit price: {e}")
                 return None  # Return None on error
 
-    def get_usdt_balance(self):
+    async def get_usdt_balance(self):
         """
         Retrieves the current USDT balance.
         """
         try:
-            balance = self.order_manager.exchange.fetch_balance()
+            balance = await RequestScheduler.call_async(
+                Lane.ORDER_STATUS, self.order_manager.exchange.fetch_balance, weight=20
+            )
             return balance["USDT"]["free"]
         except Exception as e:
             logger.exception("Error fetching USDT balance:")
@@ -18,11 +18,7 @@ class OrderHandler:
         self.sell_order_stop_loss = None
         self.sell_order_limit_marker = None
         self.pair_handling_is_cancelled = False  # Fixed typo
-        crypto_dict = {
-            key: value
-            for key, value in AppConfig.get_crypto(self.symbol).dict().items()
-            if key not in ("klines_1m", "klines_cover")
-        }
+        crypto_dict = AppConfig.get_crypto(self.symbol).serialize(profile="analytics")
 
         self.results = {
             "authorization_time": datetime.now(timezone.utc).isoformat(),  
@@ -73,7 +69,7 @@ class OrderHandler:
                 and not self.pair_handling_is_cancelled
             ):
                 try:
-                    buy_order = self.order_manager.update_order(buy_order_id)
+                    buy_order = await self.order_manager.update_order(buy_order_id)
                     self.buy_order = buy_order
                     if not buy_order:
                         logger.info(
@@ -145,11 +141,11 @@ class OrderHandler:
             try:
                 while not AppConfig.is_shutdown_initiated:
 
-                    sell_order_stop_loss = self.order_manager.update_order(
+                    sell_order_stop_loss = await self.order_manager.update_order(
                         self.sell_order_stop_loss.id
                     )
                     self.sell_order_stop_loss = sell_order_stop_loss
-                    sell_order_limit_marker = self.order_manager.update_order(
+                    sell_order_limit_marker = await self.order_manager.update_order(
                         self.sell_order_limit_marker.id
                     )
                     self.sell_order_limit_marker = sell_order_limit_marker
@@ -239,16 +235,17 @@ class OrderHandler:
 
 
             crypto = AppConfig.get_crypto(self.symbol)
-            crypto.klines_1m = KlineFetcher.fetch_symbol_historical_data(self.symbol, "1m")
-            crypto.klines_cover = KlineFetcher.fetch_symbol_historical_data(self.symbol, AppConfig.cover_kline_interval)
-
-            # Convert klines to lists of lists of floats
-            crypto.klines_1m = [[float(v) for v in kline] for kline in crypto.klines_1m]
-            crypto.klines_cover = [[float(v) for v in kline] for kline in crypto.klines_cover] 
+            klines_1m = await KlineFetcher.fetch_symbol_historical_data(self.symbol, "1m")
+            klines_cover = await KlineFetcher.fetch_symbol_historical_data(self.symbol, AppConfig.cover_kline_interval)
+            if klines_1m is not None and len(klines_1m):
+                crypto.klines_1m.replace(klines_1m)
+            if klines_cover is not None and len(klines_cover):
+                crypto.klines_cover.replace(klines_cover)
 
             await asyncio.sleep(5)
 
-            self.results["trade_time_crypto"] = crypto.dict()
+            crypto.refresh_metrics()
+            self.results["trade_time_crypto"] = crypto.serialize(profile="full")
 
 
             # Create the 'static/pairs_history' folder if it doesn't exist
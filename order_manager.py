@@ -4,6 +4,8 @@ import ccxt
 from app_config import AppConfig
 from loguru import logger
 
+from request_scheduler import Lane, RequestScheduler
+
 
 class BinanceOrder:
     def __init__(self, binance_order_dict):
@@ -36,7 +38,7 @@ class OrderManager:
                 "enableRateLimit": True,
             }
         )
-        self.exchange.load_markets()
+        RequestScheduler.call(Lane.KLINES, self.exchange.load_markets, weight=20)
         if AppConfig.convert_assets:
             self.convert_all_assets_to_quote_currency()
 
@@ -65,8 +67,11 @@ class OrderManager:
             order = self.open_orders.get(order_id)
             if order:
                 # Use AppConfig to access the Binance client and cancel the order
-                AppConfig.binance_client.cancel_order(
-                    symbol=order.symbol, orderId=order_id
+                RequestScheduler.call(
+                    Lane.ORDER_ACTION,
+                    AppConfig.binance_client.cancel_order,
+                    symbol=order.symbol,
+                    orderId=order_id,
                 )
                 order.info.status = "CANCELED"
                 self.remove_order(order_id)
@@ -89,7 +94,9 @@ class OrderManager:
         try:
             order = self.open_orders.get(order_id)
             if order:
-                AppConfig.binance_client.create_order(
+                RequestScheduler.call(
+                    Lane.ORDER_ACTION,
+                    AppConfig.binance_client.create_order,
                     symbol=order.symbol,
                     type="MARKET",
                     side="SELL",
@@ -126,7 +133,9 @@ class OrderManager:
             if "info" not in order_dict:
                 _id = order_dict['orderId']
                 _symbol = order_dict["symbol"]
-                order_dict=self.exchange.fetch_order(_id, _symbol)  
+                order_dict = await RequestScheduler.call_async(
+                    Lane.ORDER_STATUS, self.exchange.fetch_order, _id, _symbol, weight=4
+                )
 
             order.id = order_dict["info"]["orderId"]
             order.symbol = order_dict["info"]["symbol"]
@@ -174,7 +183,7 @@ class OrderManager:
                 return True
         return False
 
-    def update_order(self, order_id):
+    async def update_order(self, order_id):
         """
         Updates an order with the exchange and updates open_orders if it's open.
         Returns the updated BinanceOrder object, or None if the order is not found or closed.
@@ -183,7 +192,9 @@ class OrderManager:
             if order_id in self.open_orders:
                 old_order = self.open_orders[order_id]  # Get the existing order
 
-                updated_order_info = self.exchange.fetch_order(order_id, old_order.symbol)  
+                updated_order_info = await RequestScheduler.call_async(
+                    Lane.ORDER_STATUS, self.exchange.fetch_order, order_id, old_order.symbol, weight=4
+                )
                 updated_order = BinanceOrder(updated_order_info)
                 updated_order.sell_price = old_order.sell_price
                 updated_order.stop_loss_price = old_order.stop_loss_price
@@ -202,7 +213,9 @@ class OrderManager:
         logger.info("Converting all assets to quote currency...")
         try:
 
-            balances = self.exchange.fetch_balance()["info"]["balances"]
+            balances = RequestScheduler.call(
+                Lane.ORDER_STATUS, self.exchange.fetch_balance, weight=20
+            )["info"]["balances"]
         except Exception as e:
             logger.error(f"Error fetching balances: {e}")
             return
@@ -222,7 +235,9 @@ class OrderManager:
                 )
 
                 # Place a market sell order
-                self.exchange.create_order(
+                RequestScheduler.call(
+                    Lane.ORDER_ACTION,
+                    self.exchange.create_order,
                     symbol=symbol.replace("USDT", "/USDT"),
                     type="market",
                     side="sell",
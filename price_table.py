@@ -0,0 +1,93 @@
+import time
+from operator import itemgetter
+
+import numpy as np
+
+_get_symbol = itemgetter("symbol")
+_get_price = itemgetter("price")
+
+
+class PriceTable:
+    """
+    Compact price storage for the tracked symbols: a fixed symbol -> slot
+    index plus contiguous float64 arrays for last price, previous price and
+    update time (ms). Crypto objects bound to a slot read their
+    current_price straight from here.
+    """
+
+    def __init__(self, symbols):
+        self.symbols = list(symbols)
+        self.index = {symbol: slot for slot, symbol in enumerate(self.symbols)}
+        size = len(self.symbols)
+        self.last_price = np.zeros(size, dtype=np.float64)
+        self.previous_price = np.zeros(size, dtype=np.float64)
+        self.update_time = np.zeros(size, dtype=np.float64)
+
+        # Exchange payloads list symbols in a stable order, so the mapping from
+        # payload position to slot is computed once and reused while it holds.
+        self._payload_symbols = None
+        self._payload_positions = None
+        self._payload_slots = None
+
+    @classmethod
+    def for_cryptos(cls, cryptos):
+        """Build a table for a {symbol: Crypto} dict and bind every Crypto to its slot."""
+        table = cls(cryptos.keys())
+        for symbol, crypto in cryptos.items():
+            crypto.bind_price_table(table, table.index[symbol])
+        return table
+
+    def slot(self, symbol):
+        """Return the slot of `symbol`, or -1 when it is not tracked."""
+        return self.index.get(symbol, -1)
+
+    def price(self, symbol):
+        return float(self.last_price[self.index[symbol]])
+
+    def apply_ticker(self, payload, now=None):
+        """
+        Apply a /api/v3/ticker/price payload ([{"symbol", "price"}, ...]) in one
+        vectorized step; untracked symbols are dropped through the precomputed
+        payload index.
+
+        Returns:
+            np.ndarray: Slots whose price changed.
+        """
+        symbols = list(map(_get_symbol, payload))
+        if symbols != self._payload_symbols:
+            self._index_payload(symbols)
+        prices = np.array(list(map(_get_price, payload)), dtype=np.float64)
+        return self.apply(self._payload_slots, prices[self._payload_positions], now)
+
+    def apply_mapping(self, prices, now=None):
+        """
+        Apply a {symbol: price} mapping, such as one decoded stream message.
+
+        Returns:
+            np.ndarray: Slots whose price changed.
+        """
+        slots = np.fromiter(
+            (self.index.get(symbol, -1) for symbol in prices), dtype=np.intp, count=len(prices)
+        )
+        values = np.fromiter(prices.values(), dtype=np.float64, count=len(prices))
+        tracked = slots >= 0
+        return self.apply(slots[tracked], values[tracked], now)
+
+    def apply(self, slots, prices, now=None):
+        """Write `prices` into `slots`, keeping the previous price of the ones that moved."""
+        if now is None:
+            now = time.time() * 1000
+        changed = self.last_price[slots] != prices
+        changed_slots = slots[changed]
+        self.previous_price[changed_slots] = self.last_price[changed_slots]
+        self.last_price[changed_slots] = prices[changed]
+        self.update_time[slots] = now
+        return changed_slots
+
+    def _index_payload(self, symbols):
+        slots = np.fromiter(
+            (self.index.get(symbol, -1) for symbol in symbols), dtype=np.intp, count=len(symbols)
+        )
+        self._payload_symbols = symbols
+        self._payload_positions = np.flatnonzero(slots >= 0)
+        self._payload_slots = slots[self._payload_positions]
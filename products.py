@@ -1,6 +1,7 @@
 import asyncio
 from collections import defaultdict
 import gc
+import time
 
 import ccxt
 import requests
@@ -8,9 +9,15 @@ from loguru import logger
 
 from app_config import AppConfig, TradingStrategy
 from async_price_updater import AsyncPriceUpdater
+from candle_aggregator import CandleAggregator
 from models.crypto import Crypto
 from crypto_tag import CryptoTag
 from kline_fetcher import KlineFetcher
+from kline_refresh_scheduler import KlineRefreshScheduler
+from kline_store import KlineStore
+from market_tensor import MarketTensor
+from price_table import PriceTable
+from request_scheduler import Lane, RequestScheduler
 
 
 class Products:
@@ -18,10 +25,28 @@ class Products:
         self.markets = self.fetch_markets()  # Fetch market data once
         self.symbols_data = self.fetch_symbols_data()[: AppConfig.CRYPTO_LIMIT]
         self.cryptos = self.initialize_cryptos()
+        self.price_table = PriceTable.for_cryptos(self.cryptos)
         self.working_cryptos = None
-        self.kline_fetcher = KlineFetcher(self.cryptos)
+        self.working_scan_time = 0.0  # Seconds taken by the last get_working_cryptos scan
+        self.candle_aggregator = CandleAggregator()
+        self.kline_store = KlineStore() if AppConfig.kline_store_enabled else None
+        if self.kline_store:
+            self.candle_aggregator.on_close(self.kline_store.on_candle_close)
+        self.market_tensors = {
+            interval: MarketTensor(interval)
+            for interval in ("1m", AppConfig.cover_kline_interval)
+        }
+        self.kline_fetcher = KlineFetcher(
+            self.cryptos, candle_aggregator=self.candle_aggregator, store=self.kline_store
+        )
+        self.kline_refresh_scheduler = KlineRefreshScheduler(self, self.kline_fetcher)
         self.crypto_tags = self.initialize_crypto_tags()
-        self.price_updater = AsyncPriceUpdater(self.cryptos, interval=2)
+        self.price_updater = AsyncPriceUpdater(
+            self.cryptos,
+            interval=2,
+            price_table=self.price_table,
+            candle_aggregator=self.candle_aggregator,
+        )
         self.klines_initialized = False
         logger.info(
             f"Initialized Products with {len(self.cryptos)} cryptos and {len(self.crypto_tags)} tags."
@@ -49,7 +74,7 @@ class Products:
                     "enableRateLimit": True,
                 }
             )
-            return exchange.fetch_markets()
+            return RequestScheduler.call(Lane.KLINES, exchange.fetch_markets, weight=20)
         except Exception as e:
             logger.error(f"Error fetching markets: {e}")
             return []
@@ -122,16 +147,19 @@ class Products:
             dict: A dictionary where the keys are crypto symbols, and the values are Crypto objects.
         """
         try:
+            start = time.perf_counter()
             # Filter cryptos based on the condition
             working_cryptos = {
                 symbol: crypto
                 for symbol, crypto in self.cryptos.items()
                 if crypto.zones.get('supply_zone_before_immediate_demand_zone', False)
             }
+            self.working_scan_time = time.perf_counter() - start
 
             # Logging the results
             logger.info(
-                f"Identified {len(working_cryptos)} working cryptos: {list(working_cryptos.keys())}"
+                f"Identified {len(working_cryptos)} working cryptos in "
+                f"{self.working_scan_time * 1000:.1f} ms: {list(working_cryptos.keys())}"
             )
 
             return working_cryptos  # Return the dictionary of working cryptos
@@ -150,6 +178,52 @@ class Products:
                 return market
         return None
 
+    def refresh_market_tensors(self):
+        """
+        Sync the 1m and cover market tensors with the cryptos' kline buffers.
+        Only buffers that changed since the last refresh are copied (ticks,
+        closed candles and REST refreshes all bump the buffer version).
+
+        Returns:
+            dict: {interval: MarketTensor}
+        """
+        for tensor in self.market_tensors.values():
+            tensor.refresh(self.cryptos)
+        return self.market_tensors
+
+    def screen_universe(self):
+        """
+        Evaluate the trend and volatility screens for every crypto at once on
+        the market tensors.
+
+        Returns:
+            dict: {symbol: {"is_uptrend_1m", "is_uptrend_cover",
+                  "volatility_factor_1m", "volatility_factor_cover",
+                  "calculate_ma_rsi"}}
+        """
+        tensors = self.refresh_market_tensors()
+        tensor_1m = tensors["1m"]
+        tensor_cover = tensors[AppConfig.cover_kline_interval]
+        columns = {
+            "is_uptrend_1m": tensor_1m.ma_crossover(5, 20).tolist(),
+            "is_uptrend_cover": tensor_cover.ma_crossover(5, 20).tolist(),
+            "volatility_factor_1m": tensor_1m.volatility().tolist(),
+            "volatility_factor_cover": tensor_cover.volatility().tolist(),
+        }
+        ma_rsi = {
+            "ma_1m": tensor_1m.moving_average(20).tolist(),
+            "ma_cover": tensor_cover.moving_average(20).tolist(),
+            "rsi_1m": tensor_1m.rsi(14).tolist(),
+            "rsi_cover": tensor_cover.rsi(14).tolist(),
+        }
+        screen = {}
+        for row, symbol in enumerate(tensor_1m.symbols):
+            screen[symbol] = {name: values[row] for name, values in columns.items()}
+            screen[symbol]["calculate_ma_rsi"] = {
+                name: values[row] for name, values in ma_rsi.items()
+            }
+        return screen
+
     def initialize_crypto_tags(self):
         """
         Initialize CryptoTag objects for each unique tag.
@@ -163,7 +237,7 @@ class Products:
 
     def fetch_symbols_data(self):
         try:
-            data = AppConfig.binance_client.get_products()
+            data = RequestScheduler.call(Lane.KLINES, AppConfig.binance_client.get_products)
             return [
                 product
                 for product in data.get("data", [])
@@ -177,10 +251,19 @@ class Products:
         """
         Update the Klines for all cryptos every 30 minutes by default,
         or for the top 10 working cryptos every 10 seconds if the strategy is LRP.
+        With the refresh scheduler enabled, each symbol is instead refreshed
+        on the period of its priority tier (see KlineRefreshScheduler).
         """
         await self.update_all_klines()
         self.working_cryptos = self.get_working_cryptos()
-        
+
+        if (
+            AppConfig.kline_refresh_scheduler_enabled
+            and AppConfig.trading_strategy != TradingStrategy.FLASH
+        ):
+            await self.kline_refresh_scheduler.run()
+            return
+
         while not AppConfig().is_shutdown_initiated:  # Ensure the loop stops on shutdown
             try:
                 if AppConfig.trading_strategy == TradingStrategy.LRP:
@@ -200,7 +283,8 @@ class Products:
                 logger.error(f"Error updating Klines: {e}")
 
             if AppConfig.trading_strategy == TradingStrategy.FLASH:
-                AppConfig.bot.order_manager.convert_all_assets_to_quote_currency()
+                # Blocking exchange calls; keep their budget waits off the event loop.
+                await asyncio.to_thread(AppConfig.bot.order_manager.convert_all_assets_to_quote_currency)
 
     async def update_all_klines(self, cryptos = "all"):
         if cryptos == "all":
@@ -208,22 +292,25 @@ class Products:
         elif cryptos == "working":
             self.kline_fetcher.cryptos = self.working_cryptos 
 
-        self.kline_fetcher.save_historical_data_concurrently()
+        await self.kline_fetcher.save_historical_data_concurrently()
         if cryptos == "all":
             self.cryptos = self.kline_fetcher.cryptos
         elif cryptos == "working":
             self.working_cryptos = self.kline_fetcher.cryptos
 
         self.klines_initialized = True
+        self.update_last_volumes(self.cryptos.values())
 
-        for symbol, crypto in self.cryptos.items():
+    def update_last_volumes(self, cryptos):
+        """Set each crypto's last_volume to its latest cover volume in quote currency."""
+        for crypto in cryptos:
             try:
                # Assuming klines_cover is a list of klines, each kline being a list itself
                 last_cover_kline = crypto.klines_cover[-1]
                 last_volume = last_cover_kline[5]  # Assuming volume is the 6th element in a kline
                 crypto.last_volume = last_volume * crypto.current_price
             except (IndexError, KeyError) as e:
-                logger.error(f"Error updating last_volume for {symbol}: {e}")
+                logger.error(f"Error updating last_volume for {crypto.symbol}: {e}")
 
 
     async def start_price_updater(self):
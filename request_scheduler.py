@@ -0,0 +1,175 @@
+import asyncio
+import time
+from enum import IntEnum
+
+from app_config import AppConfig
+from loguru import logger
+
+WEIGHT_HEADERS = ("x-mbx-used-weight-1m", "x-mbx-used-weight")
+
+
+class Lane(IntEnum):
+    """Priority classes of exchange requests, highest priority first."""
+
+    ORDER_ACTION = 0  # Create / cancel orders, OCO, market sells
+    ORDER_STATUS = 1  # Order lookups and balances
+    PRICES = 2  # Ticker snapshots
+    KLINES = 3  # Bulk kline and market-data fetches
+
+
+class RequestWeight:
+    """
+    Client-side view of Binance's per-minute request weight.
+
+    Weight is reserved before a request is sent and replaced by the server's
+    count from the X-MBX-USED-WEIGHT-1M header when the response arrives. A
+    429/418 blocks every request for its Retry-After.
+    """
+
+    def __init__(self, limit=None, headroom=None):
+        self.limit = limit or AppConfig.binance_weight_limit
+        self.headroom = AppConfig.binance_weight_headroom if headroom is None else headroom
+        self.used = 0
+        self.minute = 0  # Epoch minute `used` belongs to
+        self.blocked_until = 0.0
+
+    def current(self, now=None):
+        """Weight used in the current minute."""
+        now = time.time() if now is None else now
+        return self.used if self.minute == int(now // 60) else 0
+
+    def delay(self, weight, share=1.0, now=None):
+        """
+        Seconds to wait before `weight` can be spent without going over
+        `share` of the usable budget, 0 when it fits now.
+        """
+        now = time.time() if now is None else now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.current(now) + weight > self.limit * (1 - self.headroom) * share:
+            return 60 - now % 60  # The window resets on the minute
+        return 0
+
+    def reserve(self, weight):
+        now = time.time()
+        self.used = self.current(now) + weight
+        self.minute = int(now // 60)
+
+    def record(self, headers, status=None):
+        """Update the budget from a response's weight header and status."""
+        now = time.time()
+        headers = {name.lower(): value for name, value in headers.items()}
+        for name in WEIGHT_HEADERS:
+            if name in headers:
+                self.used = int(headers[name])
+                self.minute = int(now // 60)
+                break
+        if status in (418, 429):
+            retry_after = float(headers.get("retry-after", 60))
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            logger.warning(f"Rate limited (HTTP {status}), backing off for {retry_after:.0f}s")
+
+
+class RequestScheduler:
+    """
+    Single gate for every exchange request: the aiohttp market-data client,
+    the ccxt instances and the python-binance client all spend one shared
+    weight budget.
+
+    Each lane may only use its share of the budget (AppConfig.request_lane_shares),
+    and a lane also waits while a higher-priority lane has requests waiting, so
+    bulk klines are shed first, then prices, then order status, and order
+    actions keep the last slice of the budget to themselves.
+    """
+
+    weight = RequestWeight()
+    waiting = {lane: 0 for lane in Lane}
+
+    @classmethod
+    def share(cls, lane):
+        return AppConfig.request_lane_shares[lane.name]
+
+    @classmethod
+    def outranked(cls, lane):
+        """True while a higher-priority lane has requests waiting."""
+        return any(cls.waiting[other] for other in Lane if other < lane)
+
+    @classmethod
+    async def acquire(cls, lane, weight=1, shed=False):
+        """
+        Wait until `lane` may spend `weight` and reserve it.
+
+        With `shed`, return False instead of waiting, for requests that are
+        worthless once late (e.g. a price snapshot the next tick replaces).
+        """
+        cls.waiting[lane] += 1
+        try:
+            while True:
+                delay = cls.weight.delay(weight, cls.share(lane))
+                if delay == 0 and not cls.outranked(lane):
+                    cls.weight.reserve(weight)
+                    return True
+                if shed:
+                    logger.debug(f"Shedding {lane.name} request, weight {cls.weight.current()}")
+                    return False
+                if delay > 1:
+                    logger.warning(
+                        f"{lane.name} lane waiting {delay:.1f}s, weight "
+                        f"{cls.weight.current()}/{cls.weight.limit}"
+                    )
+                await asyncio.sleep(min(delay, 1) if delay else AppConfig.request_scheduler_poll)
+        finally:
+            cls.waiting[lane] -= 1
+
+    @classmethod
+    def acquire_sync(cls, lane, weight=1):
+        """
+        Blocking acquire for synchronous exchange clients outside the event
+        loop (startup and shutdown); coroutines use `call_async`. Waiters are
+        counted like async ones, so lower lanes yield to them.
+        """
+        cls.waiting[lane] += 1
+        try:
+            while True:
+                delay = cls.weight.delay(weight, cls.share(lane))
+                if delay == 0 and not cls.outranked(lane):
+                    cls.weight.reserve(weight)
+                    return
+                if delay > 0:
+                    logger.warning(f"{lane.name} lane blocked for {delay:.1f}s by the request budget")
+                time.sleep(min(delay, 1) if delay else AppConfig.request_scheduler_poll)
+        finally:
+            cls.waiting[lane] -= 1
+
+    @classmethod
+    def call(cls, lane, func, *args, weight=1, **kwargs):
+        """
+        Run a synchronous ccxt / python-binance call through the budget and
+        record the weight header of its response.
+        """
+        cls.acquire_sync(lane, weight)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            cls.record_client(getattr(func, "__self__", None))
+
+    @classmethod
+    async def call_async(cls, lane, func, *args, weight=1, **kwargs):
+        """Like `call`, but waits on the loop and runs the call in a worker thread."""
+        await cls.acquire(lane, weight)
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        finally:
+            cls.record_client(getattr(func, "__self__", None))
+
+    @classmethod
+    def record_client(cls, client):
+        """Feed the last response headers of a ccxt or python-binance client into the budget."""
+        headers = getattr(client, "last_response_headers", None)  # ccxt
+        status = None
+        response = getattr(client, "response", None)  # python-binance
+        if headers is None and response is not None:
+            headers = response.headers
+            status = response.status_code
+        if headers:
+            cls.weight.record(headers, status)
@@ -0,0 +1,61 @@
+from collections import deque
+
+from kline_buffer import KlineFollower
+
+
+class RollingRange(KlineFollower):
+    """
+    Rolling high/low of a kline series kept with monotonic deques, so following
+    ticks and candle rolls costs amortized O(1) instead of a max/min rescan.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._highs = deque()  # (open_time, high), highs strictly decreasing
+        self._lows = deque()  # (open_time, low), lows strictly increasing
+
+    @property
+    def high(self):
+        return self._highs[0][1] if self._highs else 0.0
+
+    @property
+    def low(self):
+        return self._lows[0][1] if self._lows else 0.0
+
+    def range_pct(self):
+        """(high - low) / low in percent, or 0 when the low is 0."""
+        low = self.low
+        return ((self.high - low) / low) * 100 if low != 0 else 0
+
+    def _reset(self):
+        self._highs.clear()
+        self._lows.clear()
+
+    def _commit(self, candles):
+        for kline in candles:
+            self._push(kline)
+
+    def _update(self, klines):
+        if len(klines):
+            self._push(klines[-1])
+            self._expire(klines[0][0])
+
+    def _push(self, kline):
+        # The open candle's high only rises and its low only falls, so dropping
+        # every dominated entry (including its own older value) keeps the
+        # deques monotonic.
+        open_time, high, low = int(kline[0]), float(kline[2]), float(kline[3])
+        highs, lows = self._highs, self._lows
+        while highs and (highs[-1][1] <= high or highs[-1][0] == open_time):
+            highs.pop()
+        highs.append((open_time, high))
+        while lows and (lows[-1][1] >= low or lows[-1][0] == open_time):
+            lows.pop()
+        lows.append((open_time, low))
+
+    def _expire(self, first_open_time):
+        """Drop extrema of candles that were trimmed off the front of the series."""
+        while self._highs and self._highs[0][0] < first_open_time:
+            self._highs.popleft()
+        while self._lows and self._lows[0][0] < first_open_time:
+            self._lows.popleft()
@@ -4,13 +4,28 @@ from flask import Blueprint, redirect, render_template, request, session, url_fo
 from loguru import logger
 
 from app_config import AppConfig
+from models.crypto import Crypto
 
 chart_blueprint = Blueprint('charts', __name__)
 
 
+def chart_zones(zones):
+    """The serialized zones in the {"demand_zones", "supply_zones"} plot band shape of the chart page."""
+    chart = {"demand_zones": [], "supply_zones": []}
+    for zone in zones.values():
+        if zone:
+            chart[f"{zone['zone_type']}_zones"].append(
+                {"type": zone["zone_type"], "start_price": zone["low"], "end_price": zone["high"]}
+            )
+    return chart
+
+
 @chart_blueprint.route("/chart")
 def crypto_chart():
-    """Serves the crypto_chart.html template with details for the given symbol."""
+    """
+    Serves the crypto_chart.html template with details for the given symbol:
+    the chart profile (klines and zones the page plots), plus any `fields`.
+    """
     try:
         symbol = request.args.get('symbol')
         if not symbol:
@@ -24,7 +39,16 @@ def crypto_chart():
         if not crypto_details:
             return "Crypto symbol not found", 404
 
-        return render_template("crypto_chart.html", symbol=symbol, crypto=crypto_details.dict())
+        try:
+            fields = Crypto.SERIALIZATION_PROFILES["chart"]
+            if request.args.get("fields"):
+                fields = fields | Crypto.serialization_fields(request.args.get("fields"))
+            crypto = crypto_details.serialize(fields=fields)
+        except ValueError as e:
+            return str(e), 400
+        crypto["zones_cover"] = chart_zones(crypto["zones"])
+
+        return render_template("crypto_chart.html", symbol=symbol, crypto=crypto)
 
     except Exception as e:
         logger.error(f"Error getting crypto_chart.html: {e}")
@@ -1,5 +1,5 @@
 from http.client import HTTPException
-from flask import Blueprint, jsonify, redirect, session, url_for
+from flask import Blueprint, jsonify, redirect, request, session, url_for
 from loguru import logger
 
 from app_config import AppConfig
@@ -10,10 +10,17 @@ crypto_blueprint = Blueprint("crypto", __name__)
 def get_working_cryptos_route():
     return AppConfig.bot.products.working_cryptos.items()
 
+@crypto_blueprint.route("/klines_refresh_status", methods=["GET"])
+def get_klines_refresh_status():
+    """Queue depth, lag and tier sizes of the per-symbol kline refresh scheduler."""
+    return jsonify(AppConfig.bot.products.kline_refresh_scheduler.metrics())
+
 @crypto_blueprint.route("/symbol/<string:symbol>")
 def get_crypto_by_symbol(symbol):
     """
-    Fetch crypto data for a specific symbol, excluding klines_1m and klines_cover attributes.
+    Fetch crypto data for a specific symbol. Pass `fields` (comma-separated
+    field names) or `profile` (summary, analytics or full); the default is
+    the analytics profile, which leaves klines_1m and klines_cover out.
     """
     try:
 
@@ -21,8 +28,13 @@ def get_crypto_by_symbol(symbol):
         if not crypto:
             raise HTTPException(status_code=404, detail=f"Crypto symbol {symbol} not found")
 
-        # Exclude klines_1m and klines_cover from the crypto data
-        crypto_data = {k: v for k, v in crypto.dict().items() if k not in ("klines_1m", "klines_cover")}
+        try:
+            crypto_data = crypto.serialize(
+                fields=request.args.get("fields"),
+                profile=request.args.get("profile", "analytics"),
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
         return jsonify(crypto_data)
 
@@ -54,7 +66,7 @@ def get_crypto_klines(kline_type, symbol):  # Added symbol parameter
             raise HTTPException(status_code=404, detail=f"Crypto '{symbol}' not found")
 
         klines_data = getattr(crypto, f"klines_{kline_type}")
-        return jsonify(klines_data)
+        return jsonify(klines_data.tolist())
 
     except Exception as e:
         logger.error(f"Error fetching klines data: {e}")
@@ -14,16 +14,17 @@ def get_crypto_volatility_html():
     try:
         crypto_data = []
         for crypto in AppConfig.bot.products.cryptos.values():
+            metrics = crypto.metrics
             crypto_data.append(
                 {
                     "symbol": crypto.symbol,
-                    "volatility_factor_1m": crypto.volatility_factor_1m,
-                    "volatility_factor_cover": crypto.volatility_factor_cover,
-                    "next_support": crypto.next_support_resistance[0],
+                    "volatility_factor_1m": metrics.volatility_factor_1m,
+                    "volatility_factor_cover": metrics.volatility_factor_cover,
+                    "next_support": metrics.next_support_resistance[0],
                     "current_price": crypto.current_price,
-                    "next_resistance": crypto.next_support_resistance[1],
-                    "sr_gap_pct": crypto.support_resistance_range_pct,
-                    "lowest_support_1m": crypto.lowest_support_1m
+                    "next_resistance": metrics.next_support_resistance[1],
+                    "sr_gap_pct": metrics.support_resistance_range_pct,
+                    "lowest_support_1m": metrics.lowest_support_1m
                 }
             )
 
@@ -0,0 +1,186 @@
+import math
+from collections import deque
+
+from kline_buffer import KlineFollower
+
+NAN = float("nan")
+
+
+class StreamingSMA:
+    """
+    Simple moving average updated in O(1). Closed values are committed with
+    `push`; `value(current)` adds the still-open value without committing it.
+    Matches ta.trend.SMAIndicator (NaN until `period` values exist).
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.window = deque(maxlen=period - 1)  # Last period-1 committed values
+        self.total = 0.0
+        self._pushes = 0
+
+    def push(self, value):
+        if self.window.maxlen == 0:
+            return
+        if len(self.window) == self.window.maxlen:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+        self._pushes += 1
+        if self._pushes % (self.window.maxlen * 64) == 0:
+            self.total = math.fsum(self.window)  # Shed accumulated rounding drift
+
+    def value(self, current):
+        if len(self.window) < self.period - 1:
+            return NAN
+        return (self.total + current) / self.period
+
+
+class StreamingEMA:
+    """
+    Exponential moving average updated in O(1), with the recursion of
+    pandas' ewm(adjust=False): y0 = x0, y = y + alpha * (x - y). NaN until
+    `min_periods` values were seen, as in ta's EMA helpers.
+    """
+
+    def __init__(self, period=None, alpha=None, min_periods=None):
+        self.alpha = alpha if alpha is not None else 2 / (period + 1)
+        self.min_periods = min_periods if min_periods is not None else period
+        self.state = None
+        self.count = 0
+
+    def push(self, value):
+        self.state = self.peek(value)
+        self.count += 1
+
+    def peek(self, value):
+        """EMA after `value` without committing it."""
+        if self.state is None:
+            return value
+        return self.state + self.alpha * (value - self.state)
+
+    def value(self, current):
+        if self.count + 1 < self.min_periods:
+            return NAN
+        return self.peek(current)
+
+    @property
+    def committed(self):
+        """EMA of the committed values only."""
+        if self.state is None or self.count < self.min_periods:
+            return NAN
+        return self.state
+
+
+class StreamingRSI:
+    """
+    Wilder RSI (alpha = 1/period) updated in O(1), matching
+    ta.momentum.RSIIndicator, which counts the first close as a zero change.
+    """
+
+    def __init__(self, period=14):
+        self.period = period
+        self.previous_close = None
+        self.gains = StreamingEMA(alpha=1 / period, min_periods=period)
+        self.losses = StreamingEMA(alpha=1 / period, min_periods=period)
+
+    def push(self, close):
+        change = self._change(close)
+        self.gains.push(max(change, 0.0))
+        self.losses.push(max(-change, 0.0))
+        self.previous_close = close
+
+    def _change(self, close):
+        return 0.0 if self.previous_close is None else close - self.previous_close
+
+    def value(self, current):
+        change = self._change(current)
+        gain = self.gains.value(max(change, 0.0))
+        loss = self.losses.value(max(-change, 0.0))
+        if math.isnan(gain) or math.isnan(loss):
+            return NAN
+        if loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + gain / loss)
+
+
+class StreamingMACD:
+    """
+    MACD line and signal updated in O(1), matching ta.trend.MACD: the signal
+    EMA only starts once the slow EMA has `slow` values.
+    """
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+
+    def push(self, close):
+        self.fast.push(close)
+        self.slow.push(close)
+        macd = self.fast.committed - self.slow.committed
+        if not math.isnan(macd):
+            self.signal.push(macd)
+
+    def value(self, current):
+        """(macd, signal) including the open value `current`."""
+        macd = self.fast.value(current) - self.slow.value(current)
+        if math.isnan(macd):
+            return NAN, NAN
+        return macd, self.signal.value(macd)
+
+    @property
+    def committed(self):
+        """(macd, signal) as of the last committed value."""
+        return self.fast.committed - self.slow.committed, self.signal.committed
+
+
+class StreamingIndicators(KlineFollower):
+    """
+    MA, RSI and MACD of one kline series, kept up to date through `sync`.
+
+    The open candle's close is applied on the fly, so following ticks and
+    candle rolls is O(1). Windows run over all history seen since the last
+    replay instead of only the buffer window, which only differs from ta on
+    the buffer by the negligible weight of EMA start-up.
+    """
+
+    def __init__(self, ma_periods=(5, 20), rsi_period=14, macd_windows=(12, 26, 9)):
+        super().__init__()
+        self.ma_periods = ma_periods
+        self.rsi_period = rsi_period
+        self.macd_windows = macd_windows
+        self._reset()
+
+    def _reset(self):
+        self._ma = {period: StreamingSMA(period) for period in self.ma_periods}
+        self._rsi = StreamingRSI(self.rsi_period)
+        self._macd = StreamingMACD(*self.macd_windows)
+        self._current = NAN
+
+    def _commit(self, candles):
+        for close in candles["close"].tolist():
+            self._push(close)
+
+    def _update(self, klines):
+        self._current = float(klines[-1][4]) if len(klines) else NAN
+
+    def _push(self, close):
+        for ma in self._ma.values():
+            ma.push(close)
+        self._rsi.push(close)
+        self._macd.push(close)
+
+    def ma(self, period):
+        return self._ma[period].value(self._current)
+
+    def rsi(self):
+        return self._rsi.value(self._current)
+
+    def macd(self):
+        """(macd, signal) of the latest candle."""
+        return self._macd.value(self._current)
+
+    def previous_macd(self):
+        """(macd, signal) of the candle before the latest one."""
+        return self._macd.committed
@@ -3,18 +3,32 @@ import pandas as pd
 import ta
 
 from app_config import AppConfig  # Assuming you have the 'ta' library installed
+from indicator_kernels import IndicatorKernels
+from kline_buffer import KLINE_FIELDS, KlineBuffer
+from level_clustering import LevelClustering
 
 
 class TechnicalAnalysis:
+    @staticmethod
+    def column(klines, name):
+        """
+        Return one kline column as a NumPy array: a zero-copy view for a
+        KlineBuffer, or built from a list of raw klines.
+        """
+        if isinstance(klines, KlineBuffer):
+            return klines.column(name)
+        index = KLINE_FIELDS.index(name)
+        return np.array([kline[index] for kline in klines], dtype=np.float64)
+
     @staticmethod
     def calculate_ma(klines, period):
-        close_prices = [kline[4] for kline in klines]  # Extract close prices
+        close_prices = TechnicalAnalysis.column(klines, "close")  # Extract close prices
         close_prices_series = pd.Series(close_prices)  # Convert to Pandas Series
         return ta.trend.SMAIndicator(close_prices_series, window=period).sma_indicator()
 
     @staticmethod
     def calculate_rsi(klines, period=14):
-        close_prices = [kline[4] for kline in klines]  # Extract close prices
+        close_prices = TechnicalAnalysis.column(klines, "close")  # Extract close prices
         close_prices_series = pd.Series(close_prices)  # Convert to Pandas Series
         return ta.momentum.RSIIndicator(close_prices_series, window=period).rsi()
     
@@ -35,7 +49,7 @@ class TechnicalAnalysis:
                 - "signal": Pandas Series representing the Signal line.
                 - "histogram": Pandas Series representing the MACD histogram.
         """
-        close_prices = [kline[4] for kline in klines]  # Extract close prices
+        close_prices = TechnicalAnalysis.column(klines, "close")  # Extract close prices
         close_prices_series = pd.Series(close_prices)  # Convert to Pandas Series
 
         macd = ta.trend.MACD(
@@ -87,9 +101,9 @@ class TechnicalAnalysis:
         if not klines or len(klines[0]) < 4:
             raise ValueError("Invalid kline data provided.")
 
-        closes = np.array([kline[4] for kline in klines])  # Get closing prices
-        highs = np.array([kline[2] for kline in klines])
-        lows = np.array([kline[3] for kline in klines])
+        closes = TechnicalAnalysis.column(klines, "close")  # Get closing prices
+        highs = TechnicalAnalysis.column(klines, "high")
+        lows = TechnicalAnalysis.column(klines, "low")
 
         # Adjust swing shift based on timeframe
         if timeframe == AppConfig.cover_kline_interval:
@@ -97,34 +111,23 @@ class TechnicalAnalysis:
         else:  
             swing_shift = 1
 
-        # Identify swing highs and lows using NumPy
-        high_swing_indices = np.where(
-            (highs > np.roll(highs, swing_shift)) & (highs > np.roll(highs, -swing_shift))
-        )[0]
-        low_swing_indices = np.where(
-            (lows < np.roll(lows, swing_shift)) & (lows < np.roll(lows, -swing_shift))
-        )[0]
-
-
-        # Filter close resistance levels, keeping only the highest
-        resistance_levels = []
-        temp_level = None
-        for level in highs[high_swing_indices]:
-            if temp_level is None:
-                temp_level = level
-            elif level > temp_level:
-                temp_level = level
-            elif level < temp_level - 10:  # Adjust 10 to control closeness threshold
-                resistance_levels.append(temp_level)
-                temp_level = level
-        if temp_level is not None:
-            resistance_levels.append(temp_level)
-
-        resistance_levels = TechnicalAnalysis._filter_close_levels(
-            highs[high_swing_indices], closes, AppConfig.resistance_closeness_threshold_pct, "resistance"
+        # Identify swing highs and lows using NumPy; edges without a
+        # neighbour on both sides are never swings (no wraparound).
+        swing_highs, swing_lows = IndicatorKernels.swing_points(
+            highs[np.newaxis], lows[np.newaxis], swing_shift
+        )
+        high_swing_indices = np.flatnonzero(swing_highs[0])
+        low_swing_indices = np.flatnonzero(swing_lows[0])
+
+        # Sort the closes once for both touch counts.
+        sorted_closes = np.sort(closes)
+        resistance_levels = LevelClustering.cluster(
+            highs[high_swing_indices], closes, AppConfig.resistance_closeness_threshold_pct,
+            "resistance", sorted_closes=sorted_closes,
         )
-        support_levels = TechnicalAnalysis._filter_close_levels(
-            lows[low_swing_indices], closes, AppConfig.support_closeness_threshold_pct, "support"
+        support_levels = LevelClustering.cluster(
+            lows[low_swing_indices], closes, AppConfig.support_closeness_threshold_pct,
+            "support", sorted_closes=sorted_closes,
         )
 
         # Convert strength values to int
@@ -138,23 +141,4 @@ class TechnicalAnalysis:
         """
         Filters close levels and calculates strength.
         """
-        filtered_levels = []
-        temp_level = None
-        temp_strength = 0
-        threshold_multiplier = 1 - threshold_pct / 100 if level_type == "resistance" else 1 + threshold_pct / 100
-        for level in levels:
-            if temp_level is None:
-                temp_level = level
-                temp_strength = np.sum(np.isclose(closes, level, rtol=threshold_pct/100))  # Count close closes
-            elif (level_type == "resistance" and level > temp_level) or \
-                 (level_type == "support" and level < temp_level):
-                temp_level = level
-                temp_strength = np.sum(np.isclose(closes, level, rtol=threshold_pct/100))  # Count close closes
-            elif (level_type == "resistance" and level < temp_level * threshold_multiplier) or \
-                 (level_type == "support" and level > temp_level * threshold_multiplier):
-                filtered_levels.append((temp_level, temp_strength))
-                temp_level = level
-                temp_strength = np.sum(np.isclose(closes, level, rtol=threshold_pct/100))  # Count close closes
-        if temp_level is not None:
-            filtered_levels.append((temp_level, temp_strength))
-        return filtered_levels
+        return LevelClustering.cluster(levels, closes, threshold_pct, level_type)
@@ -0,0 +1,135 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app_config import AppConfig
+from async_price_updater import AsyncPriceUpdater
+
+SYMBOLS = ("AAAUSDT", "BBBUSDT")
+
+
+class FakeConnection:
+    """Stand-in stream connection: hands out the queued frames, then drops."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    async def recv(self):
+        await asyncio.sleep(0)
+        if not self.frames:
+            raise ConnectionResetError("connection dropped")
+        return self.frames.pop(0)
+
+
+class FakeSession:
+    """Async context manager of one connection attempt; `frames` None refuses it."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    async def __aenter__(self):
+        if self.frames is None:
+            raise ConnectionRefusedError("connection refused")
+        return FakeConnection(self.frames)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeTransport:
+    """
+    Stand-in for websockets.connect. Each connection serves the next entry of
+    `sessions`: a list of frames, or None for a connection that is refused.
+    """
+
+    def __init__(self, sessions):
+        self.sessions = list(sessions)
+        self.urls = []
+
+    def __call__(self, url):
+        self.urls.append(url)
+        return FakeSession(self.sessions.pop(0) if self.sessions else None)
+
+
+def mini_ticker_frame(prices):
+    """A combined-stream !miniTicker@arr frame for {symbol: price}."""
+    events = [{"e": "24hrMiniTicker", "s": symbol, "c": str(price)} for symbol, price in prices.items()]
+    return json.dumps({"stream": "!miniTicker@arr", "data": events})
+
+
+@pytest.fixture
+def updater_for(make_crypto, monkeypatch):
+    monkeypatch.setattr(AppConfig, "price_ingestion_mode", "stream")
+    monkeypatch.setattr(AppConfig, "price_stream_book_ticker", False)
+    monkeypatch.setattr(AppConfig, "is_shutdown_initiated", False)
+
+    def make(transport):
+        cryptos = {symbol: make_crypto(symbol, seed=2 * row) for row, symbol in enumerate(SYMBOLS)}
+        monkeypatch.setattr(AppConfig, "bot", SimpleNamespace(products=SimpleNamespace(cryptos=cryptos)))
+        return AsyncPriceUpdater(cryptos, interval=0, transport=transport)
+
+    return make
+
+
+def test_mini_ticker_frames_reach_the_price_table(updater_for):
+    frames = [
+        mini_ticker_frame({"AAAUSDT": 101.5, "BBBUSDT": 99.25}),
+        mini_ticker_frame({"AAAUSDT": 102.0, "UNTRACKED": 5.0}),
+    ]
+    transport = FakeTransport([frames])
+    updater = updater_for(transport)
+
+    asyncio.run(updater.stream_prices())
+
+    assert transport.urls == [f"{AppConfig.price_stream_url}?streams=!miniTicker@arr"]
+    assert updater.price_table.price("AAAUSDT") == 102.0
+    assert updater.price_table.price("BBBUSDT") == 99.25
+    assert updater.cryptos["AAAUSDT"].current_price == 102.0
+    # The open candles follow the stream.
+    assert float(updater.cryptos["AAAUSDT"].klines_1m[-1][4]) == 102.0
+    assert updater.stream_connected is False  # The dropped connection was noticed
+
+
+def test_dropped_stream_falls_back_to_polling_with_backoff(updater_for, monkeypatch):
+    monkeypatch.setattr(AppConfig, "price_stream_max_reconnect_delay", 4)
+    # Connected (then dropped), refused twice, connected again (then dropped).
+    transport = FakeTransport(
+        [
+            [mini_ticker_frame({"AAAUSDT": 101.0})],
+            None,
+            None,
+            [mini_ticker_frame({"AAAUSDT": 103.0})],
+        ]
+    )
+    updater = updater_for(transport)
+    polls = []
+
+    async def poll_prices(duration=None):
+        polls.append((duration, updater.stream_connected))
+        if len(polls) == 4:
+            monkeypatch.setattr(AppConfig, "is_shutdown_initiated", True)
+
+    updater.poll_prices = poll_prices
+    asyncio.run(updater.update_prices())
+
+    # Every drop polls REST while the stream is down, for a delay that
+    # doubles up to the cap and resets once a connection succeeds.
+    assert polls == [(1, False), (2, False), (4, False), (1, False)]
+    assert len(transport.urls) == 4
+    assert updater.price_table.price("AAAUSDT") == 103.0
+
+
+def test_polling_applies_rest_prices(updater_for):
+    updater = updater_for(FakeTransport([]))
+    payload = [{"symbol": "AAAUSDT", "price": "104.5"}, {"symbol": "BBBUSDT", "price": "98.0"}]
+
+    async def fetch_latest_prices():
+        return payload
+
+    updater.fetch_latest_prices = fetch_latest_prices
+    asyncio.run(updater.poll_prices(duration=0))
+
+    assert updater.price_table.price("AAAUSDT") == 104.5
+    assert updater.price_table.price("BBBUSDT") == 98.0
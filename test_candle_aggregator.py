@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from candle_aggregator import CandleAggregator, aggregate_klines, bucket_start, interval_to_ms
+from kline_buffer import KlineBuffer
+
+MONDAY = 1_704_067_200_000  # 2024-01-01 00:00 UTC, the open time of a Binance 1w candle
+DAY_MS = 86_400_000
+
+
+@pytest.mark.parametrize("offset_days", [0, 1, 3, 6])
+def test_weekly_buckets_open_on_monday(offset_days):
+    week_ms = interval_to_ms("1w")
+    timestamp = MONDAY + offset_days * DAY_MS + 12_345
+    assert bucket_start(timestamp, week_ms) == MONDAY
+    assert bucket_start(np.array([timestamp, timestamp + week_ms]), week_ms).tolist() == [MONDAY, MONDAY + week_ms]
+
+
+@pytest.mark.parametrize("interval", ["1m", "15m", "4h", "1d"])
+def test_other_buckets_align_on_the_epoch(interval):
+    interval_ms = interval_to_ms(interval)
+    timestamp = MONDAY + 3 * DAY_MS + 12_345_678
+    assert bucket_start(timestamp, interval_ms) == timestamp - timestamp % interval_ms
+
+
+def test_weekly_aggregate_opens_on_monday(kline_series):
+    series = kline_series(0, interval_ms=DAY_MS)
+    rows = series.rows(21)
+    for day, row in enumerate(rows):
+        row[0] = MONDAY + day * DAY_MS
+    candles = aggregate_klines(KlineBuffer.from_rows(rows, 21), "1w")
+    assert candles["open_time"].tolist() == [MONDAY, MONDAY + 7 * DAY_MS, MONDAY + 14 * DAY_MS]
+    assert candles["open"].tolist() == [rows[0][1], rows[7][1], rows[14][1]]
+
+
+def seeded(make_crypto, kline_series, first_open_time, intervals=("5m", "1h")):
+    crypto = make_crypto("AAAUSDT")
+    rows = kline_series(7).rows(120)
+    for minute, row in enumerate(rows):
+        row[0] = first_open_time + minute * 60_000
+        row[6] = row[0] + 59_999
+    crypto.klines_1m.replace(rows)
+    aggregator = CandleAggregator(intervals=list(intervals))
+    aggregator.seed(crypto)
+    return crypto, aggregator
+
+
+@pytest.mark.parametrize("interval", ["5m", "1h"])
+def test_first_seed_drops_a_partial_first_bucket(make_crypto, kline_series, interval):
+    crypto, _ = seeded(make_crypto, kline_series, MONDAY + 3 * 60_000)
+    derived = crypto.klines_for(interval)
+    interval_ms = interval_to_ms(interval)
+    first_full = bucket_start(MONDAY + 3 * 60_000, interval_ms) + interval_ms
+    assert derived[0][0] == first_full
+    one_minute = crypto.klines_1m.view()
+    expected = aggregate_klines(one_minute[one_minute["open_time"] >= first_full], interval)
+    assert derived.view().tolist() == expected.tolist()
+
+
+def test_first_seed_keeps_a_full_first_bucket(make_crypto, kline_series):
+    crypto, _ = seeded(make_crypto, kline_series, MONDAY)
+    assert crypto.klines_for("5m")[0][0] == MONDAY
+    assert crypto.klines_for("5m").view().tolist() == aggregate_klines(crypto.klines_1m, "5m").tolist()
+
+
+def test_reseed_keeps_the_existing_candle_of_a_partial_bucket(make_crypto, kline_series):
+    crypto, aggregator = seeded(make_crypto, kline_series, MONDAY)
+    full_first_hour = crypto.klines_for("1h").record(0)
+    # The 1m window moves on: its first hour is now only partly covered.
+    for _ in range(30):
+        kline_series(8).close(crypto.klines_1m)
+    crypto.klines_1m.replace(crypto.klines_1m.view()[30:].copy())
+    aggregator.seed(crypto)
+
+    derived = crypto.klines_for("1h")
+    assert derived[0].tolist() == full_first_hour.tolist()
+    assert derived[1][0] == MONDAY + 3_600_000
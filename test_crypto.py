@@ -0,0 +1,20 @@
+from models.crypto import Crypto
+
+
+def test_unchanged_tick_keeps_the_stored_metrics(make_crypto):
+    crypto = make_crypto("AAAUSDT")
+    crypto.refresh_metrics()
+    crypto.serialize(profile="analytics")
+    hits = Crypto.cache_stats["serialize"]["hits"]
+
+    # The minute roll-over re-applies unchanged prices to every symbol.
+    crypto.klines_1m.update_last(float(crypto.klines_1m[-1][4]))
+    crypto.klines_cover.update_last(float(crypto.klines_cover[-1][4]))
+    crypto.refresh_metrics()
+    crypto.serialize(profile="analytics")
+    assert Crypto.cache_stats["serialize"]["hits"] == hits + 1
+
+    crypto.klines_1m.update_last(float(crypto.klines_1m[-1][4]) * 1.01)
+    crypto.refresh_metrics()
+    crypto.serialize(profile="analytics")
+    assert Crypto.cache_stats["serialize"]["hits"] == hits + 1
@@ -0,0 +1,28 @@
+import pytest
+
+from kline_buffer import KlineFollower
+
+
+def test_follower_without_hooks_cannot_be_created():
+    class Partial(KlineFollower):
+        def _reset(self):
+            pass
+
+        def _commit(self, candles):
+            pass
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_tick_at_the_close_leaves_the_version(kline_series):
+    klines = kline_series(0).buffer(10)
+    close = float(klines[-1][4])
+    version = klines.version
+    klines.update_last(close)
+    assert klines.version == version
+
+    klines.update_last(close * 1.01)
+    assert klines.version == version + 1
+    assert klines[-1][4] == close * 1.01
+    assert klines[-1][2] >= close * 1.01
@@ -0,0 +1,88 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from kline_fetcher import KlineFetcher
+
+TICK_BUILT = 5  # Candles at the end of each series without volume, built from ticks
+
+
+class FakeStore:
+    """KlineStore stand-in recording marked series and flushes."""
+
+    def __init__(self):
+        self.marked = []
+        self.flushes = 0
+
+    def load(self, symbol, interval):
+        return None
+
+    def mark(self, symbol, interval, klines):
+        self.marked.append((symbol, interval))
+
+    async def flush(self):
+        self.flushes += 1
+
+
+@pytest.fixture
+def fetcher(make_crypto, monkeypatch):
+    cryptos = {symbol: make_crypto(symbol, seed=2 * row) for row, symbol in enumerate(("GOODUSDT", "BADUSDT"))}
+    for crypto in cryptos.values():
+        crypto.klines_1m.view()["volume"][-TICK_BUILT:] = 0
+    fetcher = KlineFetcher(cryptos, intervals=["1m"], store=FakeStore())
+    requests = []
+    full_history = {}
+    for symbol, crypto in cryptos.items():
+        full_history[symbol] = crypto.klines_1m.view().copy()
+        full_history[symbol]["volume"] = 3.0
+
+    async def fetch_symbol_historical_data(symbol, interval, start_time=None, limit=500, end_time=None):
+        requests.append((symbol, start_time))
+        stored = cryptos[symbol].klines_1m
+        if start_time is None:
+            return full_history[symbol]
+        delta = stored.view()[-TICK_BUILT:].copy()
+        delta["volume"] = 2.0
+        if symbol == "BADUSDT":
+            delta["open_time"][1] += 30_000  # Off the stored candle grid
+        return delta
+
+    monkeypatch.setattr(fetcher, "fetch_symbol_historical_data", fetch_symbol_historical_data)
+    return fetcher, requests
+
+
+def test_misaligned_delta_falls_back_to_a_full_refetch(fetcher):
+    fetcher, requests = fetcher
+    good, bad = fetcher.cryptos["GOODUSDT"].klines_1m, fetcher.cryptos["BADUSDT"].klines_1m
+    delta_start = {symbol: int(crypto.klines_1m[-TICK_BUILT][0]) for symbol, crypto in fetcher.cryptos.items()}
+    bad_generation = bad.generation
+
+    asyncio.run(fetcher.save_historical_data_concurrently(show_progress=False))
+
+    assert [start for symbol, start in requests if symbol == "GOODUSDT"] == [delta_start["GOODUSDT"]]
+    assert [start for symbol, start in requests if symbol == "BADUSDT"] == [delta_start["BADUSDT"], None]
+    # The aligned delta was merged over the tick-built candles.
+    assert np.all(good.column("volume")[-TICK_BUILT:] == 2.0)
+    assert np.all(good.column("volume")[:-TICK_BUILT] == 1.0)
+    # The misaligned one was not; the series was replaced by the full history instead.
+    assert np.all(bad.column("volume") == 3.0)
+    assert bad.generation == bad_generation + 1
+    assert sorted(fetcher.store.marked) == [("BADUSDT", "1m"), ("GOODUSDT", "1m")]
+    assert fetcher.store.flushes == 1
+
+
+def test_failing_job_does_not_abort_the_batch(fetcher, monkeypatch):
+    fetcher, _ = fetcher
+    fetch_and_store = fetcher._fetch_and_store_klines
+
+    async def failing_for_bad(symbol, interval):
+        if symbol == "BADUSDT":
+            raise RuntimeError("unexpected failure")
+        await fetch_and_store(symbol, interval)
+
+    monkeypatch.setattr(fetcher, "_fetch_and_store_klines", failing_for_bad)
+    asyncio.run(fetcher.save_historical_data_concurrently(show_progress=False))
+
+    assert fetcher.store.marked == [("GOODUSDT", "1m")]
+    assert fetcher.store.flushes == 1
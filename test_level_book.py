@@ -0,0 +1,28 @@
+import pytest
+
+from app_config import AppConfig
+from level_book import LevelBook
+from technical_analysis import TechnicalAnalysis
+
+
+@pytest.mark.parametrize("timeframe, shift", [("1m", 1), (AppConfig.cover_kline_interval, 2)])
+def test_levels_match_find_support_resistance(kline_series, timeframe, shift):
+    series = kline_series(shift)
+    klines = series.buffer(80, capacity=100)
+    book = LevelBook(shift)
+    # Enough closes to roll the series past its capacity.
+    for _ in range(60):
+        for _ in range(5):
+            series.tick(klines)
+            assert book.sync(klines).levels() == TechnicalAnalysis.find_support_resistance(klines, timeframe)
+        series.close(klines)
+        assert book.sync(klines).levels() == TechnicalAnalysis.find_support_resistance(klines, timeframe)
+
+
+def test_replaced_series_is_rebuilt(kline_series):
+    series = kline_series(0)
+    klines = series.buffer(50)
+    book = LevelBook()
+    book.sync(klines).levels()
+    klines.replace(series.rows(40))
+    assert book.sync(klines).levels() == TechnicalAnalysis.find_support_resistance(klines, "1m")
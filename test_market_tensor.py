@@ -0,0 +1,47 @@
+import pytest
+
+from app_config import AppConfig
+from market_tensor import MarketTensor
+from products import Products
+
+SYMBOLS = ("AAAUSDT", "BBBUSDT", "CCCUSDT")
+
+
+@pytest.fixture
+def products(make_crypto):
+    """Products reduced to the cryptos and market tensors screen_universe reads."""
+    products = Products.__new__(Products)
+    products.cryptos = {symbol: make_crypto(symbol, seed=2 * row) for row, symbol in enumerate(SYMBOLS)}
+    products.market_tensors = {
+        interval: MarketTensor(interval) for interval in ("1m", AppConfig.cover_kline_interval)
+    }
+    return products
+
+
+def assert_screen_matches_metrics(products):
+    screen = products.screen_universe()
+    for symbol, crypto in products.cryptos.items():
+        metrics = crypto.refresh_metrics()
+        for name in ("volatility_factor_1m", "volatility_factor_cover", "is_uptrend_1m", "is_uptrend_cover"):
+            assert screen[symbol][name] == pytest.approx(getattr(metrics, name)), (symbol, name)
+
+
+def test_screen_follows_ticks_and_closes(products, kline_series):
+    series = kline_series(10)
+    assert_screen_matches_metrics(products)
+    for step in range(30):
+        for symbol in SYMBOLS[: step % len(SYMBOLS) + 1]:
+            series.tick(products.cryptos[symbol].klines_1m, sigma=0.01)
+            series.tick(products.cryptos[symbol].klines_cover, sigma=0.01)
+        assert_screen_matches_metrics(products)
+        if step % 10 == 9:
+            for crypto in products.cryptos.values():
+                series.close(crypto.klines_1m)
+            assert_screen_matches_metrics(products)
+
+
+def test_screen_follows_rest_refresh(products, kline_series):
+    assert_screen_matches_metrics(products)
+    crypto = products.cryptos[SYMBOLS[0]]
+    crypto.klines_1m.replace(kline_series(10).rows(AppConfig.KLINE_LIMIT, price=50.0))
+    assert_screen_matches_metrics(products)
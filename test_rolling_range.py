@@ -0,0 +1,41 @@
+import numpy as np
+
+from rolling_range import RollingRange
+
+
+def assert_range(klines, rolling):
+    rolling.sync(klines)
+    assert (rolling.high, rolling.low) == (klines.column("high").max(), klines.column("low").min())
+
+
+def test_range_follows_ticks_closes_and_capacity(kline_series):
+    series = kline_series(0)
+    klines = series.buffer(20, capacity=30)
+    rolling = RollingRange()
+    for _ in range(50):
+        for _ in range(3):
+            series.tick(klines, sigma=0.003)
+            assert_range(klines, rolling)
+        series.close(klines)
+        assert_range(klines, rolling)
+
+
+def test_range_replays_replaced_and_rewritten_series(kline_series):
+    series = kline_series(1)
+    klines = series.buffer(20, capacity=30)
+    rolling = RollingRange()
+    assert_range(klines, rolling)
+
+    # Many appends between two syncs, more than the series holds.
+    for _ in range(40):
+        series.close(klines)
+    assert_range(klines, rolling)
+
+    # A delta rewriting an older candle starts a new generation.
+    rewritten = klines.record(-5)
+    rewritten["high"], rewritten["low"] = 200.0, 10.0
+    klines.merge(np.array([rewritten]))
+    assert_range(klines, rolling)
+
+    klines.replace(series.rows(10, price=50.0))
+    assert_range(klines, rolling)
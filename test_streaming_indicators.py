@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+import ta
+
+from streaming_indicators import StreamingEMA, StreamingIndicators
+from technical_analysis import TechnicalAnalysis
+
+
+def approx(expected):
+    # After the buffer rolls, the streaming EMAs also carry the history that
+    # fell off the front; its weight after 200 candles is far below this.
+    return pytest.approx(expected, rel=1e-6, abs=1e-6, nan_ok=True)
+
+
+def assert_matches_ta(indicators, klines):
+    indicators.sync(klines)
+    for period in (5, 20):
+        assert indicators.ma(period) == approx(TechnicalAnalysis.calculate_ma(klines, period).iloc[-1])
+    assert indicators.rsi() == approx(TechnicalAnalysis.calculate_rsi(klines).iloc[-1])
+    macd = TechnicalAnalysis.calculate_macd(klines)
+    assert indicators.macd() == approx((macd["macd"].iloc[-1], macd["signal"].iloc[-1]))
+    assert indicators.previous_macd() == approx((macd["macd"].iloc[-2], macd["signal"].iloc[-2]))
+
+
+def test_indicators_match_ta_through_ticks_closes_and_rolls(kline_series):
+    series = kline_series(0)
+    klines = series.buffer(150, capacity=200)
+    indicators = StreamingIndicators()
+    # Enough closes to roll the buffer past its capacity.
+    for _ in range(100):
+        for _ in range(3):
+            series.tick(klines)
+            assert_matches_ta(indicators, klines)
+        series.close(klines)
+        assert_matches_ta(indicators, klines)
+
+
+def test_indicators_match_ta_while_warming_up(kline_series):
+    series = kline_series(1)
+    klines = series.buffer(2)
+    indicators = StreamingIndicators()
+    for _ in range(40):
+        series.tick(klines)
+        assert_matches_ta(indicators, klines)
+        series.close(klines)
+        assert_matches_ta(indicators, klines)
+
+
+def test_replaced_series_is_replayed(kline_series):
+    series = kline_series(2)
+    klines = series.buffer(100)
+    indicators = StreamingIndicators()
+    assert_matches_ta(indicators, klines)
+    klines.replace(series.rows(60, price=50.0))
+    assert_matches_ta(indicators, klines)
+
+
+@pytest.mark.parametrize("period", [5, 12, 26])
+def test_ema_matches_ta(kline_series, period):
+    closes = [row[4] for row in kline_series(period).rows(80)]
+    expected = ta.trend.EMAIndicator(pd.Series(closes), window=period).ema_indicator()
+    ema = StreamingEMA(period)
+    for index, close in enumerate(closes):
+        # The open value is applied without committing it.
+        assert ema.value(close) == approx(expected.iloc[index])
+        ema.push(close)
+        assert ema.committed == approx(expected.iloc[index])
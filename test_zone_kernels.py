@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from kline_buffer import KlineBuffer
+from models.zone import Zone
+from zone_kernels import ZoneKernels
+from zone_manager import ZoneManager
+
+ZONE_NAMES = ("immediate_demand_zone", "supply_zone_before_immediate_demand_zone")
+
+
+def assert_vectorized_matches_reference(rows):
+    klines = KlineBuffer.from_rows(rows, max(len(rows), 1))
+    reference = ZoneManager(klines, vectorized=False)
+    vectorized = ZoneManager(klines, vectorized=True)
+
+    # The reference lists every extension of a streak; its longest one is the run.
+    expected_runs = {}
+    for streak in reference.consecutive_green_solid_klines:
+        start = reference.klines.index(streak[0])
+        expected_runs[start] = max(expected_runs.get(start, 0), start + len(streak))
+    if vectorized.green_runs is not None:
+        assert expected_runs == dict(zip(*(ends.tolist() for ends in vectorized.green_runs)))
+
+    for name in ZONE_NAMES:
+        expected, actual = getattr(reference, name), getattr(vectorized, name)
+        assert (expected is None) == (actual is None), name
+        if expected is not None:
+            assert (expected.low, expected.high, expected.candles, expected.is_fresh) == (
+                actual.low,
+                actual.high,
+                actual.candles,
+                actual.is_fresh,
+            ), name
+    # The demand zone is stamped with the time of detection; the supply zone with its candle's.
+    supply = ZONE_NAMES[1]
+    if getattr(reference, supply) is not None:
+        assert getattr(reference, supply).creation_time == getattr(vectorized, supply).creation_time
+    assert reference.is_previous_structure_broken == vectorized.is_previous_structure_broken
+    return reference
+
+
+def assert_touched_matches_is_fresh(rows, lows, highs):
+    closes = np.array([row[4] for row in rows], dtype=np.float64)
+    fresh = [
+        Zone(zone_type="demand", low=low, high=high, creation_time=0, candles=[], klines=rows).is_fresh
+        for low, high in zip(lows, highs)
+    ]
+    assert (~ZoneKernels.touched(closes, np.asarray(lows), np.asarray(highs))).tolist() == fresh
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_series(kline_series, seed):
+    series = kline_series(seed, interval_ms=900_000)
+    rows = series.rows(int(series.rng.integers(20, 500)))
+    assert_vectorized_matches_reference(rows)
+
+    closes = [row[4] for row in rows]
+    lows = series.rng.uniform(min(closes), max(closes), 20)
+    assert_touched_matches_is_fresh(rows, lows, lows * 1.005)
+
+
+def test_random_series_find_zones(kline_series):
+    # Guard against fixtures that never exercise the zone search.
+    found = 0
+    for seed in range(30):
+        series = kline_series(seed, interval_ms=900_000)
+        rows = series.rows(int(series.rng.integers(20, 500)))
+        found += ZoneManager(rows, vectorized=False).immediate_demand_zone is not None
+    assert found >= 10
+
+
+@pytest.mark.parametrize("candles", range(0, 8))
+def test_short_series(kline_series, candles):
+    assert_vectorized_matches_reference(kline_series(candles, interval_ms=900_000).rows(candles))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_ties(kline_series, seed):
+    # Prices on a coarse grid make equal highs, lows and closes common, and
+    # zone bounds that sit exactly on a close.
+    series = kline_series(seed, interval_ms=900_000)
+    rows = series.rows(200)
+    for row in rows:
+        row[1:5] = [round(price * 2) / 2 for price in row[1:5]]
+    assert_vectorized_matches_reference(rows)
+
+    closes = sorted({row[4] for row in rows})
+    assert_touched_matches_is_fresh(rows, closes, closes)  # Zero-width zones on a close
+    assert_touched_matches_is_fresh(rows, [close + 0.25 for close in closes], [close + 0.5 for close in closes])
+
+
+def test_flat_candles(kline_series):
+    rows = kline_series(0, interval_ms=900_000).rows(50)
+    for row in rows:
+        row[1:5] = [100.0] * 4
+    reference = assert_vectorized_matches_reference(rows)
+    assert reference.immediate_demand_zone is None
+    assert_touched_matches_is_fresh(rows, [99.0, 100.0, 100.5], [99.5, 100.0, 101.0])
+
+
+def test_one_long_green_streak(kline_series):
+    rows = kline_series(0, interval_ms=900_000).rows(40)
+    price = rows[-1][4]
+    for row in rows[20:]:
+        row[1:5] = [price, price * 1.02, price, price * 1.02]
+        price *= 1.02
+    assert_vectorized_matches_reference(rows)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from zone_scanner import DEMAND, NEVER, SUPPLY, ZONE_DTYPE, ZoneScanner
+
+
+def brute_force(klines):
+    """Every pivot zone with its events, found by walking each zone over every later candle."""
+    open_times = klines["open_time"].tolist()
+    lows, highs, closes = klines["low"].tolist(), klines["high"].tolist(), klines["close"].tolist()
+    rows = []
+    for pivot in range(1, len(klines) - 1):
+        candidates = (
+            (DEMAND, lows[pivot - 1] > lows[pivot] < lows[pivot + 1], lows[pivot], lows[pivot] * 1.01),
+            (SUPPLY, highs[pivot - 1] < highs[pivot] > highs[pivot + 1], highs[pivot] * 0.99, highs[pivot]),
+        )
+        for zone_type, is_pivot, low, high in candidates:
+            if not is_pivot:
+                continue
+            touched = mitigated = broken = NEVER
+            # The candle after the pivot confirms the zone; it is watched from the one after.
+            for candle in range(pivot + 2, len(klines)):
+                time, close = open_times[candle], closes[candle]
+                if zone_type == DEMAND:
+                    wick_in, through, inside = lows[candle] <= high, close < low, close <= high
+                else:
+                    wick_in, through, inside = highs[candle] >= low, close > high, close >= low
+                if touched == NEVER and wick_in:
+                    touched = time
+                if broken == NEVER:
+                    if through:
+                        broken = time
+                    elif mitigated == NEVER and inside:
+                        mitigated = time
+            rows.append(
+                (zone_type, open_times[pivot], low, high, open_times[pivot + 1], touched, mitigated, broken)
+            )
+    return np.array(rows, dtype=ZONE_DTYPE)
+
+
+def assert_same_zones(klines):
+    zones = ZoneScanner.scan(klines)
+    expected = brute_force(klines)
+    assert zones.dtype == ZONE_DTYPE
+    assert zones.tolist() == expected.tolist()
+    return zones
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_scan_matches_brute_force(kline_series, seed):
+    series = kline_series(seed, interval_ms=900_000)
+    candles = int(series.rng.integers(3, 400))
+    assert_same_zones(series.buffer(candles, capacity=candles).view())
+
+
+@pytest.mark.parametrize("candles", range(0, 8))
+def test_short_series(kline_series, candles):
+    series = kline_series(candles)
+    klines = series.buffer(max(candles, 1), capacity=max(candles, 1)).view()[:candles]
+    assert_same_zones(klines)
+
+
+def test_zones_near_the_tail(kline_series):
+    series = kline_series(0)
+    klines = series.buffer(12, capacity=12).view().copy()
+    # A demand pivot on the candle before the last: confirmed by the last
+    # candle, so it is created but never watched.
+    klines["low"][-3], klines["low"][-2], klines["low"][-1] = 90.0, 80.0, 85.0
+    # A supply pivot two candles before the last: watched by the last candle only,
+    # which closes inside it.
+    klines["high"][-4], klines["high"][-3], klines["high"][-2] = 120.0, 130.0, 125.0
+    klines["close"][-1] = 129.0
+    klines["high"][-1] = max(klines["high"][-1], 129.0)
+    zones = assert_same_zones(klines)
+
+    tail_demand = zones[(zones["zone_type"] == DEMAND) & (zones["pivot_time"] == klines["open_time"][-2])]
+    assert len(tail_demand) == 1
+    assert tail_demand["created"][0] == klines["open_time"][-1]
+    assert (tail_demand[["touched", "mitigated", "broken"]].tolist()[0]) == (NEVER, NEVER, NEVER)
+
+    tail_supply = zones[(zones["zone_type"] == SUPPLY) & (zones["pivot_time"] == klines["open_time"][-3])]
+    assert tail_supply[["touched", "mitigated"]].tolist()[0] == (klines["open_time"][-1],) * 2
+
+
+def test_flat_candles_have_no_zones(kline_series):
+    klines = kline_series(0).buffer(30, capacity=30).view().copy()
+    for name in ("open", "high", "low", "close"):
+        klines[name] = 100.0
+    assert len(assert_same_zones(klines)) == 0
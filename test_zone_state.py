@@ -0,0 +1,45 @@
+from zone_manager import ZoneManager
+from zone_state import ZoneState
+
+ZONE_NAMES = ("immediate_demand_zone", "supply_zone_before_immediate_demand_zone")
+
+
+def assert_same_zones(klines, zones):
+    reference = ZoneManager(klines, vectorized=False)
+    for name in ZONE_NAMES:
+        expected, actual = getattr(reference, name), zones[name]
+        assert (expected is None) == (actual is None), name
+        if expected is not None:
+            assert (expected.low, expected.high, expected.candles, expected.is_fresh) == (
+                actual.low,
+                actual.high,
+                actual.to_dict(full=True)["candles"],
+                actual.is_fresh,
+            ), name
+
+
+def test_zones_match_zone_manager(kline_series):
+    series = kline_series(0, interval_ms=900_000)
+    found = 0
+    for _ in range(5):
+        klines = series.buffer(150, capacity=180)
+        state = ZoneState()
+        # Enough closes to roll the series past its capacity.
+        for _ in range(40):
+            for _ in range(3):
+                series.tick(klines)
+                zones = state.sync(klines).zones()
+                assert_same_zones(klines, zones)
+            found += zones["immediate_demand_zone"] is not None
+            series.close(klines)
+            assert_same_zones(klines, state.sync(klines).zones())
+    assert found  # The series must exercise actual zones
+
+
+def test_replaced_series_is_rebuilt(kline_series):
+    series = kline_series(1, interval_ms=900_000)
+    klines = series.buffer(120)
+    state = ZoneState()
+    state.sync(klines).zones()
+    klines.replace(series.rows(100))
+    assert_same_zones(klines, state.sync(klines).zones())
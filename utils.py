@@ -1,19 +1,19 @@
+import asyncio
+
+import aiohttp
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import pandas as pd
-import requests
 from loguru import logger
 
-BASE_URL = "https://api.binance.com"
+from http_client import BASE_URL, HttpClient
 
 
-def fetch_all_symbols(quote_asset="USDT", api_endpoint=BASE_URL):
+async def fetch_all_symbols(quote_asset="USDT", api_endpoint=BASE_URL):
     """Fetch all symbols from Binance with the specified quote asset."""
     try:
-        response = requests.get(f"{api_endpoint}/api/v3/exchangeInfo")
-        response.raise_for_status()
-        data = response.json()
+        data = await HttpClient.get_json(f"{api_endpoint}/api/v3/exchangeInfo", weight=20)
         
         symbols = [
             symbol["symbol"]
@@ -27,7 +27,7 @@ def fetch_all_symbols(quote_asset="USDT", api_endpoint=BASE_URL):
             logger.warning(f"No symbols found with {quote_asset} as the quote asset. Check rate limits or asset availability.")
         
         return symbols
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"Error fetching symbols: {e}")
         return []
 
@@ -45,13 +45,27 @@ def find_outliers_zscore(data, threshold=2):
   Returns:
     A NumPy array containing the outlier values.
   """
+  return data[outlier_mask_zscore(data, threshold)]
+
+
+def outlier_mask_zscore(data, threshold=2):
+  """
+  Flags outliers in a dataset using the Z-score method.
+
+  Args:
+    data: A NumPy array of data values.
+    threshold: The Z-score threshold beyond which a data point is 
+               considered an outlier. Defaults to 2.
+
+  Returns:
+    A boolean NumPy array, True where the value is an outlier.
+  """
   mean = np.mean(data)
   std = np.std(data)
   if std == 0:
     std = std + 1e-10
   z_scores = (data - mean) / std
-  outliers = data[np.abs(z_scores) > threshold]
-  return outliers
+  return np.abs(z_scores) > threshold
 
 
 def generate_candlestick_chart(klines, timeframe):
@@ -0,0 +1,104 @@
+import numpy as np
+
+
+class ZoneKernels:
+    """
+    NumPy versions of the ZoneManager scans, working on column arrays and
+    index ranges instead of lists of candles. ZoneManager keeps the original
+    loops as the reference implementation (see the equivalence check below).
+    """
+
+    @staticmethod
+    def green_solid_mask(opens, highs, lows, closes, wicks_ratio=4, min_percentage=1.0):
+        """
+        Candles that are green, have wicks of at most body / wicks_ratio on
+        both sides and rise at least `min_percentage` percent from the open.
+        """
+        body_size = np.abs(closes - opens)
+        upper_wick = highs - np.maximum(opens, closes)
+        lower_wick = np.minimum(opens, closes) - lows
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentage_increase = (closes - opens) / opens * 100
+        return (
+            (closes > opens)
+            & (upper_wick <= body_size / wicks_ratio)
+            & (lower_wick <= body_size / wicks_ratio)
+            & (percentage_increase >= min_percentage)
+        )
+
+    @staticmethod
+    def runs(mask, min_length=1):
+        """
+        Runs of True in `mask` at least `min_length` long.
+
+        Returns:
+            tuple: (starts, ends) index arrays, `ends` exclusive.
+        """
+        edges = np.diff(np.concatenate(([0], np.asarray(mask, dtype=np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = ends - starts >= min_length
+        return starts[keep], ends[keep]
+
+    @staticmethod
+    def last_above(highs, level, end=None):
+        """Index of the last candle before `end` whose high is above `level`, or None."""
+        above = np.flatnonzero(highs[:end] > level)
+        return int(above[-1]) if len(above) else None
+
+    @staticmethod
+    def touched(closes, lows, highs):
+        """
+        Whether any close lies inside each [low, high] range (the negation of
+        Zone.is_fresh), for scalar or array bounds.
+        """
+        closes = closes[:, np.newaxis]
+        inside = (np.atleast_1d(lows) <= closes) & (closes <= np.atleast_1d(highs))
+        result = inside.any(axis=0)
+        return bool(result[0]) if np.ndim(lows) == 0 else result
+
+    @staticmethod
+    def broken_above(closes, level):
+        """Whether any close broke above `level` (check_prior_structure_broken)."""
+        return bool((closes > level).any())
+
+
+if __name__ == "__main__":
+    import time
+
+    from kline_buffer import KlineBuffer
+    from zone_manager import ZoneManager
+
+    rng = np.random.default_rng(0)
+    series, candles = 300, 500
+
+    def fixture():
+        rows, price = [], 100.0
+        for i in range(candles):
+            close = price * (1 + rng.choice([rng.normal(0, 0.005), rng.uniform(0.01, 0.03)]))
+            wick = abs(close - price) * rng.uniform(0, 0.4)
+            rows.append([i * 900_000, price, max(price, close) + wick, min(price, close) - wick,
+                         close, 1.0, i * 900_000 + 899_999, 1.0, 1, 1.0, 1.0])
+            price = close
+        return rows
+
+    fixtures = [fixture() for _ in range(series)]
+    buffers = [KlineBuffer.from_rows(rows, capacity=candles) for rows in fixtures]
+    timings = {}
+    managers = {}
+    for name, vectorized in (("reference", False), ("vectorized", True)):
+        start = time.perf_counter()
+        managers[name] = [ZoneManager(buffer, vectorized=vectorized) for buffer in buffers]
+        timings[name] = time.perf_counter() - start
+    start = time.perf_counter()
+    for manager in managers["reference"]:
+        manager.find_consecutive_green_solid_klines(min_consecutive=3, wicks_ratio=4, min_percentage=1.0)
+    timings["reference streaks"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for manager in managers["vectorized"]:
+        ZoneKernels.runs(ZoneKernels.green_solid_mask(*manager.columns), min_length=3)
+    timings["kernel streaks"] = time.perf_counter() - start
+
+    print(f"{series} series x {candles} candles:")
+    for name, elapsed in timings.items():
+        print(f"{name:>18}: {elapsed * 1000:.0f} ms")
@@ -1,10 +1,24 @@
 from datetime import datetime
+
+import numpy as np
+
+from kline_buffer import KlineBuffer
 from models.zone import Zone
+from zone_kernels import ZoneKernels
 
 
 class ZoneManager:
-    def __init__(self, klines):
-        self.klines = klines
+    def __init__(self, klines, vectorized=True):
+        """
+        With `vectorized`, streaks, the supply search and the breakout check
+        run as ZoneKernels over column arrays; otherwise the original loops
+        below run, which are kept as the reference implementation.
+        """
+        # Zones keep copies of their candles, so work on plain lists.
+        self.klines = klines.tolist() if isinstance(klines, KlineBuffer) else klines
+        self.vectorized = vectorized
+        self.columns = self._columns(klines) if vectorized else None
+        self.green_runs = None  # (starts, ends) of the green solid streaks, vectorized only
         self.last_demand_zone = None
         self.last_supply_zone = None
         self.consecutive_green_solid_klines = []
@@ -64,6 +78,10 @@ class ZoneManager:
                 )
                 break
 
+        if self.vectorized:
+            self._initialize_zones_vectorized()
+            return
+
         # After initializing zones, find consecutive green solid Klines
         self.consecutive_green_solid_klines = self.find_consecutive_green_solid_klines(
             min_consecutive=3, wicks_ratio=4, min_percentage=1.0
@@ -87,6 +105,62 @@ class ZoneManager:
         if self.immediate_demand_zone:
             self.is_previous_structure_broken = self.check_prior_structure_broken()
 
+    @staticmethod
+    def _columns(klines):
+        """(open, high, low, close) arrays: views of a KlineBuffer, or built from lists."""
+        if isinstance(klines, KlineBuffer):
+            return tuple(klines.column(name) for name in ("open", "high", "low", "close"))
+        table = np.array([kline[1:5] for kline in klines], dtype=np.float64).reshape(-1, 4)
+        return tuple(table[:, column] for column in range(4))
+
+    def _initialize_zones_vectorized(self):
+        """The zone search of _initialize_zones on index ranges with ZoneKernels."""
+        opens, highs, lows, closes = self.columns
+        mask = ZoneKernels.green_solid_mask(opens, highs, lows, closes, wicks_ratio=4, min_percentage=1.0)
+        self.green_runs = ZoneKernels.runs(mask, min_length=3)
+
+        starts, _ = self.green_runs
+        if not len(starts):
+            return
+        self.immediate_demand_zone = self.locate_demand_zone_before(
+            int(starts[0]), base_candle_count=3, zone_buffer=0.01
+        )
+        if not self.immediate_demand_zone:
+            return
+
+        supply_index = ZoneKernels.last_above(highs, self.immediate_demand_zone.high)
+        if supply_index is not None:
+            kline = self.klines[supply_index]
+            self.supply_zone_before_immediate_demand_zone = Zone(
+                zone_type="supply",
+                low=kline[2] * 0.99,
+                high=kline[2],
+                creation_time=datetime.fromtimestamp(kline[0] / 1000),
+                candles=[kline],
+                klines=self.klines,
+            )
+            self.is_previous_structure_broken = ZoneKernels.broken_above(
+                closes, self.supply_zone_before_immediate_demand_zone.high
+            )
+
+    def locate_demand_zone_before(self, end_index, base_candle_count=3, zone_buffer=0.01):
+        """
+        locate_prior_demand_zone for a streak starting at `end_index`: the base
+        is the `base_candle_count` candles before it.
+        """
+        if end_index < base_candle_count:
+            return None  # Not enough candles to form a base
+        start_index = end_index - base_candle_count
+        base_low = float(self.columns[2][start_index:end_index].min())
+        return Zone(
+            zone_type="demand",
+            low=base_low,
+            high=base_low * (1 + zone_buffer),
+            creation_time=datetime.now(),
+            candles=self.klines[start_index:end_index],
+            klines=self.klines,
+        )
+
     def find_consecutive_green_solid_klines(
         self, min_consecutive=3, wicks_ratio=4, min_percentage=1.0
     ):
@@ -0,0 +1,206 @@
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from loguru import logger
+
+DEMAND, SUPPLY = 1, -1
+NEVER = -1  # Event time of an event that did not happen (yet)
+
+# One row per zone; event times are open times (ms) of the candle they happened in.
+ZONE_DTYPE = np.dtype(
+    [
+        ("zone_type", "i1"),  # DEMAND or SUPPLY
+        ("pivot_time", "i8"),  # Open time of the pivot candle
+        ("low", "f8"),
+        ("high", "f8"),
+        ("created", "i8"),  # The candle after the pivot, which confirms it
+        ("touched", "i8"),  # First wick into the zone
+        ("mitigated", "i8"),  # First close inside the zone (it is no longer fresh)
+        ("broken", "i8"),  # First close beyond the far side of the zone
+    ]
+)
+EVENTS = ("created", "touched", "mitigated", "broken")
+
+
+class ZoneScanner:
+    """
+    Every demand and supply zone of a kline series with its lifecycle, in
+    one pass.
+
+    Pivots follow ZoneManager: a candle whose low is below both neighbours'
+    lows starts a demand zone [low, low * 1.01], one whose high is above both
+    neighbours' highs a supply zone [high * 0.99, high]. Open zones wait in
+    heaps keyed by the price that triggers their next event, so each candle
+    only pops the zones it affects and each zone is pushed and popped a
+    constant number of times: O(candles log zones) for the whole history,
+    instead of rebuilding a ZoneManager per candle.
+    """
+
+    @staticmethod
+    def scan(klines):
+        """
+        Args:
+            klines: KLINE_DTYPE records (a KlineBuffer view or a KlineArchive
+                    load), sorted by open time.
+
+        Returns:
+            np.ndarray: ZONE_DTYPE rows in pivot order.
+        """
+        count = len(klines)
+        if count < 3:
+            return np.zeros(0, dtype=ZONE_DTYPE)
+        open_times = klines["open_time"]
+        lows, highs, closes = klines["low"], klines["high"], klines["close"]
+
+        demand_pivots = np.flatnonzero((lows[1:-1] < lows[:-2]) & (lows[1:-1] < lows[2:])) + 1
+        supply_pivots = np.flatnonzero((highs[1:-1] > highs[:-2]) & (highs[1:-1] > highs[2:])) + 1
+        zones = np.zeros(len(demand_pivots) + len(supply_pivots), dtype=ZONE_DTYPE)
+        pivots = np.concatenate([demand_pivots, supply_pivots])
+        order = np.argsort(pivots, kind="stable")
+        pivots = pivots[order]
+        is_demand = order < len(demand_pivots)
+        zones["zone_type"] = np.where(is_demand, DEMAND, SUPPLY)
+        zones["pivot_time"] = open_times[pivots]
+        zones["low"] = np.where(is_demand, lows[pivots], highs[pivots] * 0.99)
+        zones["high"] = np.where(is_demand, lows[pivots] * 1.01, highs[pivots])
+        zones["created"] = open_times[pivots + 1]
+        for event in EVENTS[1:]:
+            zones[event] = NEVER
+
+        ZoneScanner._run_lifecycle(
+            zones, pivots + 1, open_times.tolist(), lows.tolist(), highs.tolist(), closes.tolist()
+        )
+        return zones
+
+    @staticmethod
+    def _run_lifecycle(zones, created_at, open_times, lows, highs, closes):
+        """Fill the touched/mitigated/broken times of `zones` in one pass over the candles."""
+        zone_lows = zones["low"].tolist()
+        zone_highs = zones["high"].tolist()
+        demand = (zones["zone_type"] == DEMAND).tolist()
+        touched, mitigated, broken = {}, {}, {}
+
+        # Heaps of (trigger key, zone). Demand zones are touched by a low at or
+        # below their high and reached by a close at or below their high, then
+        # broken by a close below their low; supply zones mirror this.
+        demand_untouched, demand_unreached, demand_mitigated = [], [], []
+        supply_untouched, supply_unreached, supply_mitigated = [], [], []
+        next_zone = 0
+        zone_count = len(zones)
+
+        for candle in range(len(open_times)):
+            low, high, close = lows[candle], highs[candle], closes[candle]
+            time = open_times[candle]
+            while demand_untouched and -demand_untouched[0][0] >= low:
+                touched[heapq.heappop(demand_untouched)[1]] = time
+            while supply_untouched and supply_untouched[0][0] <= high:
+                touched[heapq.heappop(supply_untouched)[1]] = time
+
+            while demand_unreached and -demand_unreached[0][0] >= close:
+                zone = heapq.heappop(demand_unreached)[1]
+                if close >= zone_lows[zone]:
+                    mitigated[zone] = time
+                    heapq.heappush(demand_mitigated, (-zone_lows[zone], zone))
+                else:
+                    broken[zone] = time  # Closed straight through the zone
+            while demand_mitigated and -demand_mitigated[0][0] > close:
+                broken[heapq.heappop(demand_mitigated)[1]] = time
+
+            while supply_unreached and supply_unreached[0][0] <= close:
+                zone = heapq.heappop(supply_unreached)[1]
+                if close <= zone_highs[zone]:
+                    mitigated[zone] = time
+                    heapq.heappush(supply_mitigated, (zone_highs[zone], zone))
+                else:
+                    broken[zone] = time
+            while supply_mitigated and supply_mitigated[0][0] < close:
+                broken[heapq.heappop(supply_mitigated)[1]] = time
+
+            # Zones confirmed by this candle's close are watched from the next one.
+            while next_zone < zone_count and created_at[next_zone] == candle:
+                if demand[next_zone]:
+                    heapq.heappush(demand_untouched, (-zone_highs[next_zone], next_zone))
+                    heapq.heappush(demand_unreached, (-zone_highs[next_zone], next_zone))
+                else:
+                    heapq.heappush(supply_untouched, (zone_lows[next_zone], next_zone))
+                    heapq.heappush(supply_unreached, (zone_lows[next_zone], next_zone))
+                next_zone += 1
+
+        for event, times in (("touched", touched), ("mitigated", mitigated), ("broken", broken)):
+            if times:
+                zones[event][list(times)] = list(times.values())
+
+    @staticmethod
+    def events(zones):
+        """
+        Lifecycle events in time order.
+
+        Returns:
+            list: (time, zone index, event name) tuples.
+        """
+        events = [
+            (int(time), int(zone), event)
+            for event in EVENTS
+            for zone, time in enumerate(zones[event])
+            if time != NEVER
+        ]
+        # Within a candle: created, touched, mitigated, broken, then zone order.
+        return sorted(events, key=lambda item: (item[0], EVENTS.index(item[2])))
+
+    @staticmethod
+    def scan_archive(symbols, interval, start_time=None, end_time=None, workers=None, archive_dir=None):
+        """
+        Scan the KlineArchive history of many symbols in a process pool; each
+        worker loads its own symbol, so only the zone tables are pickled back.
+
+        Returns:
+            dict: {symbol: ZONE_DTYPE array}
+        """
+        jobs = [(symbol, interval, start_time, end_time, archive_dir) for symbol in symbols]
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for symbol, zones in zip(symbols, pool.map(_scan_archived_symbol, jobs, chunksize=4)):
+                if zones is not None:
+                    results[symbol] = zones
+        return results
+
+
+def _scan_archived_symbol(job):
+    """Process-pool worker for ZoneScanner.scan_archive (module level so it pickles)."""
+    from kline_backfill import KlineArchive
+
+    symbol, interval, start_time, end_time, archive_dir = job
+    try:
+        klines = KlineArchive(archive_dir).load(symbol, interval, start_time, end_time)
+        return ZoneScanner.scan(klines)
+    except Exception as e:
+        logger.error(f"Zone scan of {symbol} {interval} failed: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from app_config import AppConfig
+
+    parser = argparse.ArgumentParser(description="Scan archived klines for zones and their lifecycle.")
+    parser.add_argument("--symbols", nargs="+", required=True)
+    parser.add_argument("--interval", default=AppConfig.cover_kline_interval)
+    parser.add_argument("--days", type=int, default=90, help="Lookback from now, in days")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--directory", default=AppConfig.kline_archive_dir)
+    args = parser.parse_args()
+
+    end_time = int(time.time() * 1000)
+    start = time.perf_counter()
+    results = ZoneScanner.scan_archive(
+        args.symbols, args.interval, end_time - args.days * 86_400_000, end_time,
+        workers=args.workers, archive_dir=args.directory,
+    )
+    elapsed = time.perf_counter() - start
+    for symbol, zones in results.items():
+        counts = {event: int((zones[event] != NEVER).sum()) for event in EVENTS}
+        print(f"{symbol}: {counts}")
+    print(f"Scanned {len(results)} symbols in {elapsed:.2f}s")
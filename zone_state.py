@@ -0,0 +1,215 @@
+from collections import deque
+from datetime import datetime
+
+from kline_buffer import KlineFollower
+from models.zone import ZoneRange
+from zone_kernels import ZoneKernels
+
+# ZoneManager's detection parameters.
+MIN_CONSECUTIVE = 3  # Green solid candles in a streak
+WICKS_RATIO = 4  # Maximum body-to-wick ratio of a solid candle
+MIN_PERCENTAGE = 1.0  # Minimum open-to-close rise of a streak candle, in percent
+BASE_CANDLE_COUNT = 3  # Candles before the streak forming the demand base
+ZONE_BUFFER = 0.01  # Demand zone height above the base low
+
+
+class ZoneState(KlineFollower):
+    """
+    The immediate demand zone and the supply zone before it (the zones of
+    ZoneManager) for one kline series, kept across updates.
+
+    Each candle is classified as green-solid once, when it closes, and the
+    analysis of the closed candles (first streak, trailing run, supply and
+    freshness searches) is cached until the next close. Between closes only
+    the open candle is re-evaluated, and the ZoneRange objects are rebuilt
+    only when the outcome changes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._klines = None
+        self._flags = deque()  # (open_time, is green solid) of the closed candles
+        self._closed = None  # Analysis of the closed candles, see _analyze_closed
+        self._zones = None
+        self._zones_key = None
+
+    def _reset(self):
+        self._flags.clear()
+        self._closed = None
+
+    def _commit(self, candles):
+        for kline in candles:
+            self._flags.append((int(kline[0]), self.is_green_solid(kline)))
+        if len(candles):
+            self._closed = None
+
+    def _update(self, klines):
+        self._klines = klines
+        if len(klines):
+            while self._flags and self._flags[0][0] < klines[0][0]:
+                self._flags.popleft()
+
+    @staticmethod
+    def is_green_solid(kline):
+        """ZoneManager.find_consecutive_green_solid_klines' test for one candle."""
+        open_price, high_price, low_price, close_price = (
+            float(kline[1]), float(kline[2]), float(kline[3]), float(kline[4])
+        )
+        if open_price <= 0:
+            return False
+        body_size = abs(close_price - open_price)
+        upper_wick = high_price - max(open_price, close_price)
+        lower_wick = min(open_price, close_price) - low_price
+        percentage_increase = ((close_price - open_price) / open_price) * 100
+        return (
+            close_price > open_price
+            and upper_wick <= body_size / WICKS_RATIO
+            and lower_wick <= body_size / WICKS_RATIO
+            and percentage_increase >= MIN_PERCENTAGE
+        )
+
+    def zones(self):
+        """
+        Returns:
+            dict: {"immediate_demand_zone": ZoneRange or None,
+                   "supply_zone_before_immediate_demand_zone": ZoneRange or None}.
+                   The dict is shared until the zones change; do not mutate it.
+        """
+        klines = self._klines
+        if klines is None or not len(klines):
+            return self._build(None, None, None)
+        if self._closed is None:
+            self._closed = self._analyze_closed()
+        closed = self._closed
+        last = len(klines) - 1
+
+        # First streak: the first closed one, else a trailing run the open candle extends.
+        start = closed["streak_start"]
+        if start is None and closed["tail_run"] + 1 >= MIN_CONSECUTIVE and self.is_green_solid(klines[-1]):
+            start = last - closed["tail_run"]
+        if start is None or start < BASE_CANDLE_COUNT:
+            return self._build(None, None, None)
+
+        demand_low = float(klines.column("low")[start - BASE_CANDLE_COUNT : start].min())
+        demand_high = demand_low * (1 + ZONE_BUFFER)
+        open_high = float(klines[-1][2])
+        if open_high > demand_high:
+            supply_index = last
+        else:
+            supply_index = self._closed_search("last_above", demand_high)
+        supply = None
+        if supply_index is not None:
+            supply_high = open_high if supply_index == last else float(klines[supply_index][2])
+            supply = (supply_index, supply_high, self._is_fresh(supply_high * 0.99, supply_high))
+
+        demand = (start, demand_low, self._is_fresh(demand_low, demand_high))
+        key = (klines.generation, klines.appended, demand, supply)
+        return self._build(key, demand, supply)
+
+    def _analyze_closed(self):
+        """First streak start and trailing run length among the closed candles."""
+        streak_start = None
+        run = 0
+        for index, (_, is_green_solid) in enumerate(self._flags):
+            run = run + 1 if is_green_solid else 0
+            if streak_start is None and run >= MIN_CONSECUTIVE:
+                streak_start = index - run + 1
+        return {"streak_start": streak_start, "tail_run": run, "searches": {}}
+
+    def _closed_search(self, name, *args):
+        """Searches over the closed candles, cached until the next close."""
+        searches = self._closed["searches"]
+        key = (name, *args)
+        if key not in searches:
+            if name == "last_above":
+                searches[key] = ZoneKernels.last_above(self._klines.column("high"), args[0], end=-1)
+            else:  # "touched"
+                searches[key] = ZoneKernels.touched(self._klines.column("close")[:-1], *args)
+        return searches[key]
+
+    def _is_fresh(self, low, high):
+        """No close, including the open candle's, inside [low, high] (Zone.is_fresh)."""
+        open_close = float(self._klines[-1][4])
+        return not (low <= open_close <= high or self._closed_search("touched", low, high))
+
+    def _build(self, key, demand, supply):
+        """The zones dict for `key`, rebuilding the zones only when it changed."""
+        if self._zones is not None and key == self._zones_key:
+            return self._zones
+        zones = {"immediate_demand_zone": None, "supply_zone_before_immediate_demand_zone": None}
+        if demand is not None:
+            start, demand_low, demand_fresh = demand
+            zones["immediate_demand_zone"] = ZoneRange(
+                zone_type="demand",
+                low=demand_low,
+                high=demand_low * (1 + ZONE_BUFFER),
+                creation_time=datetime.now(),
+                start=start - BASE_CANDLE_COUNT,
+                end=start,
+                klines=self._klines,
+                is_fresh=demand_fresh,
+            )
+            if supply is not None:
+                supply_index, supply_high, supply_fresh = supply
+                zones["supply_zone_before_immediate_demand_zone"] = ZoneRange(
+                    zone_type="supply",
+                    low=supply_high * 0.99,
+                    high=supply_high,
+                    creation_time=datetime.fromtimestamp(int(self._klines[supply_index][0]) / 1000),
+                    start=supply_index,
+                    end=supply_index + 1,
+                    klines=self._klines,
+                    is_fresh=supply_fresh,
+                )
+        self._zones = zones
+        self._zones_key = key
+        return zones
+
+
+if __name__ == "__main__":
+    import time
+
+    import numpy as np
+
+    from kline_buffer import KlineBuffer
+    from zone_manager import ZoneManager
+
+    symbols, candles, closes, ticks = 100, 200, 30, 10
+    rng = np.random.default_rng(0)
+
+    def candle(open_time, open_price):
+        close = open_price * (1 + rng.choice([rng.normal(0, 0.005), rng.uniform(0.01, 0.03)]))
+        body_high, body_low = max(open_price, close), min(open_price, close)
+        high = body_high + abs(close - open_price) * rng.uniform(0, 0.3)
+        low = body_low - abs(close - open_price) * rng.uniform(0, 0.3)
+        return [open_time, open_price, high, low, close, 1.0, open_time + 899_999, 1.0, 1, 1.0, 1.0]
+
+    series = []
+    for _ in range(symbols):
+        rows, price = [], 100.0
+        for i in range(candles):
+            rows.append(candle(i * 900_000, price))
+            price = rows[-1][4]
+        series.append(KlineBuffer.from_rows(rows))
+    states = [ZoneState() for _ in series]
+
+    full_time = state_time = 0.0
+    for step in range(closes):
+        for tick in range(ticks):
+            for klines, state in zip(series, states):
+                klines.update_last(float(klines[-1][4]) * (1 + rng.normal(0, 0.002)))
+                start = time.perf_counter()
+                ZoneManager(klines)
+                full_time += time.perf_counter() - start
+                start = time.perf_counter()
+                state.sync(klines).zones()
+                state_time += time.perf_counter() - start
+        for klines in series:
+            last = klines.record(-1)
+            klines.append(candle(int(last["open_time"]) + 900_000, float(last["close"])))
+
+    scans = closes * ticks
+    print(
+        f"working-crypto scan of {symbols} symbols: ZoneManager {full_time / scans * 1000:.1f} ms, "
+        f"ZoneState {state_time / scans * 1000:.2f} ms (mean over {scans} scans)"
+    )